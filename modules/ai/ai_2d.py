@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import math
 import random
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 
 from loguru import logger
 
 from modules.data_2d import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
 from modules.geometry import snap_to_grid
+from modules.spatial_hash import SpatialHash2d
 from modules.unit_stats.unit_stats_2d import get_unit_cost, get_unit_size
 from modules.units.units_2d import (
     Barracks,
@@ -26,7 +29,7 @@ from modules.units.units_2d import (
     Turret,
     WarFactory,
 )
-from modules.world_2d import is_valid_building_position
+from modules.world_2d import get_building_search_radius, is_valid_building_position
 
 if TYPE_CHECKING:
     from collections.abc import Collection, Iterable, Sequence
@@ -41,40 +44,57 @@ BuildingType = type(
     Barracks | BlackMarket | Hangar | OilDerrick | PowerPlant | Refinery | ShaleFracker | Turret | WarFactory
 )
 MAX_BARRACKS_QUEUE_LENGTH = 5
+ASSESS_INTERVAL = 10
+"""Frames between reassessments of economy, military strength and threat level."""
+_BUILDING_TARGET_WEIGHTS: dict[type[Unit2d], float] = {
+    Headquarters: 1.0,
+    Barracks: 0.8,
+    WarFactory: 0.8,
+    Hangar: 0.8,
+    Refinery: 0.7,
+    PowerPlant: 0.6,
+    Turret: 0.5,
+    OilDerrick: 0.4,
+    ShaleFracker: 0.4,
+    BlackMarket: 0.4,
+}
+"""Strategic value of enemy building types, dividing their distance when choosing a target (default 1.0)."""
+_INFANTRY_TARGET_TYPES: frozenset[type[Unit2d]] = frozenset({Infantry, Grenadier})
+"""Unit types preferred as targets over other units, regardless of distance."""
 
 
 def _get_nearest_enemy_target(
-    *, enemy_buildings: Iterable[Unit2d], enemy_units: Iterable[Unit2d], from_pos: Point
+    *, live_enemy_buildings: Collection[Unit2d], live_enemy_units: Iterable[Unit2d], from_pos: Point
 ) -> Unit2d | None:
     """Prioritizes buildings over units for targeting.
 
-    :param enemy_buildings: List of enemy buildings.
-    :param enemy_units: List of enemy units.
+    :param live_enemy_buildings: List of live enemy buildings.
+    :param live_enemy_units: List of live enemy units.
     :param from_pos: Position to measure from.
     :return: Nearest target or None.
     """
     building_target = None
-    if enemy_buildings:
-        building_target = _get_nearest_enemy_building(enemy_buildings=enemy_buildings, from_pos=from_pos)
-
-    _live_enemy_units = [u for u in enemy_units if u.health > 0]
-    if _live_enemy_units:
-        unit_target = min(
-            (u for u in _live_enemy_units if isinstance(u, Infantry | Grenadier)),
-            key=lambda u: u.distance_to(from_pos),
-            default=None,
-        )
-        if not unit_target:
-            unit_target = min(
-                (u for u in _live_enemy_units),
-                key=lambda u: u.distance_to(from_pos),
-                default=None,
-            )
-    else:
-        unit_target = None
+    if live_enemy_buildings:
+        building_target = _get_nearest_enemy_building(live_enemy_buildings=live_enemy_buildings, from_pos=from_pos)
+
+    # Single scoring pass: nearest infantry-type unit, falling back to nearest unit of any type.
+    # Squared distances preserve the ordering, so no square roots are taken.
+    unit_target = None
+    infantry_target = None
+    unit_dist_sq = infantry_dist_sq = math.inf
+    for u in live_enemy_units:
+        dist_sq = u.distance_squared_to(from_pos)
+        if dist_sq < unit_dist_sq:
+            unit_target, unit_dist_sq = u, dist_sq
+
+        if dist_sq < infantry_dist_sq and type(u) in _INFANTRY_TARGET_TYPES:
+            infantry_target, infantry_dist_sq = u, dist_sq
+
+    if infantry_target:
+        unit_target, unit_dist_sq = infantry_target, infantry_dist_sq
 
     if building_target and unit_target:
-        if building_target.distance_to(from_pos) < unit_target.distance_to(from_pos):
+        if building_target.distance_squared_to(from_pos) < unit_dist_sq:
             return building_target
 
         return unit_target
@@ -88,35 +108,55 @@ def _get_nearest_enemy_target(
     return None
 
 
-def _get_nearest_enemy_building(*, enemy_buildings: Iterable[Unit2d], from_pos: Point) -> Unit2d | None:
+def _get_nearest_enemy_building(*, live_enemy_buildings: Collection[Unit2d], from_pos: Point) -> Unit2d | None:
     """Finds nearest enemy building, weighted by strategic value (HQ > factories > resources).
 
-    :param enemy_buildings: List of enemy buildings.
+    :param live_enemy_buildings: List of live enemy buildings.
     :param from_pos: Position to measure distance from.
     :return: Nearest building or None.
     """
-    if not enemy_buildings:
+    if not live_enemy_buildings:
         return None
 
-    building_weights = {
-        Headquarters: 1.0,
-        Barracks: 0.8,
-        WarFactory: 0.8,
-        Hangar: 0.8,
-        Refinery: 0.7,
-        PowerPlant: 0.6,
-        Turret: 0.5,
-        OilDerrick: 0.4,
-        ShaleFracker: 0.4,
-        BlackMarket: 0.4,
-    }
+    def weighted_dist_sq(b: BuildingType) -> float:
+        # Ranks the same as `dist / weight`, without a square root
+        weight = _BUILDING_TARGET_WEIGHTS.get(type(b), 1.0)
+        return b.distance_squared_to(from_pos) / (weight * weight)
+
+    return min(live_enemy_buildings, key=weighted_dist_sq, default=None)
+
 
-    def weighted_dist(b: BuildingType) -> float:
-        weight = building_weights.get(type(b), 1.0)
-        dist = b.distance_to(from_pos)
-        return dist / weight
+@cache
+def _get_production_priorities(*, high_threat: bool, economy_level: int) -> dict[str, float]:
+    """Normalized unit production weights. Depends only on two coarse inputs, so is computed once per combination.
 
-    return min((b for b in enemy_buildings if b.health > 0), key=weighted_dist, default=None)
+    :param high_threat: Whether the threat level is above 0.5.
+    :param economy_level: AI economy level (0-3).
+    :return: Unit type name to production weight.
+    """
+    inf_prio = 0.5 if high_threat else 0.6
+    gren_prio = 0.3 if high_threat else 0.2
+    tank_prio = 0.15 if economy_level >= 1 else 0.05
+    mgv_prio = 0.05 if economy_level >= 2 else 0.0
+    rocket_prio = 0.05 if economy_level >= 2 else 0.0
+    heli_prio = 0.1 if economy_level >= 2 else 0.0
+    total_prio = inf_prio + gren_prio + tank_prio + mgv_prio + rocket_prio + heli_prio
+    if total_prio > 0:
+        inf_prio /= total_prio
+        gren_prio /= total_prio
+        tank_prio /= total_prio
+        mgv_prio /= total_prio
+        rocket_prio /= total_prio
+        heli_prio /= total_prio
+
+    return {
+        "Infantry": inf_prio,
+        "Grenadier": gren_prio,
+        "Tank": tank_prio,
+        "MachineGunVehicle": mgv_prio,
+        "RocketArtillery": rocket_prio,
+        "AttackHelicopter": heli_prio,
+    }
 
 
 @dataclass(kw_only=True)
@@ -165,6 +205,7 @@ class Ai2d:
         enemy_units: Collection[Unit2d],
         enemy_buildings: Collection[Unit2d],
         all_buildings: Group[Unit2d],
+        target_hash: SpatialHash2d,
         map_width: int = MAP_WIDTH,
         map_height: int = MAP_HEIGHT,
     ) -> None:
@@ -175,23 +216,34 @@ class Ai2d:
         :param enemy_units: Enemy units.
         :param enemy_buildings: Enemy buildings.
         :param all_buildings: Global buildings.
+        :param target_hash: Spatial hash of live units and buildings, for proximity queries.
         :param map_width: Map width.
         :param map_height: Map height.
         """
-        self._assess_situation(
-            friendly_units=friendly_units, friendly_buildings=friendly_buildings, enemy_units=enemy_units
-        )
+        # Filter the enemies once here; the helpers below receive live targets only
+        live_enemy_units = [u for u in enemy_units if u.health > 0]
+        live_enemy_buildings = [b for b in enemy_buildings if b.health > 0]
+        # Situation changes slowly relative to the frame rate, so reassess periodically rather than every tick
+        if self.action_timer % ASSESS_INTERVAL == 0:
+            self._assess_situation(
+                friendly_units=friendly_units,
+                friendly_buildings=friendly_buildings,
+                live_enemy_units=live_enemy_units,
+                target_hash=target_hash,
+            )
+
         self.action_timer += 1
 
         # Apply offset and multiplier for desync
         effective_timer = (self.action_timer + self.timer_offset) * self.interval_multiplier
 
         # Production: Base 60, now varied (e.g., 42-78 frames)
-        _live_friendly_buildings = [b for b in friendly_buildings if b.health > 0]
         if int(effective_timer) % int(60 * self.interval_multiplier) == 0:
-            barracks_list = [b for b in _live_friendly_buildings if isinstance(b, Barracks)]
-            war_factory_list = [b for b in _live_friendly_buildings if isinstance(b, WarFactory)]
-            hangar_list = [b for b in _live_friendly_buildings if isinstance(b, Hangar)]
+            # The HQ keeps its buildings grouped by class, so no scan over all friendly buildings is needed
+            buildings_by_type = self.hq.buildings_by_type
+            barracks_list = [b for b in buildings_by_type[Barracks] if b.health > 0]
+            war_factory_list = [b for b in buildings_by_type[WarFactory] if b.health > 0]
+            hangar_list = [b for b in buildings_by_type[Hangar] if b.health > 0]
             self._queue_unit_production(
                 barracks_seq=barracks_list,
                 war_factory_seq=war_factory_list,
@@ -201,7 +253,7 @@ class Ai2d:
 
         # Building: Base 180, now varied (e.g., 126-234 frames)
         if int(effective_timer) % int(180 * self.interval_multiplier) == 0 and self.hq.credits >= 300:
-            _new_building_cls = self._decide_building_type(_live_friendly_buildings)
+            _new_building_cls = self._decide_building_type()
             _new_building_cls_str = _new_building_cls.__name__
             logger.info(f"{self.hq.team} decided to build a {_new_building_cls_str}...")
             if not self.hq.credits >= get_unit_cost(_new_building_cls_str):
@@ -237,12 +289,15 @@ class Ai2d:
             self.defense_timer = random.randint(0, defense_interval // 2)  # Reset with jitter
 
         enemy_hq = min(
-            (b for b in enemy_buildings if isinstance(b, Headquarters) and b.health > 0),
-            key=lambda b: self.hq.distance_to(b.position),
+            (b for b in live_enemy_buildings if isinstance(b, Headquarters)),
+            key=lambda b: self.hq.distance_squared_to(b.position),
             default=None,
         )
         self._strategize_attacks(
-            friendly_units=friendly_units, enemy_hq=enemy_hq, enemy_buildings=enemy_buildings, enemy_units=enemy_units
+            friendly_units=friendly_units,
+            enemy_hq=enemy_hq,
+            live_enemy_buildings=live_enemy_buildings,
+            live_enemy_units=live_enemy_units,
         )
 
     def _assess_situation(
@@ -250,60 +305,58 @@ class Ai2d:
         *,
         friendly_units: Iterable[Unit2d],
         friendly_buildings: Iterable[Unit2d],
-        enemy_units: Iterable[Unit2d],
+        live_enemy_units: Collection[Unit2d],
+        target_hash: SpatialHash2d,
     ) -> None:
         """Evaluates economy, military, threats to adjust priorities dynamically.
 
         :param friendly_units: List of friendly units.
         :param friendly_buildings: List of friendly buildings.
-        :param enemy_units: List of enemy units.
+        :param live_enemy_units: List of live enemy units.
+        :param target_hash: Spatial hash of live units and buildings.
         """
         _live_friendly_units = [u for u in friendly_units if u.health > 0]
-        _live_friendly_buildings = [b for b in friendly_buildings if b.health > 0]
-        _live_enemy_units = [u for u in enemy_units if u.health > 0]
         self.military_strength = len(_live_friendly_units)
-        self.enemy_strength = len(_live_enemy_units)
+        self.enemy_strength = len(live_enemy_units)
 
-        _nearby_enemies = [u for u in _live_enemy_units if u.distance_to(self.hq.position) < 600]
+        _nearby_enemies = [
+            u
+            for u in target_hash.query(self.hq.position, 600)
+            if not u.is_building and u.team not in self.allies and u.health > 0
+        ]
         self.threat_level = len(_nearby_enemies) / max(1, self.enemy_strength) if self.enemy_strength > 0 else 0
 
-        self.resource_buildings = [b for b in friendly_buildings if b.is_resource]
+        # One pass over the buildings, counting by type, instead of a comprehension per statistic
+        self.resource_buildings = []
+        self.live_building_counts: Counter[type[Unit2d]] = Counter()
+        _power_plants = 0
+        self.resource_count = 0
+        self.military_prod_count = 0
+        for b in friendly_buildings:
+            is_resource = b.is_resource
+            if is_resource:
+                self.resource_buildings.append(b)
+
+            if isinstance(b, PowerPlant):
+                _power_plants += 1
+
+            if b.health > 0:
+                self.live_building_counts[type(b)] += 1
+                self.resource_count += is_resource
+                self.military_prod_count += b.is_producer
+
         # TODO: counts dead buildings - is this intentional?
         self.economy_level = min(3, len(self.resource_buildings) // 2)
-        self.resource_count = len([b for b in _live_friendly_buildings if b.is_resource])
-        self.turret_count = len([b for b in _live_friendly_buildings if isinstance(b, Turret)])
-
-        self.military_prod_count = len([b for b in _live_friendly_buildings if b.is_producer])
-        _power_count = len([b for b in _live_friendly_buildings if isinstance(b, PowerPlant)])
+        self.turret_count = self.live_building_counts[Turret]
+        _power_count = self.live_building_counts[PowerPlant]
         self.total_buildings = sum((self.military_prod_count, self.resource_count, _power_count, self.turret_count))
 
-        _power_plants = len([b for b in friendly_buildings if isinstance(b, PowerPlant)])
         # TODO: counts dead buildings - is this intentional?
         self.power_shortage = _power_plants < self.economy_level + 1
 
-        inf_prio = 0.5 if self.threat_level > 0.5 else 0.6
-        gren_prio = 0.3 if self.threat_level > 0.5 else 0.2
-        tank_prio = 0.15 if self.economy_level >= 1 else 0.05
-        mgv_prio = 0.05 if self.economy_level >= 2 else 0.0
-        rocket_prio = 0.05 if self.economy_level >= 2 else 0.0
-        heli_prio = 0.1 if self.economy_level >= 2 else 0.0
-        total_prio = inf_prio + gren_prio + tank_prio + mgv_prio + rocket_prio + heli_prio
-        if total_prio > 0:
-            inf_prio /= total_prio
-            gren_prio /= total_prio
-            tank_prio /= total_prio
-            mgv_prio /= total_prio
-            rocket_prio /= total_prio
-            heli_prio /= total_prio
-
-        self.production_priorities = {
-            "Infantry": inf_prio,
-            "Grenadier": gren_prio,
-            "Tank": tank_prio,
-            "MachineGunVehicle": mgv_prio,
-            "RocketArtillery": rocket_prio,
-            "AttackHelicopter": heli_prio,
-        }
+        self.production_priorities = _get_production_priorities(
+            high_threat=self.threat_level > 0.5, economy_level=self.economy_level
+        )
 
     def _queue_unit_production(
         self,
@@ -372,7 +425,7 @@ class Ai2d:
                     self.hq.credits -= get_unit_cost(unit_type_str)
                     logger.info(f"{self.hq.team} hangar [{current_hangar_index}] added {unit_type_str}.")
 
-    def _decide_building_type(self, live_friendly_buildings: Iterable[Unit2d]) -> BuildingType:
+    def _decide_building_type(self) -> BuildingType:
         # Tweak building choice with personality
         if self.personality == "RUSHER" and self.resource_count == 0:  # Rush military over economy
             return Barracks
@@ -391,16 +444,16 @@ class Ai2d:
             return OilDerrick
 
         if self.resource_count < 2 and self.hq.credits >= get_unit_cost("Refinery"):
-            _has_refinery = any(isinstance(b, Refinery) for b in live_friendly_buildings)
+            _has_refinery = self.live_building_counts[Refinery] > 0
             return Refinery if not _has_refinery else random.choice([ShaleFracker, BlackMarket])
 
         if self.power_shortage and self.economy_level > 0 and self.hq.credits >= get_unit_cost("PowerPlant"):
             return PowerPlant
 
         if self.military_prod_count < max(1, self.resource_count // 2 + 1):
-            _has_barracks = any(isinstance(b, Barracks) for b in live_friendly_buildings)
-            _has_factory = any(isinstance(b, WarFactory) for b in live_friendly_buildings)
-            _has_hangar = any(isinstance(b, Hangar) for b in live_friendly_buildings)
+            _has_barracks = self.live_building_counts[Barracks] > 0
+            _has_factory = self.live_building_counts[WarFactory] > 0
+            _has_hangar = self.live_building_counts[Hangar] > 0
             if not _has_barracks:
                 return Barracks
 
@@ -474,13 +527,22 @@ class Ai2d:
         angle_jitter = (
             math.pi * self.build_jitter * (1.5 if self.personality == "RUSHER" else 1.0)
         )  # Rushers spread out more
+        # Loop invariants, hoisted out of the sampling loop below:
+        hq_x, hq_y = hq_pos
+        buildings = list(all_buildings)
+        # Bucketed once, so each sampled position is only checked against the buildings near it
+        search_radius = get_building_search_radius(new_building_cls=building_cls, buildings=buildings)
+        building_hash = SpatialHash2d(200)
+        for building in buildings:
+            building_hash.add(building)
+
         for ring_dist in range(int(dist_min), int(dist_max + 100), int(ring_step)):
             for _ in range(num_samples_per_ring):
                 angle_offset = random.uniform(-angle_jitter, angle_jitter) + random.uniform(-0.2, 0.2)
                 angle = bias_angle + angle_offset
                 dist = ring_dist + random.uniform(-ring_step / 2, ring_step / 2)
-                center_x = hq_pos.x + dist * math.cos(angle)
-                center_y = hq_pos.y + dist * math.sin(angle)
+                center_x = hq_x + dist * math.cos(angle)
+                center_y = hq_y + dist * math.sin(angle)
                 center_x = max(half_w, min(map_width - half_w, center_x))
                 center_y = max(half_h, min(map_height - half_h, center_y))
                 snapped_center = snap_to_grid(pos=(center_x, center_y), grid_size=TILE_SIZE)
@@ -489,7 +551,7 @@ class Ai2d:
                     position=position,
                     team=self.hq.team,
                     new_building_cls=building_cls,
-                    buildings=list(all_buildings),
+                    buildings=building_hash.query(position, search_radius),
                     map_width=map_width,
                     map_height=map_height,
                 ):
@@ -509,56 +571,59 @@ class Ai2d:
         *,
         friendly_units: Sequence[Unit2d],
         enemy_hq: Headquarters | None = None,
-        enemy_buildings: Iterable[Unit2d],
-        enemy_units: Iterable[Unit2d],
+        live_enemy_buildings: Collection[Unit2d],
+        live_enemy_units: Collection[Unit2d],
     ) -> None:
         """Periodic scouting and attack waves; aggressive push if superior.
 
         :param friendly_units: Friendly units.
         :param enemy_hq: Enemy HQ.
-        :param enemy_buildings: Enemy buildings.
-        :param enemy_units: Enemy units.
+        :param live_enemy_buildings: Live enemy buildings.
+        :param live_enemy_units: Live enemy units.
         """
-        _live_friendly_units = [u for u in friendly_units if u.health > 0]
-        if not enemy_hq and not enemy_buildings and not enemy_units:
+        if not enemy_hq and not live_enemy_buildings and not live_enemy_units:
             return
 
+        # Built once; each phase below only narrows it to the units it left idle
+        idle_units = [u for u in friendly_units if u.health > 0 and u.move_target is None]
+
         self.scout_timer += 1
         scout_interval = int(60 * self.interval_multiplier)  # Varied: 42-78 frames
         if self.scout_timer > scout_interval and len(friendly_units) > 1:
             scout_target = (0, 0)
             if enemy_hq:
                 scout_target = enemy_hq.position
-            elif enemy_buildings:
+            elif live_enemy_buildings:
                 _from_pos = friendly_units[0].position if friendly_units else (0, 0)
                 if _from_pos:
                     _nearest_enemy_building = _get_nearest_enemy_building(
-                        enemy_buildings=enemy_buildings, from_pos=_from_pos
+                        live_enemy_buildings=live_enemy_buildings, from_pos=_from_pos
                     )
                     if _nearest_enemy_building:
                         scout_target = _nearest_enemy_building.position
 
-            idle_units = [u for u in _live_friendly_units if u.move_target is None][:3]
-            for scout in idle_units:
+            for scout in idle_units[:3]:
                 scout.move_target = (
                     scout_target[0] + random.uniform(-200, 200),
                     scout_target[1] + random.uniform(-200, 200),
                 )
+
+            idle_units = idle_units[3:]
             self.scout_timer = random.randint(0, scout_interval // 2)  # Jitter reset
 
         self.attack_timer += 1
         attack_interval = int(30 * self.interval_multiplier)  # Varied: 21-39 frames
         attack_fraction = (0.3 if self.threat_level > 0.5 else 0.2) * self.aggression_bias  # Personality tweak
         if self.attack_timer > attack_interval:
-            idle_units = [u for u in _live_friendly_units if u.move_target is None]
-            # TODO: does this need to be recalculated here?
             if len(idle_units) > 0:
                 num_to_send = max(
                     1, int(len(idle_units) * attack_fraction * random.uniform(0.8, 1.2))
                 )  # Extra randomness
                 for unit in idle_units[:num_to_send]:
                     primary_target = _get_nearest_enemy_target(
-                        enemy_buildings=enemy_buildings, enemy_units=enemy_units, from_pos=unit.position
+                        live_enemy_buildings=live_enemy_buildings,
+                        live_enemy_units=live_enemy_units,
+                        from_pos=unit.position,
                     )
                     if primary_target:
                         unit.attack_target = primary_target
@@ -578,35 +643,36 @@ class Ai2d:
                     else:
                         unit.move_target = None
 
+                idle_units = [u for u in idle_units if u.move_target is None]
+
             self.attack_timer = random.randint(0, attack_interval // 2)
 
         # Aggressive push: Scale by personality
         push_threshold = 0.5 * self.aggression_bias
-        if self.military_strength > self.enemy_strength * push_threshold:
-            idle_units = [u for u in _live_friendly_units if u.move_target is None]
-            # TODO: does this need to be recalculated here?
-            if len(idle_units) > 3:
-                attack_fraction = (0.8 if self.threat_level > 0.5 else 0.5) * self.aggression_bias
-                num_to_send = int(len(idle_units) * attack_fraction)
-                for unit in idle_units[:num_to_send]:
-                    primary_target = _get_nearest_enemy_target(
-                        enemy_buildings=enemy_buildings, enemy_units=enemy_units, from_pos=unit.position
-                    )
-                    if primary_target:
-                        unit.attack_target = primary_target
-                        if primary_target.is_building:
-                            chase_pos = unit.get_chase_position_for_building(primary_target)
-                            unit.move_target = chase_pos if chase_pos is not None else None
-                        else:
-                            unit.move_target = primary_target.position
-
-                    elif enemy_hq:
-                        unit.attack_target = enemy_hq
-                        if enemy_hq.is_building:
-                            chase_pos = unit.get_chase_position_for_building(enemy_hq)
-                            unit.move_target = chase_pos if chase_pos is not None else None
-                        else:
-                            unit.move_target = enemy_hq.position
+        if self.military_strength > self.enemy_strength * push_threshold and len(idle_units) > 3:
+            attack_fraction = (0.8 if self.threat_level > 0.5 else 0.5) * self.aggression_bias
+            num_to_send = int(len(idle_units) * attack_fraction)
+            for unit in idle_units[:num_to_send]:
+                primary_target = _get_nearest_enemy_target(
+                    live_enemy_buildings=live_enemy_buildings,
+                    live_enemy_units=live_enemy_units,
+                    from_pos=unit.position,
+                )
+                if primary_target:
+                    unit.attack_target = primary_target
+                    if primary_target.is_building:
+                        chase_pos = unit.get_chase_position_for_building(primary_target)
+                        unit.move_target = chase_pos if chase_pos is not None else None
+                    else:
+                        unit.move_target = primary_target.position
 
+                elif enemy_hq:
+                    unit.attack_target = enemy_hq
+                    if enemy_hq.is_building:
+                        chase_pos = unit.get_chase_position_for_building(enemy_hq)
+                        unit.move_target = chase_pos if chase_pos is not None else None
                     else:
-                        unit.move_target = None
+                        unit.move_target = enemy_hq.position
+
+                else:
+                    unit.move_target = None
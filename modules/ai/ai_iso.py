@@ -11,6 +11,7 @@ from pygame.math import Vector2
 
 from modules.data_iso import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
 from modules.geometry import calculate_formation_positions_iso, snap_to_grid
+from modules.spatial_hash import SpatialHashIso
 from modules.unit_stats.unit_stats_iso import get_unit_cost, get_unit_size
 from modules.units.units_iso import (
     Barracks,
@@ -23,7 +24,7 @@ from modules.units.units_iso import (
     Turret,
     WarFactory,
 )
-from modules.world_iso import is_valid_building_position
+from modules.world_iso import get_building_search_radius, is_valid_building_position
 
 if TYPE_CHECKING:
     from collections.abc import Collection, Iterable, Sequence
@@ -37,6 +38,20 @@ if TYPE_CHECKING:
 BuildingType = type(Barracks | Hangar | PowerPlant | Refinery | Turret | WarFactory)
 
 
+_BUILDING_TARGET_WEIGHTS: dict[type[UnitIso], float] = {
+    Headquarters: 1.0,
+    Barracks: 0.8,
+    WarFactory: 0.8,
+    Hangar: 0.8,
+    Refinery: 0.7,
+    PowerPlant: 0.6,
+    Turret: 0.5,
+}
+"""Strategic value of enemy building types, dividing their distance when choosing a target (default 1.0)."""
+_INFANTRY_TARGET_TYPES: frozenset[type[UnitIso]] = frozenset({Infantry, Grenadier})
+"""Unit types preferred as targets over other units, regardless of distance."""
+
+
 def _get_nearest_enemy_target(
     *, enemy_buildings: Iterable[UnitIso], enemy_units: Iterable[UnitIso], from_pos: Point
 ) -> UnitIso | None:
@@ -45,23 +60,26 @@ def _get_nearest_enemy_target(
     else:
         building_target = None
 
-    if enemy_units:
-        unit_target = min(
-            (u for u in enemy_units if u.health > 0 and isinstance(u, Infantry | Grenadier)),
-            key=lambda u: u.distance_to(from_pos),
-            default=None,
-        )
-        if not unit_target:
-            unit_target = min(
-                (u for u in enemy_units if u.health > 0),
-                key=lambda u: u.distance_to(from_pos),
-                default=None,
-            )
-    else:
-        unit_target = None
+    # Single scoring pass: nearest infantry-type unit, falling back to nearest unit of any type
+    unit_target = None
+    infantry_target = None
+    unit_dist_sq = infantry_dist_sq = math.inf
+    for u in enemy_units:
+        if u.health <= 0:
+            continue
+
+        dist_sq = u.distance_squared_to(from_pos)
+        if dist_sq < unit_dist_sq:
+            unit_target, unit_dist_sq = u, dist_sq
+
+        if dist_sq < infantry_dist_sq and type(u) in _INFANTRY_TARGET_TYPES:
+            infantry_target, infantry_dist_sq = u, dist_sq
+
+    if infantry_target:
+        unit_target, unit_dist_sq = infantry_target, infantry_dist_sq
 
     if building_target and unit_target:
-        if building_target.distance_to(from_pos) < unit_target.distance_to(from_pos):
+        if building_target.distance_squared_to(from_pos) < unit_dist_sq:
             return building_target
 
         return unit_target
@@ -79,22 +97,12 @@ def _get_nearest_enemy_building(*, enemy_buildings: Iterable[UnitIso], from_pos:
     if not enemy_buildings:
         return None
 
-    building_weights = {
-        Headquarters: 1.0,
-        Barracks: 0.8,
-        WarFactory: 0.8,
-        Hangar: 0.8,
-        Refinery: 0.7,
-        PowerPlant: 0.6,
-        Turret: 0.5,
-    }
-
-    def weighted_dist(b: BuildingType) -> float:
-        weight = building_weights.get(type(b), 1.0)
-        dist = b.distance_to(from_pos)
-        return dist / weight
+    def weighted_dist_sq(b: BuildingType) -> float:
+        # Ranks the same as `dist / weight`, without a square root
+        weight = _BUILDING_TARGET_WEIGHTS.get(type(b), 1.0)
+        return b.distance_squared_to(from_pos) / (weight * weight)
 
-    return min((b for b in enemy_buildings if b.health > 0), key=weighted_dist, default=None)
+    return min((b for b in enemy_buildings if b.health > 0), key=weighted_dist_sq, default=None)
 
 
 @dataclass(kw_only=True)
@@ -205,7 +213,7 @@ class AiIso:
         if int(effective_timer) % 120 == 0:
             enemy_hq = min(
                 (b for b in enemy_buildings if isinstance(b, Headquarters) and b.health > 0),
-                key=lambda b: self.hq.distance_to(b.position),
+                key=lambda b: self.hq.distance_squared_to(b.position),
                 default=None,
             )
             enemy_pos = enemy_hq.position if enemy_hq else self.known_enemy_pos
@@ -284,7 +292,7 @@ class AiIso:
         self._build_defenses(all_buildings=all_buildings, map_width=map_width, map_height=map_height)
         enemy_hq = min(
             (b for b in enemy_buildings if isinstance(b, Headquarters) and b.health > 0),
-            key=lambda b: self.hq.distance_to(b.position),
+            key=lambda b: self.hq.distance_squared_to(b.position),
             default=None,
         )
         self._strategize_attacks(
@@ -311,7 +319,7 @@ class AiIso:
         self.military_strength = len(_live_friendly_units)
         self.enemy_strength = len(_live_enemy_units)
 
-        self.nearby_enemies = [u for u in _live_enemy_units if u.distance_to(self.hq.position) < 600]
+        self.nearby_enemies = [u for u in _live_enemy_units if u.distance_squared_to(self.hq.position) < 600 * 600]
         self.threat_level = len(self.nearby_enemies) / max(1, self.enemy_strength) if self.enemy_strength > 0 else 0
 
         _resource_buildings = [b for b in friendly_buildings if isinstance(b, Refinery)]
@@ -339,7 +347,7 @@ class AiIso:
         self.defense_target = max(2, int(self.total_buildings * 0.15 * self.expansion_factor))
         enemy_hq = min(
             (b for b in enemy_buildings if isinstance(b, Headquarters) and b.health > 0),
-            key=lambda b: self.hq.distance_to(b.position),
+            key=lambda b: self.hq.distance_squared_to(b.position),
             default=None,
         )
         if enemy_hq:
@@ -516,7 +524,7 @@ class AiIso:
         target = self.hq.position + dir_unit * advance
         target.x = max(0, min(target.x, map_width))
         target.y = max(0, min(target.y, map_height))
-        formation_type = "line" if self.personality == "defensive" else "v"
+        formation_type = "line" if self.personality == "DEFENSIVE" else "v"
         positions = calculate_formation_positions_iso(
             center=target, target=target, num_units=len(friendly_buildings), formation_type=formation_type
         )
@@ -580,7 +588,14 @@ class AiIso:
 
         ring_step = 25 * scale
         num_samples_per_ring = 25
-        angle_jitter = math.pi * self.build_jitter * (1.5 if self.personality == "rusher" else 1.0)
+        angle_jitter = math.pi * self.build_jitter * (1.5 if self.personality == "RUSHER" else 1.0)
+        # Bucketed once, so each sampled position is only checked against the buildings near it
+        buildings = list(all_buildings)
+        search_radius = get_building_search_radius(new_building_cls=building_cls, buildings=buildings)
+        building_hash = SpatialHashIso()
+        for building in buildings:
+            building_hash.add(building)
+
         for ring_dist in range(int(dist_min), int(dist_max + 100), int(ring_step)):
             for _ in range(num_samples_per_ring):
                 angle_offset = random.uniform(-angle_jitter, angle_jitter) + random.uniform(-0.2, 0.2)
@@ -596,10 +611,9 @@ class AiIso:
                     position=position,
                     team=self.hq.team,
                     new_building_cls=building_cls,
-                    buildings=list(all_buildings),
+                    buildings=building_hash.query(position, search_radius),
                     map_width=map_width,
                     map_height=map_height,
-                    margin=60,
                 ):
                     return position
 
@@ -635,12 +649,12 @@ class AiIso:
             and self.nearby_enemies
         ):
             hq_pos = self.hq.position
-            nearby_friends = [u for u in friendly_units if u.health > 0 and u.distance_to(hq_pos) < 800]
+            nearby_friends = [u for u in friendly_units if u.health > 0 and u.distance_squared_to(hq_pos) < 800 * 800]
             if nearby_friends:
                 for friend in nearby_friends:
                     should_interrupt = (friend.move_target is None) or (random.random() < interrupt_prob)
                     if should_interrupt:
-                        nearest_threat = min(self.nearby_enemies, key=lambda e: friend.distance_to(e.position))
+                        nearest_threat = min(self.nearby_enemies, key=lambda e: friend.distance_squared_to(e.position))
                         friend.attack_target = nearest_threat
                         friend.move_target = nearest_threat.position
 
@@ -725,7 +739,7 @@ class AiIso:
             idle_in_base = [
                 u
                 for u in friendly_units
-                if u.health > 0 and u.move_target is None and u.distance_to(self.hq.position) < 300
+                if u.health > 0 and u.move_target is None and u.distance_squared_to(self.hq.position) < 300 * 300
             ]
             if idle_in_base:
                 num_patrol = min(8, len(idle_in_base))
@@ -790,7 +804,7 @@ class AiIso:
         target_center = primary_target.position if not hasattr(primary_target, "rect") else primary_target.rect.center
         total_pos = Vector2(0, 0)
         for u in friendly_units[:num_to_send]:
-            total_pos += Vector2(u.position)
+            total_pos += u.position
 
         avg_pos = total_pos / num_to_send
         formation_type = "v" if self.personality in ["AGGRESSIVE", "RUSHER"] else "line"
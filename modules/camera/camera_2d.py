@@ -5,13 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, override
 
 import pygame as pg
+from pygame.math import Vector2
 
 from modules.data_2d import PAN_EDGE, PAN_SPEED, SCREEN_HEIGHT, SCREEN_WIDTH
 
 from .camera_generic import _CameraGeneric
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from pygame.typing import Point
 
@@ -87,6 +88,16 @@ class Camera2d(_CameraGeneric):
         dy = world_pos[1] - self.rect.y
         return dx * self.zoom, dy * self.zoom
 
+    def world_to_screen_many(self, world_positions: Iterable[Point]) -> list[tuple[float, float]]:
+        """Converts several world positions at once, reading the camera offset and zoom only once.
+
+        :param world_positions: Positions in world space.
+        :return: List of (x, y) tuples in screen space.
+        """
+        cam_x, cam_y = self.rect.topleft
+        zoom = self.zoom
+        return [((x - cam_x) * zoom, (y - cam_y) * zoom) for x, y in world_positions]
+
     @override
     def update(
         self,
@@ -133,10 +144,12 @@ class Camera2d(_CameraGeneric):
             return
 
         if selected_units and not pressed_pan:
-            avg_x = sum(u.position[0] for u in selected_units) / len(selected_units)
-            avg_y = sum(u.position[1] for u in selected_units) / len(selected_units)
-            self.rect.centerx = avg_x
-            self.rect.centery = avg_y
+            # In-place Vector2 accumulation keeps the per-unit work in C
+            total = Vector2()
+            for u in selected_units:
+                total += u.position
+
+            self.rect.center = total / len(selected_units)
 
         self.clamp()
 
@@ -29,10 +29,13 @@ class _CameraGeneric(ABC):
     height: int
     zoom: float = field(init=False, default=1.0)
     rect: pg.Rect = field(init=False)
+    screen_rect: pg.Rect = field(init=False)
+    """The camera's screen area, (0, 0, width, height), for on-screen tests without building a Rect per call."""
 
     def __post_init__(self) -> None:
         """Initializes camera with default map and screen dimensions."""
         self.rect = pg.Rect(0, 0, self.width, self.height)
+        self.screen_rect = pg.Rect(0, 0, self.width, self.height)
         self.update_view_size()
 
     def update_view_size(self) -> None:
@@ -6,6 +6,7 @@ from dataclasses import field
 from typing import TYPE_CHECKING, override
 
 import pygame as pg
+from pygame.math import Vector2
 
 from modules.camera.camera_generic import _CameraGeneric
 from modules.data_iso import (
@@ -35,16 +36,13 @@ class CameraIso(_CameraGeneric):
 
     @override
     def get_screen_rect(self, world_rect: pg.Rect) -> pg.Rect:
-        corners = [
-            (world_rect.left, world_rect.top),
-            (world_rect.right, world_rect.top),
-            (world_rect.right, world_rect.bottom),
-            (world_rect.left, world_rect.bottom),
-        ]
-        iso_corners = [self.world_to_iso(corner, self.zoom) for corner in corners]
-        xs = [p[0] for p in iso_corners]
-        ys = [p[1] for p in iso_corners]
-        return pg.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+        # Each bound of the iso projection comes from one known corner, so no corner list is needed:
+        left, right = world_rect.left - self.rect.x, world_rect.right - self.rect.x
+        top, bottom = world_rect.top - self.rect.y, world_rect.bottom - self.rect.y
+        half_zoom, quarter_zoom = self.zoom / 2, self.zoom / 4
+        min_x, max_x = (left - bottom) * half_zoom, (right - top) * half_zoom
+        min_y, max_y = (left + top) * quarter_zoom, (right + bottom) * quarter_zoom
+        return pg.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
 
     def world_to_iso(self, world_pos: Point, zoom: float) -> tuple[float, float]:
         dx = world_pos[0] - self.rect.x
@@ -98,9 +96,12 @@ class CameraIso(_CameraGeneric):
             return
 
         if selected_units and not pressed_pan:
-            avg_x = sum(u.position[0] for u in selected_units) / len(selected_units)
-            avg_y = sum(u.position[1] for u in selected_units) / len(selected_units)
-            target_point = (avg_x, avg_y)
+            # Single pass, with in-place Vector2 accumulation keeping the per-unit work in C
+            total = Vector2()
+            for u in selected_units:
+                total += u.position
+
+            target_point = total / len(selected_units)
             self.target_rect.x = target_point[0] - (self.width / 0.1)
             self.target_rect.y = target_point[1] - (self.height / 0.1)
             self.snap_to_point(target_point)
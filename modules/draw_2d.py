@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 import math
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING
 
 import pygame as pg
-from pygame.math import Vector2
 
 from modules.data_2d import MINI_MAP_HEIGHT, MINI_MAP_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
+from modules.particle import draw_particles_2d
 from modules.team import team_to_color
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
-    from pygame.typing import ColorLike, Point
+    from pygame.typing import Point
 
     from modules.camera import Camera2d
     from modules.fog_of_war import FogOfWar2d
@@ -22,7 +23,8 @@ if TYPE_CHECKING:
     from modules.units import Unit2d
 
 
-def _create_infantry_image(size: Point, team_color: ColorLike) -> pg.Surface:
+@cache
+def _create_infantry_image(size: Point, team: Team) -> pg.Surface:
     """Creates a simple pixel-art style image for an Infantry unit.
 
     Draws head, eyes, helmet, body, arms, legs, and weapon using basic shapes.
@@ -31,6 +33,7 @@ def _create_infantry_image(size: Point, team_color: ColorLike) -> pg.Surface:
     :param team: The team enum for color selection.
     :return: A Pygame Surface with the drawn infantry image.
     """
+    team_color = team_to_color[team]
     image = pg.Surface(size, pg.SRCALPHA)
     pg.draw.circle(image, (150, 150, 150), (8, 4), 4)  # Head
     pg.draw.circle(image, (0, 0, 0), (7, 3), 1)  # Left eye
@@ -46,7 +49,8 @@ def _create_infantry_image(size: Point, team_color: ColorLike) -> pg.Surface:
     return image
 
 
-def _create_grenadier_image(size: Point, team_color: ColorLike) -> pg.Surface:
+@cache
+def _create_grenadier_image(size: Point, team: Team) -> pg.Surface:
     """Creates a simple pixel-art style image for a Grenadier unit.
 
     Similar to Infantry but with grenade launcher details.
@@ -55,6 +59,7 @@ def _create_grenadier_image(size: Point, team_color: ColorLike) -> pg.Surface:
     :param team: The team enum for color selection.
     :return: A Pygame Surface with the drawn grenadier image.
     """
+    team_color = team_to_color[team]
     image = pg.Surface(size, pg.SRCALPHA)
     pg.draw.circle(image, (150, 150, 150), (8, 4), 4)  # Head
     pg.draw.circle(image, (0, 0, 0), (7, 3), 1)  # Left eye
@@ -71,8 +76,9 @@ def _create_grenadier_image(size: Point, team_color: ColorLike) -> pg.Surface:
     return image
 
 
+@cache
 def _create_tank_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surface]:
-    """Creates separate surfaces for tank body, turret, and barrel for modular rotation.
+    """Creates separate surfaces for tank body, turret, and barrel for modular rotation. Shared by all tanks of a team.
 
     :param team: The team enum for color selection.
     :return: Tuple of (body_surf, turret_surf, barrel_surf) Pygame Surfaces.
@@ -93,58 +99,34 @@ def _create_tank_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surfac
     return body_surf, turret_surf, barrel_surf
 
 
-def _draw_tank(
-    obj,  # pyrefly: ignore [implicit-any-parameter]
-    surface: pg.Surface,
-    camera: Camera2d,
-    mouse_pos: Point | None = None,
-) -> None:
-    """Custom draw method for Tank: scales, rotates, and blits body, turret, and barrel independently.
-    Handles selection circle and health bar.
+PART_ANGLE_STEP = 5
+"""Parts and units are drawn rotated to the nearest multiple of this many degrees, so rotations can be cached."""
 
-    :param obj: The Tank instance.
-    :param surface: The Pygame surface to draw on.
-    :param camera: The Camera2d instance for world-to-screen transformation.
-    :param mouse_pos: Optional mouse position for hover effects.
+
+def get_part_degrees(angle: float) -> int:
+    """Converts a unit angle to the cached rotation nearest to it.
+
+    :param angle: Clockwise angle in radians.
+    :return: Counterclockwise rotation in degrees, a multiple of `PART_ANGLE_STEP` in 0..359.
     """
-    if obj.health <= 0:
-        return
-    screen_pos = camera.world_to_screen(obj.position)
-    zoom = camera.zoom
-    body_scaled = pg.transform.smoothscale(obj.body_surf, (int(30 * zoom), int(20 * zoom)))
-    rotated_body = pg.transform.rotate(body_scaled, -math.degrees(obj.body_angle))
-    body_rect = rotated_body.get_rect(center=screen_pos)
-    surface.blit(rotated_body, body_rect.topleft)
-    turret_scaled = pg.transform.smoothscale(obj.turret_surf, (int(12 * zoom), int(12 * zoom)))
-    rotated_turret = pg.transform.rotate(turret_scaled, -math.degrees(obj.turret_angle))
-    turret_rect = rotated_turret.get_rect()
-    offset_rot = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
-    turret_center = Vector2(body_rect.center) + offset_rot
-    turret_rect.center = turret_center
-    surface.blit(rotated_turret, turret_rect.topleft)
-    barrel_scaled = pg.transform.smoothscale(obj.barrel_surf, (int(20 * zoom), int(6 * zoom)))
-    rotated_barrel = pg.transform.rotate(barrel_scaled, -math.degrees(obj.turret_angle))
-    barrel_rect = rotated_barrel.get_rect()
-    barrel_offset_rot = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
-    barrel_center = Vector2(turret_center) + barrel_offset_rot
-    barrel_rect.center = barrel_center
-    surface.blit(rotated_barrel, barrel_rect.topleft)
-    if obj.selected:
-        radius = 15 * zoom + 3
-        pg.draw.circle(
-            surface,
-            (255, 255, 0),
-            (int(screen_pos[0]), int(screen_pos[1])),
-            int(radius),
-            int(2 * zoom),
-        )
-    obj.draw_health_bar_if_needed(surface=surface, camera=camera, mouse_pos=mouse_pos)
-    for particle in obj.plasma_burn_particles:
-        particle.draw_2d(surface, camera)
+    return round(-math.degrees(angle) / PART_ANGLE_STEP) * PART_ANGLE_STEP % 360
+
 
+@lru_cache(maxsize=4096)
+def get_rotated_part(surf: pg.Surface, size: tuple[int, int], degrees: int) -> pg.Surface:
+    """Scales and rotates a shared part or unit surface, caching the result.
 
+    :param surf: Surface, shared per team.
+    :param size: Scaled size.
+    :param degrees: Counterclockwise rotation in degrees.
+    :return: Scaled, rotated surface; must not be modified by callers.
+    """
+    return pg.transform.rotate(pg.transform.smoothscale(surf, size), degrees)
+
+
+@cache
 def _create_machinegunvehicle_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surface]:
-    """Creates surfaces for MachineGunVehicle: body with wheels, turret, and MG barrel.
+    """Creates surfaces for MachineGunVehicle: body with wheels, turret, and MG barrel. Shared per team.
 
     :param team: The team enum for color selection.
     :return: Tuple of (body_surf, turret_surf, barrel_surf) Pygame Surfaces.
@@ -167,57 +149,9 @@ def _create_machinegunvehicle_surfaces(team: Team) -> tuple[pg.Surface, pg.Surfa
     return body_surf, turret_surf, barrel_surf
 
 
-def _draw_machinegunvehicle(
-    obj,  # pyrefly: ignore [implicit-any-parameter]
-    surface: pg.Surface,
-    camera: Camera2d,
-    mouse_pos: Point | None = None,
-) -> None:
-    """Custom draw for MachineGunVehicle, similar to Tank.
-
-    :param obj: The MachineGunVehicle instance.
-    :param surface: The Pygame surface to draw on.
-    :param camera: The Camera2d instance for world-to-screen transformation.
-    :param mouse_pos: Optional mouse position for hover effects.
-    """
-    if obj.health <= 0:
-        return
-    screen_pos = camera.world_to_screen(obj.position)
-    zoom = camera.zoom
-    body_scaled = pg.transform.smoothscale(obj.body_surf, (int(35 * zoom), int(25 * zoom)))
-    rotated_body = pg.transform.rotate(body_scaled, -math.degrees(obj.body_angle))
-    body_rect = rotated_body.get_rect(center=screen_pos)
-    surface.blit(rotated_body, body_rect.topleft)
-    turret_scaled = pg.transform.smoothscale(obj.turret_surf, (int(8 * zoom), int(8 * zoom)))
-    rotated_turret = pg.transform.rotate(turret_scaled, -math.degrees(obj.turret_angle))
-    turret_rect = rotated_turret.get_rect()
-    offset_rot = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
-    turret_center = Vector2(body_rect.center) + offset_rot
-    turret_rect.center = turret_center
-    surface.blit(rotated_turret, turret_rect.topleft)
-    barrel_scaled = pg.transform.smoothscale(obj.barrel_surf, (int(25 * zoom), int(2 * zoom)))
-    rotated_barrel = pg.transform.rotate(barrel_scaled, -math.degrees(obj.turret_angle))
-    barrel_rect = rotated_barrel.get_rect()
-    barrel_offset_rot = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
-    barrel_center = Vector2(turret_center) + barrel_offset_rot
-    barrel_rect.center = barrel_center
-    surface.blit(rotated_barrel, barrel_rect.topleft)
-    if obj.selected:
-        radius = 17.5 * zoom + 3
-        pg.draw.circle(
-            surface,
-            (255, 255, 0),
-            (int(screen_pos[0]), int(screen_pos[1])),
-            int(radius),
-            int(2 * zoom),
-        )
-    obj.draw_health_bar_if_needed(surface=surface, camera=camera, mouse_pos=mouse_pos)
-    for particle in obj.plasma_burn_particles:
-        particle.draw_2d(surface, camera)
-
-
+@cache
 def _create_rocketartillery_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surface]:
-    """Surfaces for RocketArtillery: body with tracks, rectangular turret, triple rocket barrels.
+    """Surfaces for RocketArtillery: body with tracks, rectangular turret, triple rocket barrels. Shared per team.
 
     :param team: The team enum for color selection.
     :return: Tuple of (body_surf, turret_surf, barrel_surf) Pygame Surfaces.
@@ -238,57 +172,9 @@ def _create_rocketartillery_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface
     return body_surf, turret_surf, barrel_surf
 
 
-def _draw_rocketartillery(
-    obj,  # pyrefly: ignore [implicit-any-parameter]
-    surface: pg.Surface,
-    camera: Camera2d,
-    mouse_pos: Point | None = None,
-) -> None:
-    """Custom draw for RocketArtillery, analogous to previous vehicle draws.
-
-    :param obj: The RocketArtillery instance.
-    :param surface: The Pygame surface to draw on.
-    :param camera: The Camera2d instance for world-to-screen transformation.
-    :param mouse_pos: Optional mouse position for hover effects.
-    """
-    if obj.health <= 0:
-        return
-    screen_pos = camera.world_to_screen(obj.position)
-    zoom = camera.zoom
-    body_scaled = pg.transform.smoothscale(obj.body_surf, (int(40 * zoom), int(25 * zoom)))
-    rotated_body = pg.transform.rotate(body_scaled, -math.degrees(obj.body_angle))
-    body_rect = rotated_body.get_rect(center=screen_pos)
-    surface.blit(rotated_body, body_rect.topleft)
-    turret_scaled = pg.transform.smoothscale(obj.turret_surf, (int(12 * zoom), int(12 * zoom)))
-    rotated_turret = pg.transform.rotate(turret_scaled, -math.degrees(obj.turret_angle))
-    turret_rect = rotated_turret.get_rect()
-    offset_rot = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
-    turret_center = Vector2(body_rect.center) + offset_rot
-    turret_rect.center = turret_center
-    surface.blit(rotated_turret, turret_rect.topleft)
-    barrel_scaled = pg.transform.smoothscale(obj.barrel_surf, (int(30 * zoom), int(8 * zoom)))
-    rotated_barrel = pg.transform.rotate(barrel_scaled, -math.degrees(obj.turret_angle))
-    barrel_rect = rotated_barrel.get_rect()
-    barrel_offset_rot = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
-    barrel_center = Vector2(turret_center) + barrel_offset_rot
-    barrel_rect.center = barrel_center
-    surface.blit(rotated_barrel, barrel_rect.topleft)
-    if obj.selected:
-        radius = 20 * zoom + 3
-        pg.draw.circle(
-            surface,
-            (255, 255, 0),
-            (int(screen_pos[0]), int(screen_pos[1])),
-            int(radius),
-            int(2 * zoom),
-        )
-    obj.draw_health_bar_if_needed(surface=surface, camera=camera, mouse_pos=mouse_pos)
-    for particle in obj.plasma_burn_particles:
-        particle.draw_2d(surface, camera)
-
-
+@cache
 def _create_attackhelicopter_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surface]:
-    """Surfaces for AttackHelicopter: fuselage, cockpit, tail rotor, skids, turret, and missile pod.
+    """Surfaces for AttackHelicopter: fuselage, cockpit, tail rotor, skids, turret, and missile pod. Shared per team.
 
     :param team: The team enum for color selection.
     :return: Tuple of (body_surf, turret_surf, barrel_surf) Pygame Surfaces.
@@ -311,64 +197,175 @@ def _create_attackhelicopter_surfaces(team: Team) -> tuple[pg.Surface, pg.Surfac
     return body_surf, turret_surf, barrel_surf
 
 
-def _draw_attackhelicopter(
+VEHICLE_PART_SIZES = {
+    "Tank": ((30, 20), (12, 12), (20, 6)),
+    "MachineGunVehicle": ((35, 25), (8, 8), (25, 2)),
+    "RocketArtillery": ((40, 25), (12, 12), (30, 8)),
+    "AttackHelicopter": ((25, 15), (8, 6), (12, 2)),
+}
+"""Unzoomed (body, turret, barrel) draw sizes of each vehicle type."""
+VEHICLE_SELECTION_RADII = {name: sizes[0][0] / 2 for name, sizes in VEHICLE_PART_SIZES.items()}
+"""Unzoomed selection circle radius of each vehicle type, before its 3px margin: half its body length."""
+
+
+def _get_vehicle_screen_center(
     obj,  # pyrefly: ignore [implicit-any-parameter]
-    surface: pg.Surface,
     camera: Camera2d,
-    mouse_pos: Point | None = None,
-) -> None:
-    """Custom draw for AttackHelicopter: adjusts Y for fly_height, draws main rotor blades.
+) -> tuple[float, float]:
+    """Returns the screen position of a vehicle body, raised by fly height for air units.
 
-    :param obj: The AttackHelicopter instance.
-    :param surface: The Pygame surface to draw on.
+    :param obj: The vehicle instance.
     :param camera: The Camera2d instance for world-to-screen transformation.
-    :param mouse_pos: Optional mouse position for hover effects.
+    :return: Screen position.
+    """
+    if obj.is_air:
+        return camera.world_to_screen((obj.position.x, obj.position.y - obj.fly_height))
+
+    return camera.world_to_screen(obj.position)
+
+
+def get_vehicle_blits_2d(
+    obj,  # pyrefly: ignore [implicit-any-parameter]
+    camera: Camera2d,
+    screen_pos: Point,
+) -> list[tuple[pg.Surface, Point]]:
+    """Returns the rotated body, turret, and barrel of a vehicle with their screen positions.
+
+    :param obj: The vehicle instance.
+    :param camera: The Camera2d instance for world-to-screen transformation.
+    :param screen_pos: Screen position of the vehicle body, as from `_get_vehicle_screen_center`.
+    :return: (image, position) pairs for `Surface.fblits`, in draw order.
     """
-    if obj.health <= 0:
-        return
-    _team_color = team_to_color[obj.team]
-    fly_screen_pos = camera.world_to_screen((obj.position.x, obj.position.y - obj.fly_height))
     zoom = camera.zoom
-    body_scaled = pg.transform.smoothscale(obj.body_surf, (int(25 * zoom), int(15 * zoom)))
-    rotated_body = pg.transform.rotate(body_scaled, -math.degrees(obj.body_angle))
-    body_rect = rotated_body.get_rect(center=fly_screen_pos)
-    surface.blit(rotated_body, body_rect.topleft)
-    turret_scaled = pg.transform.smoothscale(obj.turret_surf, (int(8 * zoom), int(6 * zoom)))
-    rotated_turret = pg.transform.rotate(turret_scaled, -math.degrees(obj.turret_angle))
+    # Parts and their rotated offsets only change with zoom and angles, which stay put while a vehicle is idle
+    key = (zoom, obj.body_angle, obj.turret_angle)
+    if obj.drawn_parts_key != key:
+        body_size, turret_size, barrel_size = VEHICLE_PART_SIZES[obj.__class__.__name__]
+        turret_degrees = get_part_degrees(obj.turret_angle)
+        obj.drawn_parts = (
+            get_rotated_part(
+                obj.body_surf,
+                (int(body_size[0] * zoom), int(body_size[1] * zoom)),
+                get_part_degrees(obj.body_angle),
+            ),
+            get_rotated_part(obj.turret_surf, (int(turret_size[0] * zoom), int(turret_size[1] * zoom)), turret_degrees),
+            get_rotated_part(obj.barrel_surf, (int(barrel_size[0] * zoom), int(barrel_size[1] * zoom)), turret_degrees),
+            obj.turret_offset.rotate_rad(obj.body_angle) * zoom,
+            obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom,
+        )
+        obj.drawn_parts_key = key
+
+    rotated_body, rotated_turret, rotated_barrel, turret_offset, barrel_offset = obj.drawn_parts
+    body_rect = rotated_body.get_rect(center=screen_pos)
     turret_rect = rotated_turret.get_rect()
-    offset_rot = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
-    turret_center = Vector2(body_rect.center) + offset_rot
+    turret_center = turret_offset + body_rect.center
     turret_rect.center = turret_center
-    surface.blit(rotated_turret, turret_rect.topleft)
-    barrel_scaled = pg.transform.smoothscale(obj.barrel_surf, (int(12 * zoom), int(2 * zoom)))
-    rotated_barrel = pg.transform.rotate(barrel_scaled, -math.degrees(obj.turret_angle))
     barrel_rect = rotated_barrel.get_rect()
-    barrel_offset_rot = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
-    barrel_center = Vector2(turret_center) + barrel_offset_rot
-    barrel_rect.center = barrel_center
-    surface.blit(rotated_barrel, barrel_rect.topleft)
-    rotor_size = int(20 * zoom)
-    pg.draw.circle(
-        surface,
-        _team_color,
-        (int(fly_screen_pos[0]), int(fly_screen_pos[1])),
-        rotor_size // 2,
-        int(2 * zoom),
-    )  # Rotor blades
+    barrel_rect.center = barrel_offset + turret_center
+    return [
+        (rotated_body, body_rect.topleft),
+        (rotated_turret, turret_rect.topleft),
+        (rotated_barrel, barrel_rect.topleft),
+    ]
+
+
+def _draw_vehicle_overlays(
+    obj,  # pyrefly: ignore [implicit-any-parameter]
+    surface: pg.Surface,
+    camera: Camera2d,
+    screen_pos: Point,
+) -> None:
+    """Draws the rotor blades and selection circle over a vehicle's parts.
+
+    :param obj: The vehicle instance.
+    :param surface: The Pygame surface to draw on.
+    :param camera: The Camera2d instance for world-to-screen transformation.
+    :param screen_pos: Screen position of the vehicle body, as from `_get_vehicle_screen_center`.
+    """
+    zoom = camera.zoom
+    if obj.is_air:
+        rotor_size = int(20 * zoom)
+        pg.draw.circle(
+            surface,
+            team_to_color[obj.team],
+            (int(screen_pos[0]), int(screen_pos[1])),
+            rotor_size // 2,
+            int(2 * zoom),
+        )  # Rotor blades
     if obj.selected:
-        radius = 12.5 * zoom + 3
+        radius = VEHICLE_SELECTION_RADII[obj.__class__.__name__] * zoom + 3
         pg.draw.circle(
             surface,
             (255, 255, 0),
-            (int(fly_screen_pos[0]), int(fly_screen_pos[1])),
+            (int(screen_pos[0]), int(screen_pos[1])),
             int(radius),
             int(2 * zoom),
         )
+
+
+def _draw_vehicle(
+    obj,  # pyrefly: ignore [implicit-any-parameter]
+    surface: pg.Surface,
+    camera: Camera2d,
+    mouse_pos: Point | None = None,
+) -> None:
+    """Custom draw for vehicles: blits body, turret, and barrel, each rotated independently, then overlays.
+
+    :param obj: The vehicle instance.
+    :param surface: The Pygame surface to draw on.
+    :param camera: The Camera2d instance for world-to-screen transformation.
+    :param mouse_pos: Optional mouse position for hover effects.
+    """
+    if obj.health <= 0:
+        return
+    screen_pos = _get_vehicle_screen_center(obj, camera)
+    surface.fblits(get_vehicle_blits_2d(obj, camera, screen_pos))
+    _draw_vehicle_overlays(obj, surface, camera, screen_pos)
     obj.draw_health_bar_if_needed(surface=surface, camera=camera, mouse_pos=mouse_pos)
     for particle in obj.plasma_burn_particles:
         particle.draw_2d(surface, camera)
 
 
+def draw_vehicles_2d(
+    *,
+    vehicles: Sequence[Unit2d],
+    surface: pg.Surface,
+    camera: Camera2d,
+    mouse_pos: Point | None = None,
+) -> None:
+    """Draws vehicles with one `Surface.fblits` call for all their parts, then overlays, health bars, and particles.
+
+    :param vehicles: Live vehicles to draw, all of types in `VEHICLE_PART_SIZES`.
+    :param surface: The Pygame surface to draw on.
+    :param camera: The Camera2d instance for world-to-screen transformation.
+    :param mouse_pos: Optional mouse position for hover effects.
+    """
+    # Screen positions are worked out once, with the camera offset and zoom read once, for both passes
+    screen_positions = camera.world_to_screen_many(
+        (v.position.x, v.position.y - v.fly_height) if v.is_air else v.position for v in vehicles
+    )
+    surface.fblits(
+        [
+            blit
+            for v, screen_pos in zip(vehicles, screen_positions, strict=True)
+            for blit in get_vehicle_blits_2d(v, camera, screen_pos)
+        ]
+    )
+    for vehicle, screen_pos in zip(vehicles, screen_positions, strict=True):
+        _draw_vehicle_overlays(vehicle, surface, camera, screen_pos)
+
+    # Health bars and burn particles go over all vehicles, each kind in one call
+    surface.fblits(
+        [
+            bar
+            for v in vehicles
+            if (bar := v.get_health_bar_blit_if_needed(camera=camera, mouse_pos=mouse_pos)) is not None
+        ]
+    )
+    draw_particles_2d(particles=[p for v in vehicles for p in v.plasma_burn_particles], surface=surface, camera=camera)
+
+
+@cache
 def _create_headquarters_image(size: Point, team: Team) -> pg.Surface:
     """Static building image for Headquarters: multi-story with windows, antenna, flag.
 
@@ -480,6 +477,7 @@ def _create_headquarters_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_barracks_image(size: Point, team: Team) -> pg.Surface:
     """Barracks: sloped roof, windows, door with gate details.
 
@@ -578,6 +576,7 @@ def _create_barracks_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_warfactory_image(size: Point, team: Team) -> pg.Surface:
     """WarFactory: industrial building with smokestack, windows, conveyor details.
 
@@ -687,6 +686,7 @@ def _create_warfactory_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_hangar_image(size: Point, team: Team) -> pg.Surface:
     """Hangar: arched roof, control tower, doors for aircraft.
 
@@ -772,6 +772,7 @@ def _create_hangar_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_powerplant_image(size: Point, team: Team) -> pg.Surface:
     """PowerPlant: cooling towers, windows, exhaust pipes.
 
@@ -889,6 +890,7 @@ def _create_powerplant_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_oilderrick_image(size: Point, team: Team) -> pg.Surface:
     """OilDerrick: derrick structure, platform, pump jack.
 
@@ -978,6 +980,7 @@ def _create_oilderrick_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_refinery_image(size: Point, team: Team) -> pg.Surface:
     """Refinery: tanks, pipes, distillation tower.
 
@@ -1070,6 +1073,7 @@ def _create_refinery_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_shalefracker_image(size: Point, team: Team) -> pg.Surface:
     """ShaleFracker: drilling rig with piston and wellhead.
 
@@ -1145,6 +1149,7 @@ def _create_shalefracker_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_blackmarket_image(size: Point, team: Team) -> pg.Surface:
     """BlackMarket: tent-like structure with stalls and signage.
 
@@ -1237,8 +1242,9 @@ def _create_blackmarket_image(size: Point, team: Team) -> pg.Surface:
     return image
 
 
+@cache
 def _create_turret_surfaces(team: Team) -> tuple[pg.Surface, pg.Surface, pg.Surface]:
-    """Turret: base platform, rotating turret, gun barrel.
+    """Turret: base platform, rotating turret, gun barrel. Shared by all turrets of a team.
 
     :param team: The team enum for color selection.
     :return: Tuple of (body_surf, turret_surf, barrel_surf) Pygame Surfaces.
@@ -1340,21 +1346,20 @@ def _draw_turret(
         return
     screen_pos = camera.world_to_screen(obj.position)
     zoom = camera.zoom
-    body_scaled = pg.transform.smoothscale(obj.body_surf, (int(30 * zoom * 0.8), int(30 * zoom * 0.8)))
+    body_scaled = get_rotated_part(obj.body_surf, (int(30 * zoom * 0.8), int(30 * zoom * 0.8)), 0)
     body_rect = body_scaled.get_rect(center=screen_pos)
     surface.blit(body_scaled, body_rect.topleft)
-    turret_scaled = pg.transform.smoothscale(obj.turret_surf, (int(10 * zoom * 0.8), int(10 * zoom * 0.8)))
-    rotated_turret = pg.transform.rotate(turret_scaled, -math.degrees(obj.turret_angle))
+    degrees = get_part_degrees(obj.turret_angle)
+    rotated_turret = get_rotated_part(obj.turret_surf, (int(10 * zoom * 0.8), int(10 * zoom * 0.8)), degrees)
     turret_rect = rotated_turret.get_rect()
-    offset_rot = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
-    turret_center = Vector2(body_rect.center) + offset_rot
+    turret_center = obj.turret_offset.rotate_rad(obj.body_angle) * zoom
+    turret_center += body_rect.center
     turret_rect.center = turret_center
     surface.blit(rotated_turret, turret_rect.topleft)
-    barrel_scaled = pg.transform.smoothscale(obj.barrel_surf, (int(10 * zoom * 0.8), int(2.5 * zoom * 0.8)))
-    rotated_barrel = pg.transform.rotate(barrel_scaled, -math.degrees(obj.turret_angle))
+    rotated_barrel = get_rotated_part(obj.barrel_surf, (int(10 * zoom * 0.8), int(2.5 * zoom * 0.8)), degrees)
     barrel_rect = rotated_barrel.get_rect()
-    barrel_offset_rot = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
-    barrel_center = Vector2(turret_center) + barrel_offset_rot
+    barrel_center = obj.barrel_offset.rotate_rad(obj.turret_angle) * zoom
+    barrel_center += turret_center
     barrel_rect.center = barrel_center
     surface.blit(rotated_barrel, barrel_rect.topleft)
     if obj.selected:
@@ -1374,14 +1379,14 @@ SIMPLE_DRAW_RECIPES = {
 
 # Complex draw mappings
 COMPLEX_DRAW_RECIPES = {
-    "Tank": (_create_tank_surfaces, _draw_tank),
-    "MachineGunVehicle": (_create_machinegunvehicle_surfaces, _draw_machinegunvehicle),
-    "RocketArtillery": (_create_rocketartillery_surfaces, _draw_rocketartillery),
-    "AttackHelicopter": (_create_attackhelicopter_surfaces, _draw_attackhelicopter),
+    "Tank": (_create_tank_surfaces, _draw_vehicle),
+    "MachineGunVehicle": (_create_machinegunvehicle_surfaces, _draw_vehicle),
+    "RocketArtillery": (_create_rocketartillery_surfaces, _draw_vehicle),
+    "AttackHelicopter": (_create_attackhelicopter_surfaces, _draw_vehicle),
     "Turret": (_create_turret_surfaces, _draw_turret),
 }
 
-# Static image recipes for buildings
+# Static image recipes for buildings; cached, so all buildings of a type and team share one (read-only) image
 BUILDING_DRAW_RECIPES = {
     "Headquarters": _create_headquarters_image,
     "Barracks": _create_barracks_image,
@@ -1395,6 +1400,90 @@ BUILDING_DRAW_RECIPES = {
 }
 
 
+@lru_cache(maxsize=1)
+def _render_terrain_view(
+    *,
+    map_rgb: tuple[int, int, int],
+    map_size: tuple[int, int],
+    view_pos: tuple[int, int],
+    view_size: tuple[int, int],
+    screen_size: tuple[int, int],
+    zoom: float,
+) -> pg.Surface:
+    """Renders the terrain tiles in view; cached, so it's only redrawn when the camera moves or zooms.
+
+    :param map_rgb: Base map color.
+    :param map_size: Map width and height.
+    :param view_pos: Camera view top-left, in world space.
+    :param view_size: Camera view size, in world space.
+    :param screen_size: Camera size on screen.
+    :param zoom: Camera zoom.
+    :return: Terrain surface, the size of the screen.
+    """
+    view = pg.Surface(screen_size)
+    tile_sw = TILE_SIZE * zoom
+    tile_sh = TILE_SIZE * zoom
+    start_tx = max(0, int(view_pos[0] // TILE_SIZE))
+    start_ty = max(0, int(view_pos[1] // TILE_SIZE))
+    end_tx = min(map_size[0] // TILE_SIZE, start_tx + int(view_size[0] // TILE_SIZE + 2))
+    end_ty = min(map_size[1] // TILE_SIZE, start_ty + int(view_size[1] // TILE_SIZE + 2))
+    for tx in range(start_tx, end_tx):
+        sx = (tx * TILE_SIZE - view_pos[0]) * zoom
+        if sx < -tile_sw or sx > screen_size[0]:
+            continue
+        for ty in range(start_ty, end_ty):
+            sy = (ty * TILE_SIZE - view_pos[1]) * zoom
+            if sy < -tile_sh or sy > screen_size[1]:
+                continue
+            var_r = ((tx * 17 + ty * 31) % 41) - 20
+            var_g = ((tx * 23 + ty * 37) % 41) - 20
+            var_b = ((tx * 29 + ty * 41) % 41) - 20
+            tile_r = max(0, min(255, map_rgb[0] + var_r))
+            tile_g = max(0, min(255, map_rgb[1] + var_g))
+            tile_b = max(0, min(255, map_rgb[2] + var_b))
+            pg.draw.rect(view, (tile_r, tile_g, tile_b), (sx, sy, tile_sw, tile_sh))
+            crater_seed = (tx * 123 + ty * 456) % 100
+            if crater_seed < 5:
+                cx = sx + tile_sw / 2
+                cy = sy + tile_sh / 2
+                cr = tile_sw / 4
+                dark_r = max(0, tile_r - 40)
+                dark_g = max(0, tile_g - 40)
+                dark_b = max(0, tile_b - 40)
+                pg.draw.circle(view, (dark_r, dark_g, dark_b), (int(cx), int(cy)), int(cr))
+
+    return view
+
+
+def draw_terrain(*, screen: pg.Surface, camera: Camera2d, map_color: pg.Color, map_width: int, map_height: int) -> None:
+    """Renders the terrain in view, reusing the previous frame's terrain while the camera is still.
+
+    :param screen: Main screen.
+    :param camera: Camera2d.
+    :param map_color: Base map color.
+    :param map_width: Map width.
+    :param map_height: Map height.
+    """
+    terrain = _render_terrain_view(
+        map_rgb=(map_color.r, map_color.g, map_color.b),
+        map_size=(map_width, map_height),
+        view_pos=(camera.rect.x, camera.rect.y),
+        view_size=(camera.rect.width, camera.rect.height),
+        screen_size=(camera.width, camera.height),
+        zoom=camera.zoom,
+    )
+    screen.blit(terrain, (0, 0))
+
+
+@cache
+def _get_mini_map_surface() -> pg.Surface:
+    """Returns the mini-map surface, allocated once and redrawn every frame.
+
+    :return: Mini-map surface.
+    """
+    return pg.Surface((MINI_MAP_WIDTH, MINI_MAP_HEIGHT))
+
+
 def draw_mini_map(
     *,
     screen: pg.Surface,
@@ -1427,7 +1516,7 @@ def draw_mini_map(
         MINI_MAP_WIDTH,
         MINI_MAP_HEIGHT,
     )
-    mini_map = pg.Surface((MINI_MAP_WIDTH, MINI_MAP_HEIGHT))
+    mini_map = _get_mini_map_surface()
     mini_map.fill((0, 0, 0))
 
     num_tx = map_width // TILE_SIZE
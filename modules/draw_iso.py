@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from modules.data_iso import MINI_MAP_HEIGHT, MINI_MAP_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
-from modules.fonts import FONT_MEDIUM
+from modules.fonts import render_text
 from modules.geometry import absolute_world_to_iso, get_iso_bounds
 from modules.team import team_to_color, team_to_name
 
@@ -21,6 +22,12 @@ if TYPE_CHECKING:
     from modules.units import UnitIso
 
 
+# Allocated once and redrawn every frame
+@cache
+def _get_mini_map_surface() -> pg.Surface:
+    return pg.Surface((MINI_MAP_WIDTH, MINI_MAP_HEIGHT))
+
+
 def draw_mini_map(
     screen: pg.Surface,
     camera: CameraIso,
@@ -38,7 +45,7 @@ def draw_mini_map(
         MINI_MAP_WIDTH,
         MINI_MAP_HEIGHT,
     )
-    mini_map = pg.Surface((MINI_MAP_WIDTH, MINI_MAP_HEIGHT))
+    mini_map = _get_mini_map_surface()
     mini_map.fill((0, 0, 0))
     min_x1, max_x1, min_y1, max_y1 = get_iso_bounds(map_w=map_width, map_h=map_height, zoom=1.0)
     span_x1 = max_x1 - min_x1
@@ -115,18 +122,24 @@ def draw_mini_map(
     return mini_map_rect
 
 
+@cache
+def _create_panel_background(width: int, height: int) -> pg.Surface:
+    panel_surf = pg.Surface((width, height), pg.SRCALPHA)
+    panel_surf.fill((40, 40, 40, 128))
+    return panel_surf
+
+
 def draw_fitness_panel(screen: pg.Surface, g: GameDataIso) -> None:
     panel_x = 10
     panel_y = 10
     panel_width = 180
     panel_height = 250
     panel_rect = pg.Rect(panel_x, panel_y, panel_width, panel_height)
-    panel_surf = pg.Surface((panel_width, panel_height), pg.SRCALPHA)
-    panel_surf.fill((40, 40, 40, 128))
-    screen.blit(panel_surf, panel_rect.topleft)
+    screen.blit(_create_panel_background(panel_width, panel_height), panel_rect.topleft)
     pg.draw.rect(screen, (100, 100, 100), panel_rect, 2)
     y_offset = panel_y + 10
-    title_surf = FONT_MEDIUM.render("Fitness", True, (255, 255, 255))
+    # Team names and fitness values change rarely, so their rendered text is cached
+    title_surf = render_text("Fitness", (255, 255, 255))
     screen.blit(title_surf, (panel_x + 10, y_offset))
     y_offset += 30
     for team in g.teams:
@@ -137,14 +150,15 @@ def draw_fitness_panel(screen: pg.Surface, g: GameDataIso) -> None:
         name = team_to_name[team]
         fitness = g.current_fitness.get(team, 0)
         delta = g.fitness_deltas.get(team, 0)
-        name_surf = FONT_MEDIUM.render(f"{name}:", True, team_to_color[team])
+        _color = team_to_color[team]
+        name_surf = render_text(f"{name}:", (_color.r, _color.g, _color.b))
         screen.blit(name_surf, (panel_x + 10, y_offset))
-        value_surf = FONT_MEDIUM.render(str(fitness), True, (255, 255, 255))
+        value_surf = render_text(str(fitness), (255, 255, 255))
         screen.blit(value_surf, (panel_x + 120, y_offset))
         if delta != 0:
             delta_text = f"{'+' if delta > 0 else ''}{delta}"
             delta_color = (0, 255, 0) if delta > 0 else (255, 0, 0)
-            delta_surf = FONT_MEDIUM.render(delta_text, True, delta_color)
+            delta_surf = render_text(delta_text, delta_color)
             screen.blit(delta_surf, (panel_x + 140, y_offset))
 
         y_offset += 25
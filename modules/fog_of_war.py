@@ -5,6 +5,8 @@ from __future__ import annotations
 import math
 from abc import ABC
 from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
+from itertools import groupby, repeat
 from typing import TYPE_CHECKING
 
 import pygame as pg
@@ -18,11 +20,91 @@ if TYPE_CHECKING:
     from modules.units import Unit2d, UnitIso
 
 
+@lru_cache(maxsize=8192)
+def _get_reveal_runs(
+    *, radius: int, tile_size: int, offset_x: int, offset_y: int
+) -> tuple[tuple[int, int, int, bytes], ...]:
+    """Reveal stamp for a sight circle: per column, the run of tiles whose centers lie inside the circle.
+
+    The stamp depends only on the radius and on the center's (whole-pixel) offset within its tile, so it is computed
+    once and reused by every unit and building at that offset.
+
+    :param radius: Reveal radius in pixels.
+    :param tile_size: Size of each fog tile.
+    :param offset_x: Center x offset within its tile, in pixels.
+    :param offset_y: Center y offset within its tile, in pixels.
+    :return: Tuples (dtx, dty0, dty1, run) of tile offsets from the center tile, revealing rows dty0 <= dty < dty1,
+        and the matching run of set bytes.
+    """
+    half_tile = tile_size // 2
+    radius_tiles = radius // tile_size
+    radius_sq = radius * radius
+    runs = []
+    for dtx in range(-radius_tiles, radius_tiles + 1):
+        dx = offset_x - (dtx * tile_size + half_tile)
+        if dx * dx > radius_sq:
+            continue
+
+        # Tiles whose centers lie on this column's chord of the circle form one contiguous run
+        half_chord = math.sqrt(radius_sq - dx * dx)
+        dty0 = max(-radius_tiles, math.ceil((offset_y - half_chord - half_tile) / tile_size))
+        dty1 = min(radius_tiles, math.floor((offset_y + half_chord - half_tile) / tile_size)) + 1
+        if dty0 < dty1:
+            runs.append((dtx, dty0, dty1, b"\x01" * (dty1 - dty0)))
+
+    return tuple(runs)
+
+
+@lru_cache(maxsize=4096)
+def _get_reveal_tiles(
+    *,
+    tile_x: int,
+    tile_y: int,
+    radius: int,
+    tile_size: int,
+    offset_x: int,
+    offset_y: int,
+    num_tiles_x: int,
+    num_tiles_y: int,
+) -> tuple[tuple[tuple[int, int, int, bytes], ...], tuple[tuple[int, int], ...]]:
+    """Reveal stamp placed at a tile and clipped to the grid.
+
+    Stationary buildings and idle units reveal the same tiles every frame, so caching the placed stamp turns their
+    reveal into a few slice assignments and a single set update.
+
+    :param tile_x: Center tile x index.
+    :param tile_y: Center tile y index.
+    :param radius: Reveal radius in pixels.
+    :param tile_size: Size of each fog tile.
+    :param offset_x: Center x offset within its tile, in pixels.
+    :param offset_y: Center y offset within its tile, in pixels.
+    :param num_tiles_x: Grid width in tiles.
+    :param num_tiles_y: Grid height in tiles.
+    :return: Tuples (tx, y0, y1, run) revealing rows y0 <= ty < y1 of column tx, and the revealed tile indices.
+    """
+    runs = []
+    tiles: list[tuple[int, int]] = []
+    for dtx, dty0, dty1, run in _get_reveal_runs(
+        radius=radius, tile_size=tile_size, offset_x=offset_x, offset_y=offset_y
+    ):
+        tx = tile_x + dtx
+        y0 = max(0, tile_y + dty0)
+        y1 = min(num_tiles_y, tile_y + dty1)
+        if not 0 <= tx < num_tiles_x or y0 >= y1:
+            continue
+
+        runs.append((tx, y0, y1, run[: y1 - y0]))
+        tiles.extend(zip(repeat(tx), range(y0, y1)))
+
+    return tuple(runs), tuple(tiles)
+
+
 @dataclass(kw_only=True)
 class _FogOfWarGeneric(ABC):
     """Manages explored/visible tiles on a grid, revealing areas based on unit sight ranges.
 
-    Uses 2D boolean grids for explored and currently visible tiles.
+    Uses per-column byte grids for explored and currently visible tiles, so whole runs of tiles can be reset or
+    revealed with a single slice assignment.
     """
 
     map_width: InitVar[int]
@@ -35,21 +117,28 @@ class _FogOfWarGeneric(ABC):
     """Size of each fog tile (default: TILE_SIZE)."""
 
     # internal:
-    explored: list[list[bool]] = field(init=False)
-    """Grid of explored tiles (True = explored)."""
-    visible: list[list[bool]] = field(init=False)
-    """Grid of currently visible tiles (True = visible)."""
+    num_tiles_x: int = field(init=False)
+    """Grid width in tiles."""
+    num_tiles_y: int = field(init=False)
+    """Grid height in tiles."""
+    explored: list[bytearray] = field(init=False)
+    """Grid of explored tiles, indexed [tx][ty] (1 = explored)."""
+    visible: list[bytearray] = field(init=False)
+    """Grid of currently visible tiles, indexed [tx][ty] (1 = visible)."""
+    visible_tiles: set[tuple[int, int]] = field(init=False)
+    """Set of currently visible tile indices (tx, ty), for bounds-free lookups."""
 
     def __post_init__(self, map_width: int, map_height: int, spectator_mode: bool) -> None:
         """Initializes 2D grids for explored and visible tiles."""
-        num_tiles_x_ = map_width // self.tile_size
-        num_tiles_y_ = map_height // self.tile_size
+        self.num_tiles_x = map_width // self.tile_size
+        self.num_tiles_y = map_height // self.tile_size
+        column = b"\x01" * self.num_tiles_y if spectator_mode else bytes(self.num_tiles_y)
+        self.explored = [bytearray(column) for _ in range(self.num_tiles_x)]
+        self.visible = [bytearray(column) for _ in range(self.num_tiles_x)]
         if spectator_mode:
-            self.explored = [[True] * num_tiles_y_ for _ in range(num_tiles_x_)]
-            self.visible = [[True] * num_tiles_y_ for _ in range(num_tiles_x_)]
+            self.visible_tiles = {(tx, ty) for tx in range(self.num_tiles_x) for ty in range(self.num_tiles_y)}
         else:
-            self.explored = [[False] * num_tiles_y_ for _ in range(num_tiles_x_)]
-            self.visible = [[False] * num_tiles_y_ for _ in range(num_tiles_x_)]
+            self.visible_tiles = set()
 
     def update_visibility(
         self,
@@ -66,9 +155,12 @@ class _FogOfWarGeneric(ABC):
         if not ally_units and not ally_buildings:
             return
 
-        num_tiles_x = len(self.visible)
-        num_tiles_y = len(self.visible[0])
-        self.visible = [[False] * num_tiles_y for _ in range(num_tiles_x)]
+        num_tiles_x, num_tiles_y = self.num_tiles_x, self.num_tiles_y
+        hidden_column = bytes(num_tiles_y)
+        for column in self.visible:
+            column[:] = hidden_column
+
+        self.visible_tiles = set()
         for unit in ally_units:
             self._reveal(unit.position, unit.sight_range)
 
@@ -83,7 +175,7 @@ class _FogOfWarGeneric(ABC):
                     int(building.position[1] // self.tile_size),
                 )
                 if 0 <= tx < num_tiles_x and 0 <= ty < num_tiles_y:
-                    building.is_seen = building.is_seen or self.visible[tx][ty]
+                    building.is_seen = building.is_seen or bool(self.visible[tx][ty])
 
     def _reveal(self, center: Point, radius: int) -> None:
         """Reveals tiles within radius of center as both explored and visible.
@@ -92,15 +184,24 @@ class _FogOfWarGeneric(ABC):
         :param radius: Reveal radius in pixels.
         """
         cx, cy = center
-        tile_x, tile_y = int(cx // self.tile_size), int(cy // self.tile_size)
-        radius_tiles = radius // self.tile_size
-        for ty in range(max(0, tile_y - radius_tiles), min(len(self.explored[0]), tile_y + radius_tiles + 1)):
-            for tx in range(max(0, tile_x - radius_tiles), min(len(self.explored), tile_x + radius_tiles + 1)):
-                tile_center_x = tx * self.tile_size + self.tile_size // 2
-                tile_center_y = ty * self.tile_size + self.tile_size // 2
-                if math.sqrt((cx - tile_center_x) ** 2 + (cy - tile_center_y) ** 2) <= radius:
-                    self.explored[tx][ty] = True
-                    self.visible[tx][ty] = True
+        tile_size = self.tile_size
+        tile_x, tile_y = int(cx // tile_size), int(cy // tile_size)
+        runs, tiles = _get_reveal_tiles(
+            tile_x=tile_x,
+            tile_y=tile_y,
+            radius=radius,
+            tile_size=tile_size,
+            offset_x=round(cx - tile_x * tile_size),
+            offset_y=round(cy - tile_y * tile_size),
+            num_tiles_x=self.num_tiles_x,
+            num_tiles_y=self.num_tiles_y,
+        )
+        explored, visible = self.explored, self.visible
+        for tx, y0, y1, run in runs:
+            explored[tx][y0:y1] = run
+            visible[tx][y0:y1] = run
+
+        self.visible_tiles.update(tiles)
 
     def is_visible(self, pos: Point) -> bool:
         """Checks if a position's tile is currently visible.
@@ -108,11 +209,7 @@ class _FogOfWarGeneric(ABC):
         :param pos: Position (x, y) to check.
         :return: True if visible.
         """
-        tx, ty = int(pos[0] // self.tile_size), int(pos[1] // self.tile_size)
-        if 0 <= tx < len(self.visible) and 0 <= ty < len(self.visible[0]):
-            return self.visible[tx][ty]
-
-        return False
+        return (int(pos[0] // self.tile_size), int(pos[1] // self.tile_size)) in self.visible_tiles
 
     def is_explored(self, pos: Point) -> bool:
         """Checks if a position's tile has been explored (visible in the past).
@@ -121,74 +218,117 @@ class _FogOfWarGeneric(ABC):
         :return: True if explored.
         """
         tx, ty = int(pos[0] // self.tile_size), int(pos[1] // self.tile_size)
-        if 0 <= tx < len(self.explored) and 0 <= ty < len(self.explored[0]):
-            return self.explored[tx][ty]
+        if 0 <= tx < self.num_tiles_x and 0 <= ty < self.num_tiles_y:
+            return bool(self.explored[tx][ty])
 
         return False
 
 
 @dataclass(kw_only=True)
 class FogOfWar2d(_FogOfWarGeneric):
+    _fog_tiles: pg.Surface = field(init=False)
+    """Persistent fog image with one pixel per tile, whose alpha is that tile's fog darkness."""
+    _drawn_visible: list[bytearray] = field(init=False)
+    """Snapshot of `visible` as last painted into `_fog_tiles`."""
+    _drawn_explored: list[bytearray] = field(init=False)
+    """Snapshot of `explored` as last painted into `_fog_tiles`."""
+    _scaled_fog: dict[tuple[int, int], pg.Surface] = field(init=False, default_factory=dict)
+    """Scaled-up fog surfaces by size, reused as the scale destination rather than reallocated each frame."""
+
+    def __post_init__(self, map_width: int, map_height: int, spectator_mode: bool) -> None:
+        super().__post_init__(map_width, map_height, spectator_mode)
+        self._fog_tiles = pg.Surface((self.num_tiles_x, self.num_tiles_y), pg.SRCALPHA)
+        self._fog_tiles.fill((0, 0, 0, 0 if spectator_mode else 255))
+        self._drawn_visible = [bytearray(column) for column in self.visible]
+        self._drawn_explored = [bytearray(column) for column in self.explored]
+
     def draw(self, surface: pg.Surface, camera: Camera2d) -> None:
         """Renders semi-transparent black overlay on non-visible tiles (full black if unexplored).
 
+        Only in-view tiles whose state changed since the last draw are repainted into the persistent per-tile fog
+        image, which is then scaled up over the view.
+
         :param surface: Surface to draw fog on.
         :param camera: Camera2d for viewport culling.
         """
+        fog_tiles = self._fog_tiles
         start_tx = max(0, camera.rect.x // self.tile_size)
         start_ty = max(0, camera.rect.y // self.tile_size)
-        end_tx = min(len(self.visible), start_tx + (camera.rect.width // self.tile_size) + 2)
-        end_ty = min(len(self.visible[0]), start_ty + (camera.rect.height // self.tile_size) + 2)
-        zoom = camera.zoom
-        tile_sw = self.tile_size * zoom
-        tile_sh = self.tile_size * zoom
-        fog_overlay = pg.Surface((camera.width, camera.height), pg.SRCALPHA)
-        fog_overlay.fill((0, 0, 0, 0))
+        end_tx = min(self.num_tiles_x, camera.rect.right // self.tile_size + 1)
+        end_ty = min(self.num_tiles_y, camera.rect.bottom // self.tile_size + 1)
+        if start_tx >= end_tx or start_ty >= end_ty:
+            return
+
+        # Off-view tiles keep their stale paint until they scroll into view
         for tx in range(start_tx, end_tx):
-            wx = tx * self.tile_size
-            sx = (wx - camera.rect.x) * zoom
-            if sx < -tile_sw or sx > camera.width:
+            visible_column, explored_column = self.visible[tx], self.explored[tx]
+            drawn_visible, drawn_explored = self._drawn_visible[tx], self._drawn_explored[tx]
+            if visible_column == drawn_visible and explored_column == drawn_explored:
                 continue
 
             for ty in range(start_ty, end_ty):
-                wy = ty * self.tile_size
-                sy = (wy - camera.rect.y) * zoom
-                if sy < -tile_sh or sy > camera.height:
-                    continue
+                is_visible, is_explored = visible_column[ty], explored_column[ty]
+                if is_visible != drawn_visible[ty] or is_explored != drawn_explored[ty]:
+                    alpha = 0 if is_visible else 100 if is_explored else 255
+                    fog_tiles.set_at((tx, ty), (0, 0, 0, alpha))
 
-                if not self.visible[tx][ty]:
-                    alpha = 255 if not self.explored[tx][ty] else 100
-                    pg.draw.rect(fog_overlay, (0, 0, 0, alpha), (sx, sy, tile_sw, tile_sh))
+            drawn_visible[start_ty:end_ty] = visible_column[start_ty:end_ty]
+            drawn_explored[start_ty:end_ty] = explored_column[start_ty:end_ty]
 
-        surface.blit(fog_overlay, (0, 0))
+        zoom = camera.zoom
+        view_tiles = fog_tiles.subsurface((start_tx, start_ty, end_tx - start_tx, end_ty - start_ty))
+        scaled_size = (
+            round((end_tx - start_tx) * self.tile_size * zoom),
+            round((end_ty - start_ty) * self.tile_size * zoom),
+        )
+        scaled_fog = self._scaled_fog.get(scaled_size)
+        if scaled_fog is None:
+            # The view spans one of a few tile counts per zoom level; sizes from earlier zooms are dropped
+            if len(self._scaled_fog) >= 4:
+                self._scaled_fog.clear()
+
+            scaled_fog = self._scaled_fog[scaled_size] = pg.Surface(scaled_size, pg.SRCALPHA)
+
+        pg.transform.scale(view_tiles, scaled_size, scaled_fog)
+        surface.blit(
+            scaled_fog,
+            ((start_tx * self.tile_size - camera.rect.x) * zoom, (start_ty * self.tile_size - camera.rect.y) * zoom),
+        )
 
 
 @dataclass(kw_only=True)
 class FogOfWarIso(_FogOfWarGeneric):
+    _fog_overlay: pg.Surface | None = field(init=False, default=None)
+    """Screen-sized overlay the fog is drawn into, kept between frames rather than reallocated."""
+
     def draw(self, surface: pg.Surface, camera: CameraIso) -> None:
         min_wx, max_wx, min_wy, max_wy = camera.get_render_bounds(self.tile_size)
         start_tx = max(0, int(min_wx // self.tile_size))
         start_ty = max(0, int(min_wy // self.tile_size))
-        end_tx = min(len(self.visible), int(max_wx // self.tile_size) + 2)
-        end_ty = min(len(self.visible[0]), int(max_wy // self.tile_size) + 2)
+        end_tx = min(self.num_tiles_x, int(max_wx // self.tile_size) + 2)
+        end_ty = min(self.num_tiles_y, int(max_wy // self.tile_size) + 2)
         zoom = camera.zoom
-        fog_overlay = pg.Surface((camera.width, camera.height), pg.SRCALPHA)
+        fog_overlay = self._fog_overlay
+        if fog_overlay is None or fog_overlay.get_size() != (camera.width, camera.height):
+            fog_overlay = self._fog_overlay = pg.Surface((camera.width, camera.height), pg.SRCALPHA)
+
         fog_overlay.fill((0, 0, 0, 0))
+        # Each column's fogged tiles are drawn as runs of equal alpha, one polygon per run
         for tx in range(start_tx, end_tx):
-            wx = tx * self.tile_size
-            for ty in range(start_ty, end_ty):
-                wy = ty * self.tile_size
-                if not self.visible[tx][ty]:
-                    alpha = 255 if not self.explored[tx][ty] else 100
-                    color = (0, 0, 0, alpha)
-                    c1 = (wx, wy)
-                    c2 = (wx + self.tile_size, wy)
-                    c3 = (wx + self.tile_size, wy + self.tile_size)
-                    c4 = (wx, wy + self.tile_size)
-                    iso1 = camera.world_to_iso(c1, zoom)
-                    iso2 = camera.world_to_iso(c2, zoom)
-                    iso3 = camera.world_to_iso(c3, zoom)
-                    iso4 = camera.world_to_iso(c4, zoom)
-                    pg.draw.polygon(fog_overlay, color, [iso1, iso2, iso3, iso4])
+            visible_column, explored_column = self.visible[tx], self.explored[tx]
+            alphas = (
+                0 if is_visible else 100 if is_explored else 255
+                for is_visible, is_explored in zip(visible_column[start_ty:end_ty], explored_column[start_ty:end_ty])
+            )
+            wx0, wx1 = tx * self.tile_size, (tx + 1) * self.tile_size
+            ty = start_ty
+            for alpha, run in groupby(alphas):
+                run_length = len(list(run))
+                if alpha:
+                    wy0, wy1 = ty * self.tile_size, (ty + run_length) * self.tile_size
+                    corners = [(wx0, wy0), (wx1, wy0), (wx1, wy1), (wx0, wy1)]
+                    pg.draw.polygon(fog_overlay, (0, 0, 0, alpha), [camera.world_to_iso(c, zoom) for c in corners])
+
+                ty += run_length
 
         surface.blit(fog_overlay, (0, 0))
@@ -1,7 +1,23 @@
 """Font objects."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+
 import pygame as pg
 
 pg.font.init()
 FONT_LARGE = pg.font.SysFont(None, 72)
 FONT_MEDIUM = pg.font.SysFont(None, 28)
+
+
+@lru_cache(maxsize=256)
+def render_text(text: str, color: str | tuple[int, int, int] = "white", font: pg.font.Font = FONT_MEDIUM) -> pg.Surface:
+    """Renders antialiased text, caching the result; callers must not draw onto the returned surface.
+
+    :param text: Text to render.
+    :param color: Text color, as a color name or RGB tuple.
+    :param font: Font to render with (default: FONT_MEDIUM).
+    :return: Rendered text surface.
+    """
+    return font.render(text, antialias=True, color=color)
@@ -7,23 +7,24 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import pygame as pg
-from pygame.math import Vector2
 
 from modules.camera import Camera2d
 from modules.data_2d import CONSOLE_HEIGHT, SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
 from modules.fog_of_war import FogOfWar2d
-from modules.geometry import check_collision, closest_point_on_rect
+from modules.geometry import closest_point_on_rect
 from modules.particle import Particle, create_explosion_2d
 from modules.production_interface import ProductionInterface2d
+from modules.spatial_hash import SpatialHash2d
 from modules.team import Team
 from modules.units.units_2d import Infantry
+from modules.world_2d import is_valid_building_position
 
 if TYPE_CHECKING:
     from pygame.typing import IntPoint, Point
 
     from modules.ai import Ai2d
     from modules.projectile import Projectile2d
-    from modules.spatial_hash import SpatialHash2d
+    from modules.revisioned_group import RevisionedGroup
     from modules.units import Unit2d
     from modules.units.units_2d import Headquarters
 
@@ -34,7 +35,7 @@ class GameData2d:
 
     ai_units: pg.sprite.Group[Unit2d]
     global_units: pg.sprite.Group[Unit2d]
-    global_buildings: pg.sprite.Group[Unit2d]
+    global_buildings: RevisionedGroup[Unit2d]
     projectiles: pg.sprite.Group[Projectile2d]
     particles: pg.sprite.Group[Particle]
     selected_units: pg.sprite.Group[Unit2d]
@@ -63,6 +64,10 @@ class GameData2d:
     selecting: bool = field(init=False, default=False)
     select_start: IntPoint | None = field(init=False, default=None)
     select_rect: pg.Rect | None = field(init=False, default=None)
+    _placement_validity: tuple[tuple[Point, type, int], bool] | None = field(init=False, default=None)
+    """Last player placement check, as (position, building class, buildings revision) and its result."""
+    _building_hash: tuple[int, SpatialHash2d] | None = field(init=False, default=None)
+    """Spatial hash of buildings, with the buildings revision it was built at."""
 
     def __post_init__(self) -> None:
         self.camera = Camera2d(
@@ -100,6 +105,50 @@ class GameData2d:
         for hq in self.hqs.values():
             self.global_buildings.add(hq)
 
+    def is_valid_player_placement(self, position: Point) -> bool:
+        """Checks whether the player's pending building can be placed at position.
+
+        The result is memoized until the position, the building class or the set of buildings changes, so a
+        stationary placement ghost does not repeat the check every frame.
+
+        :param position: Snapped placement position.
+        :return: True if placement is valid.
+        """
+        if self.interface is None or self.interface.placing_cls is None or self.player_team is None:
+            return False
+
+        key = (position, self.interface.placing_cls, self.global_buildings.revision)
+        if self._placement_validity is not None and self._placement_validity[0] == key:
+            return self._placement_validity[1]
+
+        valid = is_valid_building_position(
+            position=position,
+            team=self.player_team,
+            new_building_cls=self.interface.placing_cls,
+            buildings=self.global_buildings,
+            map_width=self.map_width,
+            map_height=self.map_height,
+        )
+        self._placement_validity = (key, valid)
+        return valid
+
+    def get_building_hash(self) -> SpatialHash2d:
+        """Returns a spatial hash of all buildings.
+
+        Buildings never move, so the hash is only rebuilt when a building is added or removed.
+
+        :return: Spatial hash of buildings; may include buildings at zero health that are not yet cleaned up.
+        """
+        revision = self.global_buildings.revision
+        if self._building_hash is None or self._building_hash[0] != revision:
+            building_hash = SpatialHash2d(200)
+            for b in self.global_buildings:
+                building_hash.add(b)
+
+            self._building_hash = (revision, building_hash)
+
+        return self._building_hash[1]
+
     def _add_initial_infantry(self, team: Team) -> None:
         units = pg.sprite.Group()
         for _ in range(3):
@@ -155,10 +204,9 @@ class GameData2d:
                 d.plasma_burn_particles = []
 
         # Cleanup dead buildings
-        group = self.global_buildings
-        dead = [obj for obj in group if obj.health <= 0]
+        dead = [obj for obj in self.global_buildings if obj.health <= 0]
         for d in dead:
-            group.remove(d)
+            d.kill()  # also removes it from its team's building group
             if hasattr(d, "plasma_burn_particles"):
                 for p in d.plasma_burn_particles:
                     if hasattr(p, "kill"):
@@ -181,117 +229,125 @@ class GameData2d:
 
     def handle_projectiles(self) -> None:
         """Updates projectiles, checks hits on enemies, applies damage/explosions."""
+        if not self.projectiles:
+            return
+
+        # Snapshot the live targets once per frame, partitioned by the alliance that may hit them, rather than
+        # rebuilding and team-filtering them for every projectile.
+        # Most targets are hit-tested by rect in a single `collidelistall` call; a few buildings use a radius instead.
+        targets = [t for t in (*self.global_units, *self.global_buildings) if t.health > 0]
+        enemies_by_team: dict[Team, tuple[list[Unit2d], list[pg.Rect], list[Unit2d]]] = {}
+        for team, allies in self.alliances.items():
+            enemies = [t for t in targets if t.team not in allies]
+            rect_targets = [t for t in enemies if not hasattr(t, "radius")]
+            radial_targets = [t for t in enemies if hasattr(t, "radius")]
+            # pyrefly: ignore [unsupported-operation]
+            enemies_by_team[team] = (rect_targets, [t.rect for t in rect_targets], radial_targets)
+
         for projectile in self.projectiles:
-            proj_allies = self.alliances[projectile.team]
-            enemy_units = [u for u in self.global_units if u.team not in proj_allies and u.health > 0]
-            enemy_buildings = [b for b in self.global_buildings if b.team not in proj_allies and b.health > 0]
-
-            hit = False
-            for e in enemy_units + enemy_buildings:
-                if check_collision(entity=e, projectile=projectile):
-                    if e.take_damage(projectile.damage):
-                        create_explosion_2d(position=e.position, particles=self.particles, team=e.team)
-                        attacker_hq = self.hqs[projectile.team]
-                        if e.hq:
-                            if e.is_building:
-                                e.hq.game_stats["buildings_lost"] += 1
-                                attacker_hq.game_stats["buildings_destroyed"] += 1
-                            else:
-                                e.hq.game_stats["units_lost"] += 1
-                                attacker_hq.game_stats["units_destroyed"] += 1
-
-                            self.global_units.remove(e)
-                            for ug in self.unit_groups.values():
-                                if e in ug:
-                                    ug.remove(e)
-
-                        elif e in self.global_buildings:
-                            self.global_buildings.remove(e)
-
-                    hit = True
+            rect_targets, rect_target_rects, radial_targets = enemies_by_team[projectile.team]
+            hit = None
+            # pyrefly: ignore [missing-attribute]
+            for i in projectile.rect.collidelistall(rect_target_rects):
+                e = rect_targets[i]
+                if e.health > 0:  # may have been destroyed by an earlier projectile this frame
+                    hit = e
                     break
 
-            if hit:
+            if hit is None:
+                proj_reach = max(projectile.length, projectile.width) / 2
+                for e in radial_targets:
+                    # pyrefly: ignore [missing-attribute]
+                    if e.health > 0 and e.distance_squared_to(projectile.position) < (e.radius + proj_reach) ** 2:
+                        hit = e
+                        break
+
+            if hit is not None:
+                self._apply_projectile_hit(projectile=projectile, target=hit)
                 projectile.kill()
 
-    def handle_attacks(
-        self,
-        *,
-        team: Team,
-        unit_hash: SpatialHash2d,
-        building_hash: SpatialHash2d,
-        allied_teams: frozenset[Team],
-    ) -> None:
-        """For a team, finds targets in sight range and shoots if in attack range; handles chasing.
-
-        :param team: Attacking team.
-        :param particles: Group to add particles to.
-        :param unit_hash: Unit spatial hash.
-        :param building_hash: Building spatial hash.
-        :param allied_teams: Team alliances.
+    def _apply_projectile_hit(self, *, projectile: Projectile2d, target: Unit2d) -> None:
+        """Applies projectile damage to a target, and removes/records the target if destroyed.
+
+        :param projectile: Projectile that hit.
+        :param target: Entity that was hit.
         """
-        armed_entities = [u for u in self.global_units if u.team == team and u.health > 0]
-        armed_entities.extend(b for b in self.global_buildings if b.team == team and b.weapons and b.health > 0)
+        e = target
+        if e.take_damage(projectile.damage):
+            create_explosion_2d(position=e.position, particles=self.particles, team=e.team)
+            attacker_hq = self.hqs[projectile.team]
+            if e.hq:
+                if e.is_building:
+                    e.hq.game_stats["buildings_lost"] += 1
+                    attacker_hq.game_stats["buildings_destroyed"] += 1
+                else:
+                    e.hq.game_stats["units_lost"] += 1
+                    attacker_hq.game_stats["units_destroyed"] += 1
 
-        for entity in armed_entities:
-            if entity.last_shot_time != 0:
-                continue
+                self.global_units.remove(e)
+                for ug in self.unit_groups.values():
+                    if e in ug:
+                        ug.remove(e)
 
+            elif e in self.global_buildings:
+                e.kill()
+
+    def handle_attacks(self, *, target_hash: SpatialHash2d) -> None:
+        """For every team in one pass, finds targets in sight range and shoots if in attack range; handles chasing.
+
+        :param target_hash: Spatial hash of all live units and buildings, built once per frame.
+        """
+        # Only entities that are ready to fire can pick a target; read them from each team's own groups.
+        ready_entities = [
+            u for team in self.teams for u in self.unit_groups[team] if u.health > 0 and u.last_shot_time == 0
+        ]
+        ready_entities.extend(
+            b
+            for team in self.teams
+            for b in self.hqs[team].buildings
+            if b.weapons and b.health > 0 and b.last_shot_time == 0
+        )
+
+        for entity in ready_entities:
+            allied_teams = self.alliances[entity.team]
+            # Ranges are compared squared, to avoid a square root per candidate.
             closest_unit_in_range = None
-            min_unit_dist_in_range = float("inf")
+            min_unit_dist_sq_in_range = float("inf")
             closest_building_in_range = None
-            min_building_dist_in_range = float("inf")
+            min_building_dist_sq_in_range = float("inf")
             closest_overall = None
-            min_overall_dist = float("inf")
-            candidates = unit_hash.query(entity.position, entity.sight_range) + building_hash.query(
-                entity.position, entity.sight_range
-            )
-            for obj in candidates:
+            min_overall_dist_sq = float("inf")
+            for obj in target_hash.query(entity.position, entity.sight_range):
                 if obj.team not in allied_teams and obj.health > 0:
                     if obj.is_building:
                         # pyrefly: ignore [bad-argument-type]
                         closest_pt = closest_point_on_rect(rect=obj.rect, pos=entity.position)
-                        dist = Vector2(closest_pt).distance_to(entity.position)
+                        dist_sq = entity.distance_squared_to(closest_pt)
                     else:
-                        dist = entity.distance_to(obj.position)
+                        dist_sq = entity.distance_squared_to(obj.position)
 
-                    if dist <= entity.sight_range:
-                        if dist < min_overall_dist:
-                            closest_overall, min_overall_dist = obj, dist
+                    if dist_sq <= entity.sight_range_sq:
+                        if dist_sq < min_overall_dist_sq:
+                            closest_overall, min_overall_dist_sq = obj, dist_sq
 
-                        if dist <= entity.attack_range:
+                        if dist_sq <= entity.attack_range_sq:
                             if not obj.is_building:  # unit
-                                if dist < min_unit_dist_in_range:
-                                    closest_unit_in_range, min_unit_dist_in_range = obj, dist
-                            elif dist < min_building_dist_in_range:  # building
-                                closest_building_in_range, min_building_dist_in_range = obj, dist
-
-            if closest_unit_in_range:
-                closest_target = closest_unit_in_range
-            elif closest_building_in_range:
-                closest_target = closest_building_in_range
-            elif closest_overall:
-                closest_target = closest_overall
-            else:
-                closest_target = None
+                                if dist_sq < min_unit_dist_sq_in_range:
+                                    closest_unit_in_range, min_unit_dist_sq_in_range = obj, dist_sq
+                            elif dist_sq < min_building_dist_sq_in_range:  # building
+                                closest_building_in_range, min_building_dist_sq_in_range = obj, dist_sq
 
+            closest_in_range = closest_unit_in_range or closest_building_in_range
+            closest_target = closest_in_range or closest_overall
             if closest_target:
                 entity.attack_target = closest_target
-                if closest_target.is_building:
-                    # pyrefly: ignore [bad-argument-type]
-                    closest_pt = closest_point_on_rect(rect=closest_target.rect, pos=entity.position)
-                    dir_c = Vector2(closest_pt) - entity.position
-                    dist_to_target = dir_c.length()
-                else:
-                    dist_to_target = entity.distance_to(closest_target.position)
                 # Shoot if in range
-                if dist_to_target <= entity.attack_range:
+                if closest_in_range:
                     entity.shoot(target=closest_target, projectiles=self.projectiles, particles=self.particles)
 
                 elif not entity.is_building:
                     # Chase the target
                     if closest_target.is_building:
-                        chase_pos = entity.get_chase_position_for_building(closest_target)
-                        entity.move_target = chase_pos if chase_pos is not None else None
+                        entity.move_target = entity.get_chase_position_for_building(closest_target)
                     else:
                         entity.move_target = closest_target.position
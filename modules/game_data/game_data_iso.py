@@ -10,12 +10,13 @@ from pygame.math import Vector2
 
 from modules.geometry import check_collision, closest_point_on_rect
 from modules.particle import create_explosion_iso
+from modules.world_iso import is_valid_building_position
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
     import pygame as pg
-    from pygame.typing import IntPoint
+    from pygame.typing import IntPoint, Point
 
     from modules.ai import AiIso
     from modules.camera.camera_iso import CameraIso
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
     from modules.particle import Particle
     from modules.production_interface import ProductionInterfaceIso
     from modules.projectile import ProjectileIso
+    from modules.revisioned_group import RevisionedGroup
     from modules.spatial_hash import SpatialHashIso
     from modules.team import Team
     from modules.terrain_feature_iso import TerrainFeature
@@ -37,7 +39,7 @@ class GameDataIso:
     player_units: pg.sprite.Group[UnitIso]
     ai_units: pg.sprite.Group[UnitIso]
     global_units: pg.sprite.Group[UnitIso]
-    global_buildings: pg.sprite.Group[UnitIso]
+    global_buildings: RevisionedGroup[UnitIso]
     projectiles: pg.sprite.Group[ProjectileIso]
     particles: pg.sprite.Group[Particle]
     selected_units: pg.sprite.Group[UnitIso]
@@ -75,6 +77,28 @@ class GameDataIso:
     selecting: bool = field(init=False, default=False)
     select_start: IntPoint | None = field(init=False, default=None)
     select_rect: pg.Rect | None = field(init=False, default=None)
+    _placement_validity: tuple[tuple[Point, type, int], bool] | None = field(init=False, default=None)
+    """Last player placement check, as (position, building class, buildings revision) and its result."""
+
+    def is_valid_player_placement(self, position: Point) -> bool:
+        if self.interface is None or self.interface.placing_cls is None or self.player_team is None:
+            return False
+
+        # Memoized, so a stationary placement ghost does not repeat the check every frame
+        key = (position, self.interface.placing_cls, self.global_buildings.revision)
+        if self._placement_validity is not None and self._placement_validity[0] == key:
+            return self._placement_validity[1]
+
+        valid = is_valid_building_position(
+            position=position,
+            team=self.player_team,
+            new_building_cls=self.interface.placing_cls,
+            buildings=self.global_buildings,
+            map_width=self.map_width,
+            map_height=self.map_height,
+        )
+        self._placement_validity = (key, valid)
+        return valid
 
     def cleanup_dead_entities(self) -> None:
         group = self.global_units
@@ -147,30 +171,27 @@ class GameDataIso:
             if hit:
                 projectile.kill()
 
-    def handle_attacks(
-        self,
-        *,
-        team: Team,
-        unit_hash: SpatialHashIso,
-        building_hash: SpatialHashIso,
-        allied_teams: frozenset[Team],
-    ) -> None:
-        """For a team, finds targets in sight range and shoots if in attack range; handles chasing.
-
-        :param team: Attacking team.
+    def handle_attacks(self, *, unit_hash: SpatialHashIso, building_hash: SpatialHashIso) -> None:
+        """For every team in one pass, finds targets in sight range and shoots if in attack range; handles chasing.
+
         :param unit_hash: Unit spatial hash.
         :param building_hash: Building spatial hash.
-        :param allied_teams: Team alliances.
         """
-        armed_entities = [u for u in self.global_units if u.team == team and u.weapons and u.health > 0]
-        armed_entities.extend(b for b in self.global_buildings if b.team == team and b.weapons and b.health > 0)
+        armed_entities = [u for u in self.global_units if u.weapons and u.health > 0]
+        armed_entities.extend(b for b in self.global_buildings if b.weapons and b.health > 0)
+        alliances = self.alliances
         for entity in armed_entities:
+            allied_teams = alliances[entity.team]
             closest_unit_in_range = None
-            min_unit_dist = float("inf")
+            min_unit_dist_sq = float("inf")
             closest_building_in_range = None
-            min_building_dist = float("inf")
+            min_building_dist_sq = float("inf")
             closest_overall = None
-            min_overall_dist = float("inf")
+            min_overall_dist_sq = float("inf")
+            # Squared distances throughout: the nearest candidate is the same, without a square root per candidate
+            px, py = entity.position
+            sight_range_sq = entity.sight_range_sq
+            attack_range_sq = entity.attack_range_sq
             candidates = unit_hash.query(entity.position, entity.sight_range) + building_hash.query(
                 entity.position, entity.sight_range
             )
@@ -178,24 +199,24 @@ class GameDataIso:
                 if obj.team not in allied_teams and obj.health > 0:
                     if obj.is_building:
                         # pyrefly: ignore [bad-argument-type]
-                        closest_pt = closest_point_on_rect(rect=obj.rect, pos=entity.position)
-                        dist = Vector2(closest_pt).distance_to(entity.position)
+                        ox, oy = closest_point_on_rect(rect=obj.rect, pos=entity.position)
                     else:
-                        dist = entity.distance_to(obj.position)
+                        ox, oy = obj.position
 
-                    if dist <= entity.sight_range:
-                        if dist < min_overall_dist:
+                    dist_sq = (ox - px) ** 2 + (oy - py) ** 2
+                    if dist_sq <= sight_range_sq:
+                        if dist_sq < min_overall_dist_sq:
                             closest_overall = obj
-                            min_overall_dist = dist
+                            min_overall_dist_sq = dist_sq
 
-                        if dist <= entity.attack_range:
+                        if dist_sq <= attack_range_sq:
                             if not obj.is_building:
-                                if dist < min_unit_dist:
+                                if dist_sq < min_unit_dist_sq:
                                     closest_unit_in_range = obj
-                                    min_unit_dist = dist
-                            elif dist < min_building_dist:
+                                    min_unit_dist_sq = dist_sq
+                            elif dist_sq < min_building_dist_sq:
                                 closest_building_in_range = obj
-                                min_building_dist = dist
+                                min_building_dist_sq = dist_sq
 
             if closest_unit_in_range:
                 closest_target = closest_unit_in_range
@@ -211,15 +232,14 @@ class GameDataIso:
                 # pyrefly: ignore [bad-argument-type]
                 closest_pt = closest_point_on_rect(rect=closest_target.rect, pos=entity.position)
                 dir_vec = Vector2(closest_pt) - entity.position
-                dist_to_target = dir_vec.length()
             else:
-                dir_vec = Vector2(closest_target.position) - entity.position
-                dist_to_target = dir_vec.length()
+                dir_vec = closest_target.position - entity.position
 
-            if dir_vec.length() > 0:
+            dist_sq = dir_vec.length_squared()
+            if dist_sq > 0:
                 entity.target_turret_angle = math.atan2(dir_vec.y, dir_vec.x)
 
-            if dist_to_target <= entity.attack_range:
+            if dist_sq <= entity.attack_range_sq:
                 entity.shoot(target=closest_target, projectiles=self.projectiles, particles=self.particles)
 
             elif not entity.is_building:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import math
 import random
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, override
 
@@ -22,19 +21,18 @@ from modules.data_2d import (
     STARTING_POSITIONS_EDGE_OFFSET,
     TILE_SIZE,
 )
-from modules.draw_2d import draw_mini_map
+from modules.draw_2d import VEHICLE_PART_SIZES, draw_mini_map, draw_terrain, draw_vehicles_2d
 from modules.game_data import GameData2d
 from modules.game_state import GameState
 from modules.geometry import calculate_formation_positions_2d, get_starting_positions, snap_to_grid
+from modules.particle import draw_particles_2d, update_particles
+from modules.revisioned_group import RevisionedGroup
 from modules.screens import VictoryScreen
 from modules.spatial_hash import SpatialHash2d
 from modules.team import Team, team_to_name
 from modules.unit_stats.unit_stats_2d import get_unit_cost, get_unit_size
 from modules.units.units_2d import Headquarters
 from modules.world import handle_unit_building_collisions, handle_unit_collisions
-from modules.world_2d import (
-    is_valid_building_position,
-)
 
 from .game_manager_generic import _GameManagerGeneric
 
@@ -82,7 +80,7 @@ def _handle_mouse_1_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos
         if isinstance(result, tuple) and result[0] == "sell":
             building_to_sell = result[1]
             if building_to_sell in g.global_buildings:
-                g.global_buildings.remove(building_to_sell)
+                building_to_sell.kill()
 
                 g.player_hq.credits += building_to_sell.cost // 2
                 if g.selected_building == building_to_sell:
@@ -92,19 +90,12 @@ def _handle_mouse_1_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos
 
     if g.interface.placing_cls is not None and not g.interface_rect.collidepoint(mouse_pos):
         snapped = snap_to_grid(pos=world_pos, grid_size=TILE_SIZE)
-        buildings_list = list(g.global_buildings)
         _unit_type = g.interface.placing_cls.__name__
         cost = get_unit_cost(_unit_type)
-        if g.player_hq.credits >= cost and is_valid_building_position(
-            position=snapped,
-            team=g.player_team,
-            new_building_cls=g.interface.placing_cls,
-            buildings=buildings_list,
-            map_width=g.map_width,
-            map_height=g.map_height,
-        ):
+        if g.player_hq.credits >= cost and g.is_valid_player_placement(snapped):
             building = g.interface.placing_cls(snapped, g.player_team, hq=g.player_hq)
             g.global_buildings.add(building)
+            g.player_hq.add_building(building)
             g.player_hq.credits -= cost
             g.interface.placing_cls = None
         else:
@@ -113,15 +104,11 @@ def _handle_mouse_1_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos
         return
 
     target_x, target_y = mouse_pos
-    clicked_building = next(
-        (
-            b
-            for b in g.global_buildings
-            # pyrefly: ignore [bad-argument-type]
-            if b.team == g.player_team and g.camera.get_screen_rect(b.rect).collidepoint(target_x, target_y)
-        ),
-        None,
-    )
+    player_buildings = g.player_hq.buildings.sprites()
+    click_rect = pg.Rect(int(world_pos[0]), int(world_pos[1]), 1, 1)
+    # pyrefly: ignore [bad-specialization]
+    clicked_index = click_rect.collidelist([b.rect for b in player_buildings])
+    clicked_building = player_buildings[clicked_index] if clicked_index != -1 else None
     if clicked_building:
         if g.selected_building and g.selected_building != clicked_building:
             g.selected_building.selected = False
@@ -145,7 +132,7 @@ def _handle_mouse_1_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos
         g.select_rect = pg.Rect(target_x, target_y, 0, 0)
 
 
-def _handle_mouse_2_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos: IntPoint, world_pos: Point) -> None:
+def _handle_mouse_2_click_non_spectator_mode(*, game_data: GameData2d, world_pos: Point) -> None:
     if game_data is None:
         raise ValueError("`game_data` cannot be `None`")
 
@@ -162,23 +149,18 @@ def _handle_mouse_2_click_non_spectator_mode(*, game_data: GameData2d, mouse_pos
     elif g.selected_units:
         # Check for clicked enemy
         clicked_enemy = None
-        unit_list = list(g.global_units)
-        building_list = [b for b in g.global_buildings if b.health > 0]
-        for u in unit_list:
-            # pyrefly: ignore [bad-argument-type]
-            screen_rect = g.camera.get_screen_rect(u.rect)
-            if screen_rect.collidepoint(mouse_pos) and u.team not in g.player_allies and u.health > 0:
-                clicked_enemy = u
-                break
-
-        if not clicked_enemy:
-            for b in building_list:
-                # pyrefly: ignore [bad-argument-type]
-                screen_rect = g.camera.get_screen_rect(b.rect)
-                if screen_rect.collidepoint(mouse_pos) and b.team not in g.player_allies and b.health > 0:
-                    clicked_enemy = b
+        click_rect = pg.Rect(int(world_pos[0]), int(world_pos[1]), 1, 1)
+        for candidates in (g.global_units.sprites(), g.global_buildings.sprites()):
+            # pyrefly: ignore [bad-specialization]
+            for i in click_rect.collidelistall([c.rect for c in candidates]):
+                c = candidates[i]
+                if c.team not in g.player_allies and c.health > 0:
+                    clicked_enemy = c
                     break
 
+            if clicked_enemy:
+                break
+
         if clicked_enemy:
             for unit in g.selected_units:
                 unit.attack_target = clicked_enemy
@@ -226,11 +208,15 @@ def _handle_mouse_1_release_while_selecting(*, game_data: GameData2d, mouse_pos:
             abs(world_end[0] - world_start[0]),
             abs(world_end[1] - world_start[1]),
         )
-        for unit in g.player_units:
-            # pyrefly: ignore [bad-argument-type]
-            if world_rect.colliderect(unit.rect):
-                unit.selected = True
-                g.selected_units.add(unit)
+        if not world_rect.width or not world_rect.height:  # zero-area box selects nothing
+            return
+
+        player_units = g.player_units.sprites()
+        # pyrefly: ignore [bad-specialization]
+        for i in world_rect.collidelistall([u.rect for u in player_units]):
+            unit = player_units[i]
+            unit.selected = True
+            g.selected_units.add(unit)
 
 
 @dataclass(kw_only=True)
@@ -251,72 +237,73 @@ class GameManager2d(_GameManagerGeneric):
                 interface_rect=g.interface_rect,
                 keys=pg.key.get_pressed(),
             )
-            unit_list = list(g.global_units)
+            # Plain list snapshots, built once and shared by the per-frame passes below
+            unit_list = g.global_units.sprites()
+            mobile_unit_list = [u for u in unit_list if not u.is_building]
             building_list = [b for b in g.global_buildings if b.health > 0]
 
-            def update_unit(unit: Unit2d) -> None:
+            # Updates are pure-Python and GIL-bound, so a plain loop beats dispatching each one to a thread pool
+            for unit in mobile_unit_list:
                 unit.update()
 
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [executor.submit(update_unit, unit) for unit in [u for u in unit_list if not u.is_building]]
-                for future in futures:
-                    future.result()
-
             for building in building_list:
-                building_team = building.team
-                friendly_units_for_build = g.unit_groups.get(building_team, pg.sprite.Group())
-                building.update(friendly_units=friendly_units_for_build, all_units=g.global_units)
+                building.update(friendly_units=g.unit_groups[building.team], all_units=g.global_units)
 
             g.projectiles.update()
-            g.particles.update()
+            update_particles(g.particles)
 
-            unit_hash = SpatialHash2d(200)
+            target_hash = SpatialHash2d(200)
             for u in unit_list:
-                unit_hash.add(u)
+                if u.health > 0:
+                    target_hash.add(u)
 
-            building_hash = SpatialHash2d(200)
             for b in building_list:
-                building_hash.add(b)
+                target_hash.add(b)
 
-            handle_unit_collisions(all_units=unit_list, unit_hash=unit_hash)
-            handle_unit_building_collisions(all_units=unit_list, building_hash=building_hash)
+            handle_unit_collisions(all_units=unit_list)
+            handle_unit_building_collisions(all_units=unit_list, building_hash=g.get_building_hash())
             for unit in unit_list:
                 # pyrefly: ignore [missing-attribute]
                 unit.rect.center = unit.position
 
-            for team in g.teams:
-                g.handle_attacks(
-                    team=team, unit_hash=unit_hash, building_hash=building_hash, allied_teams=g.alliances[team]
-                )
+            g.handle_attacks(target_hash=target_hash)
 
             g.handle_projectiles()
             g.cleanup_dead_entities()
 
+            # AIs on the same side share their enemy lists, so build each side's lists once per frame
+            enemies_by_allies: dict[frozenset[Team], tuple[list[Unit2d], list[Unit2d]]] = {}
             for ai in g.ais:
                 their_team = ai.hq.team
                 friendly_units_list = g.unit_groups[their_team].sprites()
-                friendly_buildings_list = [b for b in building_list if b.team == their_team]
-                enemy_units_list = [
-                    u
-                    for team, ug in g.unit_groups.items()
-                    if team not in ai.allies
-                    for u in ug.sprites()
-                    if u.health > 0
-                ]
-                enemy_buildings_list = [b for b in building_list if b.team not in ai.allies]
+                friendly_buildings_list = ai.hq.buildings.sprites()
+                if ai.allies not in enemies_by_allies:
+                    enemies_by_allies[ai.allies] = (
+                        [
+                            u
+                            for team, ug in g.unit_groups.items()
+                            if team not in ai.allies
+                            for u in ug.sprites()
+                            if u.health > 0
+                        ],
+                        [b for team, hq in g.hqs.items() if team not in ai.allies for b in hq.buildings.sprites()],
+                    )
+
+                enemy_units_list, enemy_buildings_list = enemies_by_allies[ai.allies]
                 ai.update(
                     friendly_units=friendly_units_list,
                     friendly_buildings=friendly_buildings_list,
                     enemy_units=enemy_units_list,
                     enemy_buildings=enemy_buildings_list,
                     all_buildings=g.global_buildings,
+                    target_hash=target_hash,
                     map_width=g.map_width,
                     map_height=g.map_height,
                 )
 
             if not g.spectator_mode:
                 ally_units = [u for team in g.player_allies for u in g.unit_groups[team].sprites()]
-                ally_buildings = [b for b in g.global_buildings.sprites() if b.team in g.player_allies]
+                ally_buildings = [b for team in g.player_allies for b in g.hqs[team].buildings.sprites()]
                 g.fog_of_war.update_visibility(ally_units, ally_buildings, g.global_buildings.sprites())
             else:
                 g.fog_of_war.update_visibility([], [], g.global_buildings.sprites())
@@ -349,51 +336,34 @@ class GameManager2d(_GameManagerGeneric):
 
             self.screen.fill(pg.Color("black"))
 
-            zoom = g.camera.zoom
-            tile_sw = TILE_SIZE * zoom
-            tile_sh = TILE_SIZE * zoom
-            start_tx = max(0, int(g.camera.rect.x // TILE_SIZE))
-            start_ty = max(0, int(g.camera.rect.y // TILE_SIZE))
-            end_tx = min(g.map_width // TILE_SIZE, start_tx + int(g.camera.rect.width // TILE_SIZE + 2))
-            end_ty = min(
-                g.map_height // TILE_SIZE,
-                start_ty + int(g.camera.rect.height // TILE_SIZE + 2),
+            draw_terrain(
+                screen=self.screen,
+                camera=g.camera,
+                map_color=g.map_color,
+                map_width=g.map_width,
+                map_height=g.map_height,
             )
-            for tx in range(start_tx, end_tx):
-                wx = tx * TILE_SIZE
-                sx = (wx - g.camera.rect.x) * zoom
-                if sx < -tile_sw or sx > g.camera.width:
-                    continue
-                for ty in range(start_ty, end_ty):
-                    wy = ty * TILE_SIZE
-                    sy = (wy - g.camera.rect.y) * zoom
-                    if sy < -tile_sh or sy > g.camera.height:
-                        continue
-                    var_r = ((tx * 17 + ty * 31) % 41) - 20
-                    var_g = ((tx * 23 + ty * 37) % 41) - 20
-                    var_b = ((tx * 29 + ty * 41) % 41) - 20
-                    tile_r = max(0, min(255, g.map_color.r + var_r))
-                    tile_g = max(0, min(255, g.map_color.g + var_g))
-                    tile_b = max(0, min(255, g.map_color.b + var_b))
-                    pg.draw.rect(self.screen, (tile_r, tile_g, tile_b), (sx, sy, tile_sw, tile_sh))
-                    crater_seed = (tx * 123 + ty * 456) % 100
-                    if crater_seed < 5:
-                        cx = sx + tile_sw / 2
-                        cy = sy + tile_sh / 2
-                        cr = tile_sw / 4
-                        dark_r = max(0, tile_r - 40)
-                        dark_g = max(0, tile_g - 40)
-                        dark_b = max(0, tile_b - 40)
-                        pg.draw.circle(self.screen, (dark_r, dark_g, dark_b), (int(cx), int(cy)), int(cr))
 
             draw_allies = set(g.teams) if g.spectator_mode else g.player_allies
-            fog = g.fog_of_war
+            # Tile-set lookup avoids a method call and bounds checks per drawn object:
+            visible_tiles = g.fog_of_war.visible_tiles
+            fog_tile_size = g.fog_of_war.tile_size
             if not g.spectator_mode:
                 g.fog_of_war.draw(self.screen, g.camera)
 
             mouse_pos = pg.mouse.get_pos() if g.interface else None
+            view_rect = g.camera.rect  # world-space view, for culling offscreen objects before drawing
             for building in building_list:
-                visible = building.team in draw_allies or fog.is_visible(building.position) or building.is_seen
+                # pyrefly: ignore [bad-argument-type]
+                if not view_rect.colliderect(building.rect):
+                    continue
+
+                pos = building.position
+                visible = (
+                    building.team in draw_allies
+                    or building.is_seen
+                    or (int(pos[0] // fog_tile_size), int(pos[1] // fog_tile_size)) in visible_tiles
+                )
                 if building.health > 0 and visible:
                     building.draw(self.screen, g.camera, mouse_pos)
 
@@ -405,16 +375,8 @@ class GameManager2d(_GameManagerGeneric):
                     mouse_pos = pg.mouse.get_pos()
                     ghost_pos = g.camera.screen_to_world(mouse_pos)
                     snapped = snap_to_grid(pos=ghost_pos, grid_size=TILE_SIZE)
-                    buildings_list = list(g.global_buildings)
                     unit_type = g.interface.placing_cls.__name__
-                    valid = is_valid_building_position(
-                        position=snapped,
-                        team=g.player_team,
-                        new_building_cls=g.interface.placing_cls,
-                        buildings=buildings_list,
-                        map_width=g.map_width,
-                        map_height=g.map_height,
-                    )
+                    valid = g.is_valid_player_placement(snapped)
                     width, height = get_unit_size(unit_type)
                     half_w, half_h = width / 2, height / 2
                     temp_rect = pg.Rect(snapped[0] - half_w, snapped[1] - half_h, width, height)
@@ -423,20 +385,48 @@ class GameManager2d(_GameManagerGeneric):
                     line_width = int(2 * g.camera.zoom)
                     pg.draw.rect(self.screen, color, screen_ghost, line_width)
 
-                for unit in [u for u in unit_list if not u.is_building]:
-                    visible = unit.team in draw_allies or fog.is_visible(unit.position)
+                # Vehicles are gathered so all their parts go out in one `fblits` call
+                vehicles = []
+                for unit in mobile_unit_list:
+                    # pyrefly: ignore [bad-argument-type]
+                    if not view_rect.colliderect(unit.rect):
+                        continue
+
+                    pos = unit.position
+                    visible = (
+                        unit.team in draw_allies
+                        or (int(pos[0] // fog_tile_size), int(pos[1] // fog_tile_size)) in visible_tiles
+                    )
                     if unit.health > 0 and visible:
-                        unit.draw(surface=self.screen, camera=g.camera, mouse_pos=mouse_pos)
+                        if unit.__class__.__name__ in VEHICLE_PART_SIZES:
+                            vehicles.append(unit)
+                        else:
+                            unit.draw(surface=self.screen, camera=g.camera, mouse_pos=mouse_pos)
+
+                draw_vehicles_2d(vehicles=vehicles, surface=self.screen, camera=g.camera, mouse_pos=mouse_pos)
             else:
-                for unit in [u for u in unit_list if not u.is_building]:
-                    if unit.health > 0:
-                        unit.draw(surface=self.screen, camera=g.camera)
+                vehicles = []
+                for unit in mobile_unit_list:
+                    # pyrefly: ignore [bad-argument-type]
+                    if unit.health > 0 and view_rect.colliderect(unit.rect):
+                        if unit.__class__.__name__ in VEHICLE_PART_SIZES:
+                            vehicles.append(unit)
+                        else:
+                            unit.draw(surface=self.screen, camera=g.camera)
+
+                draw_vehicles_2d(vehicles=vehicles, surface=self.screen, camera=g.camera)
 
             for projectile in g.projectiles:
-                projectile.draw(self.screen, g.camera)
+                # pyrefly: ignore [bad-argument-type]
+                if view_rect.colliderect(projectile.rect):
+                    projectile.draw(self.screen, g.camera)
 
-            for particle in g.particles:
-                particle.draw_2d(self.screen, g.camera)
+            draw_particles_2d(
+                # pyrefly: ignore [bad-argument-type]
+                particles=[p for p in g.particles if view_rect.colliderect(p.rect)],
+                surface=self.screen,
+                camera=g.camera,
+            )
 
             if g.interface and not g.spectator_mode:
                 g.interface.draw(self.screen)
@@ -467,8 +457,7 @@ class GameManager2d(_GameManagerGeneric):
 
             elif event.type == pg.MOUSEWHEEL:
                 mouse_pos = pg.mouse.get_pos()
-                game_rect = pg.Rect(0, 0, g.camera.width, g.camera.height)
-                if game_rect.collidepoint(mouse_pos):
+                if g.camera.screen_rect.collidepoint(mouse_pos):
                     world_mouse = g.camera.screen_to_world(mouse_pos)
                     g.camera.update_zoom(event.y, world_mouse)
 
@@ -489,7 +478,7 @@ class GameManager2d(_GameManagerGeneric):
                     _handle_mouse_1_click_non_spectator_mode(game_data=g, mouse_pos=event.pos, world_pos=world_pos)
 
                 elif event.button == 3:
-                    _handle_mouse_2_click_non_spectator_mode(game_data=g, mouse_pos=event.pos, world_pos=world_pos)
+                    _handle_mouse_2_click_non_spectator_mode(game_data=g, world_pos=world_pos)
 
             elif event.type == pg.MOUSEMOTION and g.selecting:
                 if g.select_start:
@@ -532,7 +521,7 @@ class GameManager2d(_GameManagerGeneric):
 
         ai_units = pg.sprite.Group()
         global_units = pg.sprite.Group()
-        global_buildings: pg.sprite.Group[Unit2d] = pg.sprite.Group()
+        global_buildings: RevisionedGroup[Unit2d] = RevisionedGroup()
         projectiles = pg.sprite.Group()
         particles = pg.sprite.Group()
         selected_units = pg.sprite.Group()
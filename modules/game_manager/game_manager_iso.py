@@ -30,7 +30,9 @@ from modules.fog_of_war import FogOfWarIso
 from modules.game_data import GameDataIso
 from modules.game_state import GameState
 from modules.geometry import calculate_formation_positions_iso, get_starting_positions, snap_to_grid
+from modules.particle import draw_particles_iso, update_particles
 from modules.production_interface import ProductionInterfaceIso
+from modules.revisioned_group import RevisionedGroup
 from modules.screens import VictoryScreen
 from modules.spatial_hash import SpatialHashIso
 from modules.team import Team, team_to_name
@@ -38,10 +40,7 @@ from modules.terrain_feature_iso import generate_terrain_features
 from modules.unit_stats.unit_stats_iso import get_unit_cost, get_unit_size
 from modules.units.units_iso import Headquarters, Infantry
 from modules.world import handle_unit_building_collisions, handle_unit_collisions
-from modules.world_iso import (
-    find_free_spawn_position,
-    is_valid_building_position,
-)
+from modules.world_iso import find_free_spawn_position
 
 from .game_manager_generic import _GameManagerGeneric
 
@@ -104,18 +103,10 @@ def _handle_mouse_1_click_non_spectator_mode(*, game_data: GameDataIso, mouse_po
 
     if g.interface.placing_cls is not None and not g.interface_rect.collidepoint(mouse_pos):
         snapped = snap_to_grid(pos=world_pos, grid_size=TILE_SIZE)
-        buildings_list = list(g.global_buildings)
         unit_type_str = g.interface.placing_cls.__name__
         cost = get_unit_cost(unit_type_str)
 
-        if g.player_hq.credits >= cost and is_valid_building_position(
-            position=snapped,
-            team=g.player_team,
-            new_building_cls=g.interface.placing_cls,
-            buildings=buildings_list,
-            map_width=g.map_width,
-            map_height=g.map_height,
-        ):
+        if g.player_hq.credits >= cost and g.is_valid_player_placement(snapped):
             building = g.interface.placing_cls(snapped, g.player_team, hq=g.player_hq)
             building.map_width = g.map_width
             building.map_height = g.map_height
@@ -270,24 +261,24 @@ class GameManagerIso(_GameManagerGeneric):
                 interface_rect=g.interface_rect,
                 keys=pg.key.get_pressed(),
             )
-            unit_list = list(g.global_units)
+            # Plain list snapshots, built once and shared by the per-frame passes below
+            unit_list = g.global_units.sprites()
+            mobile_unit_list = [u for u in unit_list if not u.is_building]
             building_list = [b for b in g.global_buildings if b.health > 0]
-            for unit in [u for u in unit_list if not u.is_building]:
-                unit.update(particles=g.particles, global_buildings=list(g.global_buildings), projectiles=g.projectiles)
+            for unit in mobile_unit_list:
+                unit.update(particles=g.particles, global_buildings=building_list, projectiles=g.projectiles)
 
             for building in building_list:
-                building_team = building.team
-                friendly_units_for_build = g.unit_groups.get(building_team, pg.sprite.Group())
                 building.update(
                     particles=g.particles,
-                    friendly_units=friendly_units_for_build,
+                    friendly_units=g.unit_groups[building.team],
                     all_units=g.global_units,
                     global_buildings=g.global_buildings,
                     projectiles=g.projectiles,
                 )
 
             g.projectiles.update()
-            g.particles.update()
+            update_particles(g.particles)
             unit_hash = SpatialHashIso(250)
             for u in unit_list:
                 unit_hash.add(u)
@@ -296,19 +287,13 @@ class GameManagerIso(_GameManagerGeneric):
             for b in building_list:
                 building_hash.add(b)
 
-            handle_unit_collisions(all_units=unit_list, unit_hash=unit_hash)
+            handle_unit_collisions(all_units=unit_list)
             handle_unit_building_collisions(all_units=unit_list, building_hash=building_hash)
             for unit in unit_list:
                 # pyrefly: ignore [missing-attribute]
                 unit.rect.center = unit.position
 
-            for team in g.teams:
-                g.handle_attacks(
-                    team=team,
-                    unit_hash=unit_hash,
-                    building_hash=building_hash,
-                    allied_teams=g.alliances[team],
-                )
+            g.handle_attacks(unit_hash=unit_hash, building_hash=building_hash)
 
             g.handle_projectiles()
             g.cleanup_dead_entities()
@@ -321,12 +306,12 @@ class GameManagerIso(_GameManagerGeneric):
                         tile_x = tx * TILE_SIZE + TILE_SIZE / 2
                         for ty in range(g.num_ty):
                             tile_y = ty * TILE_SIZE + TILE_SIZE / 2
-                            min_dist = float("inf")
+                            min_dist_sq = float("inf")
                             nearest_team = None
                             for team, pos in alive_hqs_pos.items():
-                                dist = math.hypot(tile_x - pos.x, tile_y - pos.y)
-                                if dist < min_dist:
-                                    min_dist = dist
+                                dist_sq = (tile_x - pos.x) ** 2 + (tile_y - pos.y) ** 2
+                                if dist_sq < min_dist_sq:
+                                    min_dist_sq = dist_sq
                                     nearest_team = team
 
                             g.tile_ownership[tx][ty] = nearest_team
@@ -423,7 +408,6 @@ class GameManagerIso(_GameManagerGeneric):
                 )
 
             self.screen.fill(pg.Color("black"))
-            _map_color = g.map_color
             zoom = g.camera.zoom
             min_wx, max_wx, min_wy, max_wy = g.camera.get_render_bounds()
             num_tx = g.map_width // TILE_SIZE
@@ -432,25 +416,15 @@ class GameManagerIso(_GameManagerGeneric):
             start_ty = max(0, int(min_wy // TILE_SIZE))
             end_tx = min(num_tx, int(max_wx // TILE_SIZE) + 2)
             end_ty = min(num_ty, int(max_wy // TILE_SIZE) + 2)
-            for tx in range(start_tx, end_tx):
-                wx = tx * TILE_SIZE
-                for ty in range(start_ty, end_ty):
-                    wy = ty * TILE_SIZE
-                    tile_r = _map_color.r
-                    tile_g = _map_color.g
-                    tile_b = _map_color.b
-                    c1 = (wx, wy)
-                    c2 = (wx + TILE_SIZE, wy)
-                    c3 = (wx + TILE_SIZE, wy + TILE_SIZE)
-                    c4 = (wx, wy + TILE_SIZE)
-                    iso1 = g.camera.world_to_iso(c1, zoom)
-                    iso2 = g.camera.world_to_iso(c2, zoom)
-                    iso3 = g.camera.world_to_iso(c3, zoom)
-                    iso4 = g.camera.world_to_iso(c4, zoom)
-                    pg.draw.polygon(self.screen, (tile_r, tile_g, tile_b), [iso1, iso2, iso3, iso4])
+            if start_tx < end_tx and start_ty < end_ty:
+                # Every tile is the same flat color, so the visible tiles are drawn as the one polygon they tile
+                x0, x1 = start_tx * TILE_SIZE, end_tx * TILE_SIZE
+                y0, y1 = start_ty * TILE_SIZE, end_ty * TILE_SIZE
+                corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+                pg.draw.polygon(self.screen, g.map_color, [g.camera.world_to_iso(c, zoom) for c in corners])
 
             for feature in g.terrain_features:
-                if g.fog_of_war.is_visible(feature.position):
+                if feature.is_on_screen(g.camera) and g.fog_of_war.is_visible(feature.position):
                     feature.draw(surface=self.screen, camera=g.camera)
 
             draw_allies = set(g.teams) if g.spectator_mode else g.player_allies
@@ -461,7 +435,7 @@ class GameManagerIso(_GameManagerGeneric):
             mouse_pos = pg.mouse.get_pos() if g.interface else None
             for building in building_list:
                 visible = building.team in draw_allies or fog.is_visible(building.position) or building.is_seen
-                if building.health > 0 and visible:
+                if building.health > 0 and visible and building.is_on_screen(g.camera):
                     building.draw(surface=self.screen, camera=g.camera, mouse_pos=mouse_pos)
 
             if g.interface and not g.spectator_mode:
@@ -469,16 +443,8 @@ class GameManagerIso(_GameManagerGeneric):
                     mouse_pos = pg.mouse.get_pos()
                     ghost_pos = g.camera.screen_to_world(mouse_pos)
                     snapped = snap_to_grid(pos=ghost_pos, grid_size=TILE_SIZE)
-                    buildings_list = list(g.global_buildings)
                     unit_type = g.interface.placing_cls.__name__
-                    valid = is_valid_building_position(
-                        position=snapped,
-                        team=g.player_team,
-                        new_building_cls=g.interface.placing_cls,
-                        buildings=buildings_list,
-                        map_width=g.map_width,
-                        map_height=g.map_height,
-                    )
+                    valid = g.is_valid_player_placement(snapped)
                     width, height = get_unit_size(unit_type)
                     half_w, half_h = width / 2, height / 2
                     temp_rect = pg.Rect(snapped[0] - half_w, snapped[1] - half_h, width, height)
@@ -487,20 +453,19 @@ class GameManagerIso(_GameManagerGeneric):
                     line_width = int(2 * g.camera.zoom)
                     pg.draw.rect(self.screen, color, screen_ghost, line_width)
 
-                for unit in [u for u in unit_list if not u.is_building]:
+                for unit in mobile_unit_list:
                     visible = unit.team in draw_allies or fog.is_visible(unit.position)
-                    if unit.health > 0 and visible:
+                    if unit.health > 0 and visible and unit.is_on_screen(g.camera):
                         unit.draw(surface=self.screen, camera=g.camera, mouse_pos=mouse_pos)
 
             else:
-                for unit in [u for u in unit_list if not u.is_building]:
-                    if unit.health > 0:
+                for unit in mobile_unit_list:
+                    if unit.health > 0 and unit.is_on_screen(g.camera):
                         unit.draw(surface=self.screen, camera=g.camera)
 
             for projectile in g.projectiles:
                 projectile.draw(self.screen, g.camera)
-            for particle in g.particles:
-                particle.draw_iso(self.screen, g.camera)
+            draw_particles_iso(particles=g.particles, surface=self.screen, camera=g.camera)
 
             if g.interface and not g.spectator_mode:
                 g.interface.draw(self.screen)
@@ -532,8 +497,7 @@ class GameManagerIso(_GameManagerGeneric):
 
             elif event.type == pg.MOUSEWHEEL:
                 mouse_pos = pg.mouse.get_pos()
-                game_rect = pg.Rect(0, 0, g.camera.width, g.camera.height)
-                if game_rect.collidepoint(mouse_pos):
+                if g.camera.screen_rect.collidepoint(mouse_pos):
                     g.camera.update_zoom(event.y, mouse_pos)
 
             elif event.type == pg.MOUSEBUTTONDOWN:
@@ -595,7 +559,7 @@ class GameManagerIso(_GameManagerGeneric):
 
         ai_units: pg.sprite.Group[UnitIso] = pg.sprite.Group()
         global_units = pg.sprite.Group()
-        global_buildings = pg.sprite.Group()
+        global_buildings: RevisionedGroup[UnitIso] = RevisionedGroup()
         projectiles = pg.sprite.Group()
         particles = pg.sprite.Group()
         selected_units = pg.sprite.Group()
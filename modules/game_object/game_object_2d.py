@@ -13,7 +13,7 @@ from modules.particle import PlasmaBurnParticle
 from modules.team import team_to_color
 from modules.typing import ensure_rect, is_rect
 
-from .game_object_generic import GameObjectGeneric
+from .game_object_generic import GameObjectGeneric, get_placeholder_image
 
 if TYPE_CHECKING:
     from pygame.typing import Point
@@ -29,7 +29,7 @@ class GameObject2d(GameObjectGeneric, ABC):
         super().__init__(position=position, team=team)
         # self.body_angle: float = 0
         self.plasma_burn_particles: list[PlasmaBurnParticle] = []
-        self.image = pg.Surface((32, 32))
+        self.image = get_placeholder_image()
 
         if self.rect is None:
             return  # TODO: HQ requires this
@@ -46,6 +46,14 @@ class GameObject2d(GameObjectGeneric, ABC):
         # Euclidean distance to another position.
         return self.position.distance_to(other_pos)
 
+    def distance_squared_to(self, other_pos: Point) -> float:
+        """Squared Euclidean distance to another position; cheaper than `distance_to` for range comparisons.
+
+        :param other_pos: Target position (x, y).
+        :return: Squared distance in pixels.
+        """
+        return self.position.distance_squared_to(other_pos)
+
     def draw(self, surface: pg.Surface, camera: Camera2d) -> None:
         """Base draw: scales image, handles rotation if needed, selection circle, health bar, particles.
 
@@ -57,7 +65,7 @@ class GameObject2d(GameObjectGeneric, ABC):
             raise TypeError("self.rect` is unexpected non-`Rect` type")
 
         screen_rect = camera.get_screen_rect(self.rect)
-        if not screen_rect.colliderect((0, 0, camera.width, camera.height)):
+        if not screen_rect.colliderect(camera.screen_rect):
             return
 
         screen_pos = camera.world_to_screen(self.position)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pygame as pg
@@ -13,6 +14,36 @@ if TYPE_CHECKING:
 
     from modules.team import Team
 
+HEALTH_BAR_WIDTH = 25
+"""Health bar width in pixels, excluding its black border."""
+HEALTH_BAR_HEIGHT = 4
+"""Health bar height in pixels, excluding its black border."""
+
+
+@cache
+def _get_health_bar(*, fill_width: int, healthy: bool) -> pg.Surface:
+    """Health bar image, including its 1px black border.
+
+    :param fill_width: Width of the filled part in pixels.
+    :param healthy: If True, the fill is green, otherwise red.
+    :return: Bar surface.
+    """
+    bar = pg.Surface((HEALTH_BAR_WIDTH + 2, HEALTH_BAR_HEIGHT + 2))
+    bar.fill((0, 0, 0))
+    color = (0, 255, 0) if healthy else (255, 0, 0)
+    pg.draw.rect(bar, color, (1, 1, fill_width, HEALTH_BAR_HEIGHT))
+    pg.draw.rect(bar, (255, 255, 255), (1, 1, HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT), 1)
+    return bar
+
+
+@cache
+def get_placeholder_image() -> pg.Surface:
+    """Image every entity starts with until it sets its own; shared, so it must not be modified.
+
+    :return: Blank 32x32 surface.
+    """
+    return pg.Surface((32, 32))
+
 
 class GameObjectGeneric(pg.sprite.Sprite, ABC):
     """Abstract generic base for all entities.
@@ -31,3 +62,24 @@ class GameObjectGeneric(pg.sprite.Sprite, ABC):
         self.under_attack_timer = 0
         self.selected = False
         self.is_seen = False
+
+    def get_health_bar_blit(self, *, center_x: float, top: float) -> tuple[pg.Surface, Point]:
+        """Returns the health bar image and its position, centered above the entity.
+
+        :param center_x: Screen x of the entity's center.
+        :param top: Screen y of the entity's top edge; the bar sits 2px above it.
+        :return: (image, position) pair for `Surface.blit`/`Surface.fblits`.
+        """
+        health_ratio = self.health / self.max_health
+        fill_width = min(max(int(HEALTH_BAR_WIDTH * health_ratio), 0), HEALTH_BAR_WIDTH)
+        bar = _get_health_bar(fill_width=fill_width, healthy=health_ratio > 0.5)
+        return bar, (center_x - HEALTH_BAR_WIDTH / 2 - 1, top - HEALTH_BAR_HEIGHT - 3)
+
+    def blit_health_bar(self, surface: pg.Surface, *, center_x: float, top: float) -> None:
+        """Draws the health bar centered above the entity.
+
+        :param surface: Surface to draw on.
+        :param center_x: Screen x of the entity's center.
+        :param top: Screen y of the entity's top edge; the bar sits 2px above it.
+        """
+        surface.blit(*self.get_health_bar_blit(center_x=center_x, top=top))
@@ -6,13 +6,11 @@ import random
 from abc import ABC
 from typing import TYPE_CHECKING
 
-import pygame as pg
-
 from modules.data_iso import MAP_HEIGHT, MAP_WIDTH, PLASMA_BURN_DURATION, PLASMA_BURN_PARTICLE_COUNT
 from modules.particle import PlasmaBurnParticle
 from modules.team import team_to_color
 
-from .game_object_generic import GameObjectGeneric
+from .game_object_generic import GameObjectGeneric, get_placeholder_image
 
 if TYPE_CHECKING:
     from pygame.typing import Point
@@ -29,13 +27,16 @@ class GameObjectIso(GameObjectGeneric, ABC):
         self.plasma_burn_particles: list[PlasmaBurnParticle] = []
         self.map_width = MAP_WIDTH
         self.map_height = MAP_HEIGHT
-        self.image = pg.Surface((32, 32))
+        self.image = get_placeholder_image()
         if self.image is not None:  # TODO: type guard - not sure why this can be None
             self.rect = self.image.get_rect(center=position)
 
     def distance_to(self, other_pos: Point) -> float:
         return self.position.distance_to(other_pos)
 
+    def distance_squared_to(self, other_pos: Point) -> float:
+        return self.position.distance_squared_to(other_pos)
+
     def take_damage(self, damage: int) -> bool:
         self.health -= damage
         self.under_attack = True
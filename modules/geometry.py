@@ -7,7 +7,6 @@ import random
 from typing import TYPE_CHECKING
 
 import pygame as pg
-from pygame.math import Vector2
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -38,14 +37,15 @@ def calculate_formation_positions_2d(*, center: Point, num_units: int) -> list[t
     if num_units == 0:
         return []
 
-    positions = []
     spacing = 30
     cols = max(1, int(math.sqrt(num_units)))
+    # Top left slot; every other slot is a whole number of spacings from it
+    x0 = center[0] - cols / 2 * spacing
+    y0 = center[1] - num_units / cols / 2 * spacing
+    positions = []
     for i in range(num_units):
-        row, col = i // cols, i % cols
-        x = center[0] + (col - cols / 2) * spacing
-        y = center[1] + (row - num_units / cols / 2) * spacing
-        positions.append((x, y))
+        row, col = divmod(i, cols)
+        positions.append((x0 + col * spacing, y0 + row * spacing))
 
     return positions
 
@@ -62,29 +62,36 @@ def calculate_formation_positions_iso(
         return []
 
     positions = []
+    rand = random.random
     if formation_type == "line":
         cols = max(1, int(math.sqrt(num_units)))
         rows = (num_units + cols - 1) // cols
+        jitter = spacing * 0.1
+        x0 = center[0] - cols / 2 * spacing - jitter
+        y0 = center[1] - rows / 2 * spacing - jitter
         for i in range(num_units):
-            row, col = i // cols, i % cols
-            x = center[0] + (col - cols / 2) * spacing
-            y = center[1] + (row - rows / 2) * spacing
-            x += random.uniform(-spacing * 0.1, spacing * 0.1)
-            y += random.uniform(-spacing * 0.1, spacing * 0.1)
-            positions.append((x, y))
+            row, col = divmod(i, cols)
+            positions.append((x0 + col * spacing + rand() * 2 * jitter, y0 + row * spacing + rand() * 2 * jitter))
 
     elif formation_type == "v":
-        apex = Vector2(target)
-        base = Vector2(center)
-        dir_to_target = (apex - base).normalize() if (apex - base).length() > 0 else Vector2(1, 0)
-        perp = dir_to_target.rotate_rad(math.pi / 2)
+        base_x, base_y = center
+        dx, dy = target[0] - base_x, target[1] - base_y
+        length = math.hypot(dx, dy)
+        dir_x, dir_y = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+        # Perpendicular is the direction rotated by 90 degrees
+        perp_x, perp_y = -dir_y, dir_x
         half = (num_units - 1) / 2
+        offset_step = spacing * 0.5
+        depth_step = spacing * 0.7 / num_units
         for i in range(num_units):
-            offset = (i - half) * spacing * 0.5
-            depth = spacing * (i / num_units) * 0.7
-            pos = base + perp * offset + dir_to_target * depth
-            pos += Vector2(random.uniform(-5, 5), random.uniform(-5, 5))
-            positions.append((pos.x, pos.y))
+            offset = (i - half) * offset_step
+            depth = i * depth_step
+            positions.append(
+                (
+                    base_x + perp_x * offset + dir_x * depth + rand() * 10 - 5,
+                    base_y + perp_y * offset + dir_y * depth + rand() * 10 - 5,
+                )
+            )
 
     return positions
 
@@ -140,16 +147,18 @@ def check_collision(*, entity: Unit2d | UnitIso, projectile: ProjectileGeneric)
     :param projectile: ProjectileGeneric to check.
     :return: True if collision detected.
     """
+    if hasattr(entity, "radius"):
+        reach = entity.radius + max(projectile.length, projectile.width) / 2
+        dx = entity.position.x - projectile.position.x
+        dy = entity.position.y - projectile.position.y
+        return dx * dx + dy * dy < reach * reach
+
     proj_rect = pg.Rect(
         projectile.position.x - projectile.length / 2,
         projectile.position.y - projectile.width / 2,
         projectile.length,
         projectile.width,
     )
-    if hasattr(entity, "radius"):
-        dist = entity.distance_to(projectile.position)
-        return dist < (entity.radius + max(projectile.length, projectile.width) / 2)
-
     # pyrefly: ignore [missing-attribute]
     return entity.rect.colliderect(proj_rect)
 
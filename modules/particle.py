@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, override
 
 import pygame as pg
@@ -11,6 +12,8 @@ from pygame.math import Vector2
 from modules.team import team_to_color
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pygame.typing import Point
 
     from modules.camera import Camera2d, CameraIso
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 
 PARTICLES_PER_EXPLOSION_ISO = 3
 PARTICLES_PER_EXPLOSION_2D = 20
+PARTICLE_ALPHA_STEP = 16
+"""Particles fade in steps of this much alpha, so a few faded images per size and color serve every particle."""
 
 
 def create_explosion_2d(
@@ -61,6 +66,75 @@ def create_explosion_iso(
         particles.add(Particle(position, vx, vy, size, color, lifetime))
 
 
+@lru_cache(maxsize=64)
+def _create_particle_image(size: int, rgba: tuple[int, int, int, int]) -> pg.Surface:
+    """Creates a circular particle image, shared by all particles of the same size and color.
+
+    :param size: Particle size in pixels.
+    :param rgba: Particle color.
+    :return: Particle surface; must not be modified by callers.
+    """
+    image = pg.Surface((size, size), pg.SRCALPHA)
+    pg.draw.circle(image, rgba, (size // 2, size // 2), size // 2)
+    return image.convert_alpha()
+
+
+@lru_cache(maxsize=2048)
+def _create_faded_particle_image(
+    size: int, rgba: tuple[int, int, int, int], scaled_size: tuple[int, int], alpha: int
+) -> pg.Surface:
+    """Creates a zoomed, faded copy of a particle image. Fading is deterministic in age, so copies are reused.
+
+    The fade is multiplied into the per-pixel alpha rather than set as surface alpha, which blits faster.
+
+    :param size: Particle size in pixels.
+    :param rgba: Particle color.
+    :param scaled_size: Zoomed image size.
+    :param alpha: Fade alpha, multiplied into the image alpha.
+    :return: Particle surface; must not be modified by callers.
+    """
+    image = pg.transform.smoothscale(_create_particle_image(size, rgba), scaled_size)
+    image.fill((255, 255, 255, alpha), special_flags=pg.BLEND_RGBA_MULT)
+    return image
+
+
+def update_particles(particles: pg.sprite.Group[Particle]) -> None:
+    """Updates a group of plain particles in one loop, as `Particle.update` would, removing expired ones together.
+
+    Avoids a method call and `kill` per particle. Subclasses with their own `update` must not be in the group.
+
+    :param particles: Particle group to update.
+    """
+    expired = []
+    for particle in particles.sprites():
+        position = particle.position
+        position.x += particle.vx
+        position.y += particle.vy
+        particle.age = age = particle.age + 1
+        particle.alpha = int(255 * (1 - age / particle.lifetime))
+        # pyrefly: ignore [missing-attribute]
+        particle.rect.center = position
+        if age >= particle.lifetime:
+            expired.append(particle)
+
+    if expired:
+        particles.remove(*expired)
+
+
+def draw_particles_2d(*, particles: Iterable[Particle], surface: pg.Surface, camera: Camera2d) -> None:
+    """Draws particles with a single `Surface.blits` call.
+
+    :param particles: Particles to draw.
+    :param surface: Surface to draw on.
+    :param camera: Camera2d for transformation.
+    """
+    surface.blits([blit for p in particles if (blit := p.get_blit_2d(camera)) is not None], doreturn=False)
+
+
+def draw_particles_iso(*, particles: Iterable[Particle], surface: pg.Surface, camera: CameraIso) -> None:
+    surface.blits([blit for p in particles if (blit := p.get_blit_iso(camera)) is not None], doreturn=False)
+
+
 class Particle(pg.sprite.Sprite):
     """Base particle: circular sprite with velocity, fading alpha over lifetime.
 
@@ -84,10 +158,12 @@ class Particle(pg.sprite.Sprite):
         self.color = color
         self.lifetime = lifetime * 10
         self.age = 0
-        self.image = pg.Surface((size, size), pg.SRCALPHA)
-        if self.image is not None:  # TODO: type guard - not sure why this can be None
-            pg.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-            self.rect = self.image.get_rect(center=self.position)
+        self.alpha = 255
+        # The image is shared between particles, so fading is applied to the scaled copy at draw time.
+        self.rgba = tuple(color)
+        image = _create_particle_image(size, self.rgba)
+        self.image = image
+        self.rect = image.get_rect(center=self.position)
 
     @override
     def update(self, *args: Any, **kwargs: Any) -> None:
@@ -95,9 +171,7 @@ class Particle(pg.sprite.Sprite):
         self.position.x += self.vx
         self.position.y += self.vy
         self.age += 1
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        if self.image is not None:  # TODO: type guard - not sure why this can be None
-            self.image.set_alpha(alpha)
+        self.alpha = int(255 * (1 - self.age / self.lifetime))
 
         if self.rect is not None:  # TODO: type guard - not sure why this can be None
             self.rect.center = self.position
@@ -105,52 +179,64 @@ class Particle(pg.sprite.Sprite):
         if self.age >= self.lifetime:
             self.kill()
 
-    def draw_2d(self, surface: pg.Surface, camera: Camera2d) -> None:
-        """Draws scaled and positioned particle if on-screen.
+    @property
+    def faded_alpha(self) -> int:
+        """Current alpha, rounded to a multiple of `PARTICLE_ALPHA_STEP` and clamped to 0..255."""
+        return max(0, min(255, round(self.alpha / PARTICLE_ALPHA_STEP) * PARTICLE_ALPHA_STEP))
+
+    def get_blit_2d(self, camera: Camera2d) -> tuple[pg.Surface, Point] | None:
+        """Returns the scaled particle image and its screen position, or None if off-screen.
 
-        :param surface: Surface to draw on.
         :param camera: Camera2d for transformation.
+        :return: (image, position) pair for `Surface.blit`/`Surface.blits`.
         """
         if self.rect is not None and isinstance(
             self.rect, pg.Rect
         ):  # TODO: type guard - not sure why this can be None | FRect
             screen_rect = camera.get_screen_rect(self.rect)
-            if not screen_rect.colliderect((0, 0, camera.width, camera.height)):
-                return
+            if not screen_rect.colliderect(camera.screen_rect):
+                return None
 
         screen_pos = camera.world_to_screen(self.position)
-        if self.image is not None:  # TODO: type guard - not sure why this can be None
-            scaled_size = (
-                int(self.image.get_width() * camera.zoom),
-                int(self.image.get_height() * camera.zoom),
-            )
-            if scaled_size[0] > 0 and scaled_size[1] > 0:
-                scaled_image = pg.transform.smoothscale(self.image, scaled_size)
-                offset_x = scaled_size[0] / 2
-                offset_y = scaled_size[1] / 2
-                blit_pos = (screen_pos[0] - offset_x, screen_pos[1] - offset_y)
-                surface.blit(scaled_image, blit_pos)
+        scaled_size = (int(self.size * camera.zoom), int(self.size * camera.zoom))
+        if scaled_size[0] <= 0 or scaled_size[1] <= 0:
+            return None
 
-    def draw_iso(self, surface: pg.Surface, camera: CameraIso) -> None:
+        scaled_image = _create_faded_particle_image(self.size, self.rgba, scaled_size, self.faded_alpha)
+        blit_pos = (screen_pos[0] - scaled_size[0] / 2, screen_pos[1] - scaled_size[1] / 2)
+        return scaled_image, blit_pos
+
+    def draw_2d(self, surface: pg.Surface, camera: Camera2d) -> None:
+        """Draws scaled and positioned particle if on-screen.
+
+        :param surface: Surface to draw on.
+        :param camera: Camera2d for transformation.
+        """
+        blit = self.get_blit_2d(camera)
+        if blit is not None:
+            surface.blit(*blit)
+
+    def get_blit_iso(self, camera: CameraIso) -> tuple[pg.Surface, Point] | None:
         if self.rect is not None and isinstance(
             self.rect, pg.Rect
         ):  # TODO: type guard - not sure why this can be None | FRect
             screen_rect = camera.get_screen_rect(self.rect)
-            if not screen_rect.colliderect((0, 0, camera.width, camera.height)):
-                return
+            if not screen_rect.colliderect(camera.screen_rect):
+                return None
 
         screen_pos = camera.world_to_iso(self.position, camera.zoom)
-        if self.image is not None:  # TODO: type guard - not sure why this can be None
-            scaled_size = (
-                int(self.image.get_width() * camera.zoom),
-                int(self.image.get_height() * camera.zoom),
-            )
-            if scaled_size[0] > 0 and scaled_size[1] > 0:
-                scaled_image = pg.transform.smoothscale(self.image, scaled_size)
-                offset_x = scaled_size[0] / 2
-                offset_y = scaled_size[1] / 2
-                blit_pos = (screen_pos[0] - offset_x, screen_pos[1] - offset_y)
-                surface.blit(scaled_image, blit_pos)
+        scaled_size = (int(self.size * camera.zoom), int(self.size * camera.zoom))
+        if scaled_size[0] <= 0 or scaled_size[1] <= 0:
+            return None
+
+        scaled_image = _create_faded_particle_image(self.size, self.rgba, scaled_size, self.faded_alpha)
+        blit_pos = (screen_pos[0] - scaled_size[0] / 2, screen_pos[1] - scaled_size[1] / 2)
+        return scaled_image, blit_pos
+
+    def draw_iso(self, surface: pg.Surface, camera: CameraIso) -> None:
+        blit = self.get_blit_iso(camera)
+        if blit is not None:
+            surface.blit(*blit)
 
 
 class PlasmaBurnParticle(Particle):
@@ -178,9 +264,7 @@ class PlasmaBurnParticle(Particle):
         rotated_offset = self.offset.rotate_rad(-body_angle)
         self.position = self.entity.position + rotated_offset
         self.age += 1
-        alpha = int(255 * (1 - self.age / self.initial_lifetime))
-        if self.image is not None:  # TODO: type guard - not sure why this can be None
-            self.image.set_alpha(alpha)
+        self.alpha = int(255 * (1 - self.age / self.initial_lifetime))
 
         if self.rect is not None:  # TODO: type guard - not sure why this can be None
             self.rect.center = self.position
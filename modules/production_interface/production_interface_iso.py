@@ -9,7 +9,7 @@ import pygame as pg
 
 from modules.data import UNIT_BUTTON_LABELS
 from modules.data_iso import CONSOLE_HEIGHT, SCREEN_HEIGHT, SCREEN_WIDTH
-from modules.fonts import FONT_MEDIUM
+from modules.fonts import render_text
 from modules.unit_stats.unit_stats_iso import get_unit_cost
 from modules.units.units_iso import Barracks, Hangar, Headquarters, PowerPlant, Refinery, Turret, WarFactory
 
@@ -98,19 +98,19 @@ class ProductionInterfaceIso:
         self.surface.fill(self.FILL_COLOR)
         pg.draw.rect(self.surface, self.LINE_COLOR, self.surface.get_rect(), width=2)
         self.surface.blit(
-            FONT_MEDIUM.render(f"Credits: ${self.hq.credits}", True, pg.Color("white")),
+            render_text(f"Credits: ${self.hq.credits}"),
             (self.MARGIN_X, self.CREDITS_POS_Y),
         )
-        power_color = pg.Color("green") if self.hq.has_enough_power else pg.Color("red")
+        power_color = "green" if self.hq.has_enough_power else "red"
         self.surface.blit(
-            FONT_MEDIUM.render(f"Power: {self.hq.power_output}/{self.hq.power_usage}", True, power_color),
+            render_text(f"Power: {self.hq.power_output}/{self.hq.power_usage}", power_color),
             (self.MARGIN_X, self.POWER_POS_Y),
         )
         for label, rect in self.top_rects.items():
             color = self.INACTIVE_TAB_COLOR
             pg.draw.rect(self.surface, color, rect, border_radius=self.BUTTON_RADIUS)
             pg.draw.rect(self.surface, self.LINE_COLOR, rect, 1)
-            text_surf = FONT_MEDIUM.render(label, True, pg.Color("white"))
+            text_surf = render_text(label)
             text_rect = text_surf.get_rect(center=rect.center)
             self.surface.blit(text_surf, text_rect)
 
@@ -120,35 +120,32 @@ class ProductionInterfaceIso:
             can_produce = self.hq.credits >= cost
             color = self.ACTION_ALLOWED_COLOR if can_produce else self.ACTION_BLOCKED_COLOR
             pg.draw.rect(self.surface, color, rect, border_radius=self.BUTTON_RADIUS)
-            label_surf = FONT_MEDIUM.render(label, True, pg.Color("white"))
+            label_surf = render_text(label)
             label_rect = label_surf.get_rect(x=rect.x + 5, y=rect.y + 5)
             self.surface.blit(label_surf, label_rect)
-            cost_surf = FONT_MEDIUM.render(f"({cost})", True, pg.Color("white"))
+            cost_surf = render_text(f"({cost})")
             cost_rect = cost_surf.get_rect(x=rect.x + 5, y=rect.y + 25)
             self.surface.blit(cost_surf, cost_rect)
         if hasattr(self.producer, "production_queue") and self.producer.production_queue:
             queue_y = self.PRODUCTION_QUEUE_POS_Y
-            self.surface.blit(FONT_MEDIUM.render("Queue:", True, pg.Color("white")), (self.MARGIN_X, queue_y))
+            self.surface.blit(render_text("Queue:"), (self.MARGIN_X, queue_y))
             queue_y += 20
             for i, item in enumerate(self.producer.production_queue):
                 unit_type = item["unit_type"] if "unit_type" in item else item["cls"].__name__
                 repeat_text = " [R]" if item["repeat"] else ""
                 text = f"{UNIT_BUTTON_LABELS.get(unit_type, unit_type)}{repeat_text}"
-                self.surface.blit(FONT_MEDIUM.render(text, True, pg.Color("white")), (self.MARGIN_X + 10, queue_y))
+                self.surface.blit(render_text(text), (self.MARGIN_X + 10, queue_y))
                 repeat_rect = pg.Rect(self.MARGIN_X + 150, queue_y, 20, 20)
                 repeat_color = self.ACTION_ALLOWED_COLOR if item["repeat"] else self.INACTIVE_TAB_COLOR
                 pg.draw.rect(self.surface, repeat_color, repeat_rect, border_radius=2)
                 if item["repeat"]:
                     self.surface.blit(
-                        FONT_MEDIUM.render("R", True, pg.Color("white")),
+                        render_text("R"),
                         (repeat_rect.x + 6, repeat_rect.y + 3),
                     )
                 if i == 0 and self.producer.production_timer is not None:
-                    progress = (
-                        1 - (self.producer.production_timer / 90.0)
-                        if "Hangar" in str(type(self.producer))
-                        else 1 - (self.producer.production_timer / 60.0)
-                    )
+                    total_time = 90.0 if isinstance(self.producer, Hangar) else 60.0
+                    progress = 1 - self.producer.production_timer / total_time
                     bar_width = 100 * progress
                     pg.draw.rect(
                         self.surface,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 from abc import ABC
 from collections import deque
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Any, override
 
 import pygame as pg
@@ -18,6 +19,39 @@ if TYPE_CHECKING:
     from modules.team import Team
     from modules.unit_stats.unit_stats_generic import WeaponStats
 
+PROJECTILE_ANGLE_STEP = 5
+"""Projectiles are drawn rotated to the nearest multiple of this many degrees, so rotations can be cached."""
+
+
+@cache
+def _create_projectile_image(*, team: Team, length: int, width: int) -> pg.Surface:
+    """Tapered projectile image, fading in from tail to tip. Shared by all projectiles of a team and size.
+
+    :param team: Firing team.
+    :param length: Image length in pixels.
+    :param width: Image width in pixels.
+    :return: Projectile surface.
+    """
+    image = pg.Surface((length, width), pg.SRCALPHA)
+    _color = team_to_color[team]
+    for i in range(length):
+        alpha = int(255 * (i / length))
+        pg.draw.line(image, (_color.r, _color.g, _color.b, alpha), (i, 0), (i, width), 1)
+
+    return image.convert_alpha()
+
+
+@lru_cache(maxsize=1024)
+def _get_rotated_image(image: pg.Surface, size: tuple[int, int], degrees: int) -> pg.Surface:
+    """Scales and rotates a shared projectile image, caching the result.
+
+    :param image: Projectile image, shared per team and size.
+    :param size: Scaled size.
+    :param degrees: Counterclockwise rotation in degrees.
+    :return: Transformed surface.
+    """
+    return pg.transform.rotate(pg.transform.smoothscale(image, size), degrees)
+
 
 class ProjectileGeneric(pg.sprite.Sprite, ABC):
     """Generic abstract Projectile class for bullets/rockets; handles trailing effect and collision detection.
@@ -55,16 +89,10 @@ class ProjectileGeneric(pg.sprite.Sprite, ABC):
 
         self.angle = math.atan2(self.direction.y, self.direction.x)
         self.age = 0
-        self.image = pg.Surface((self.length, self.width), pg.SRCALPHA)
-        if self.image is None:  # TODO: type guard - not sure why needed
-            raise ValueError("self.image` is unexpectedly `None`")
-
-        _color = team_to_color[team]
-        for i in range(self.length):
-            alpha = int(255 * (i / self.length))
-            pg.draw.line(self.image, (_color.r, _color.g, _color.b, alpha), (i, 0), (i, self.width), 1)
-
-        self.rect = self.image.get_rect(center=self.position)
+        self.degrees = round(-math.degrees(self.angle) / PROJECTILE_ANGLE_STEP) * PROJECTILE_ANGLE_STEP
+        image = _create_projectile_image(team=team, length=self.length, width=self.width)
+        self.image = image
+        self.rect = image.get_rect(center=self.position)
 
     @override
     def update(self, *args: Any, **kwargs: Any) -> None:
@@ -79,3 +107,15 @@ class ProjectileGeneric(pg.sprite.Sprite, ABC):
 
         if self.age >= self.lifetime:
             self.kill()
+
+    def get_screen_image(self, zoom: float) -> pg.Surface | None:
+        """Returns the image scaled by zoom and rotated to the projectile's heading.
+
+        :param zoom: Camera zoom.
+        :return: Transformed surface, or None if it would be empty.
+        """
+        size = (int(self.length * zoom), int(self.width * zoom))
+        if self.image is None or size[0] <= 0 or size[1] <= 0:
+            return None
+
+        return _get_rotated_image(self.image, size, self.degrees)
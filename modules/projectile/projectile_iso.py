@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
 import pygame as pg
@@ -39,30 +38,24 @@ class ProjectileIso(ProjectileGeneric):
             raise TypeError("self.rect` is unexpected non-`Rect` type")
 
         screen_rect = camera.get_screen_rect(self.rect)
-        if not screen_rect.colliderect((0, 0, camera.width, camera.height)):
+        if not screen_rect.colliderect(camera.screen_rect):
             return
 
         screen_pos = camera.world_to_iso(self.position, camera.zoom)
         if len(self.trail) > 1:
             trail_positions = [camera.world_to_iso(pos, camera.zoom) for pos in self.trail]
             num_segments = len(trail_positions) - 1
+            c = team_to_color[self.team]
             for i in range(num_segments):
                 p1 = trail_positions[i]
                 p2 = trail_positions[i + 1]
                 age_factor = i / max(1, num_segments - 1)
-                c = pg.Color(team_to_color[self.team])
                 intensity = 0.3 + 0.7 * age_factor
                 trail_color = (int(c.r * intensity), int(c.g * intensity), int(c.b * intensity))
                 trail_width = max(1, int(self.width * camera.zoom * (0.2 + 0.3 * age_factor)))
                 pg.draw.line(surface, trail_color, p1, p2, trail_width)
 
-        scaled_length = int(self.length * camera.zoom)
-        scaled_width = int(self.width * camera.zoom)
-        if self.image is None:
-            raise TypeError("self.image` is unexpectedly `None`")
-
-        if scaled_length > 0 and scaled_width > 0:
-            scaled_image = pg.transform.smoothscale(self.image, (scaled_length, scaled_width))
-            rotated_image = pg.transform.rotate(scaled_image, -math.degrees(self.angle))
+        rotated_image = self.get_screen_image(camera.zoom)
+        if rotated_image is not None:
             rot_rect = rotated_image.get_rect(center=screen_pos)
             surface.blit(rotated_image, rot_rect.topleft)
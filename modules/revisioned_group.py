@@ -0,0 +1,26 @@
+"""Implements a sprite Group that counts membership changes."""
+
+from __future__ import annotations
+
+from typing import override
+
+import pygame as pg
+
+
+class RevisionedGroup[T: pg.sprite.Sprite](pg.sprite.Group[T]):
+    """Sprite Group with a `revision` counter, bumped whenever a sprite is added or removed.
+
+    Lets callers cache results derived from the group's membership, e.g. building placement validity.
+    """
+
+    revision: int = 0
+
+    @override
+    def add_internal(self, sprite: T, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self.revision += 1
+
+    @override
+    def remove_internal(self, sprite: T) -> None:
+        super().remove_internal(sprite)
+        self.revision += 1
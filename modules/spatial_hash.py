@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pygame.math import Vector2
-    from pygame.typing import IntPoint
+    from pygame.typing import IntPoint, Point
 
     from modules.units import Unit2d, UnitIso
 
@@ -15,6 +16,7 @@ class SpatialHash2d:
     """Simple grid-based spatial index for efficient nearby object queries.
 
     Uses a dictionary of grid cells to bucket objects by position.
+    Each cell stores (x, y, object) entries, so queries read positions as of `add` without per-object attribute loads.
     """
 
     def __init__(self, cell_size: int = 200) -> None:
@@ -23,26 +25,31 @@ class SpatialHash2d:
         :param cell_size: Size of each grid cell (default: 200).
         """
         self.cell_size = cell_size
-        self.grid: dict[IntPoint, list[Unit2d]] = {}
+        self.grid: dict[IntPoint, list[tuple[float, float, Unit2d]]] = {}
 
-    def query(self, pos: Vector2, radius: float) -> list[Unit2d]:
-        """Returns all objects within radius of pos, checking neighboring cells.
+    def query(self, pos: Point, radius: float) -> list[Unit2d]:
+        """Returns all objects within radius of pos, checking the neighboring cells that radius spans.
 
-        :param pos: Query position (Vector2).
+        :param pos: Query position (x, y).
         :param radius: Search radius.
         :return: List of nearby objects.
         """
-        cx = int(pos.x // self.cell_size)
-        cy = int(pos.y // self.cell_size)
-        keys = set()
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                keys.add((cx + dx, cy + dy))
-
+        px, py = pos
+        cx = int(px // self.cell_size)
+        cy = int(py // self.cell_size)
+        r = max(1, math.ceil(radius / self.cell_size))
+        r2 = radius * radius
         nearby = []
-        for k in keys:
-            if k in self.grid:
-                nearby.extend(o for o in self.grid[k] if o.distance_to(pos) <= radius)
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                cell = self.grid.get((cx + dx, cy + dy))
+                if cell is None:
+                    continue
+
+                for ox, oy, o in cell:
+                    # Plain float math; avoids a Vector2 method call per candidate
+                    if (ox - px) ** 2 + (oy - py) ** 2 <= r2:
+                        nearby.append(o)
 
         return nearby
 
@@ -51,11 +58,12 @@ class SpatialHash2d:
 
         :param obj: Object with a 'position' attribute (Vector2).
         """
+        x, y = obj.position
         key = self._get_key(obj.position)
         if key not in self.grid:
             self.grid[key] = []
 
-        self.grid[key].append(obj)
+        self.grid[key].append((x, y, obj))
 
     def _get_key(self, pos: Vector2) -> tuple[int, int]:
         """Computes the grid cell key for a position.
@@ -71,23 +79,22 @@ class SpatialHashIso:
         self.cell_size = cell_size
         self.grid: dict[IntPoint, list[UnitIso]] = {}
 
-    def query(self, pos: Vector2, radius: float) -> list[UnitIso]:
-        cx = int(pos.x // self.cell_size)
-        cy = int(pos.y // self.cell_size)
-        keys = set()
+    def query(self, pos: Point, radius: float) -> list[UnitIso]:
+        px, py = pos
+        cx = int(px // self.cell_size)
+        cy = int(py // self.cell_size)
         r = int(radius / self.cell_size) + 1
+        r2 = radius * radius
+        nearby = []
         for dx in range(-r, r + 1):
             for dy in range(-r, r + 1):
-                keys.add((cx + dx, cy + dy))
+                cell = self.grid.get((cx + dx, cy + dy))
+                if cell is None:
+                    continue
 
-        nearby = []
-        r2 = radius * radius
-        for k in keys:
-            if k in self.grid:
-                for o in self.grid[k]:
-                    dx = o.position.x - pos.x
-                    dy = o.position.y - pos.y
-                    if dx * dx + dy * dy <= r2:
+                for o in cell:
+                    ox, oy = o.position
+                    if (ox - px) ** 2 + (oy - py) ** 2 <= r2:
                         nearby.append(o)
 
         return nearby
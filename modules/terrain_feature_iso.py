@@ -21,6 +21,15 @@ class TerrainFeature:
         self.position = Vector2(position)
         self.feature_type = feature_type
         self.rect = pg.Rect(position[0] - 20, position[1] - 20, 40, 40)
+        # Resolved once, so drawing doesn't re-test the type string each frame
+        self._draw_feature = {
+            "tree": self._draw_tree,
+            "boulder": self._draw_boulder,
+            "rock": self._draw_rock,
+            "bush": self._draw_bush,
+            "twigs": self._draw_twigs,
+            "pebbles": self._draw_pebbles,
+        }[feature_type]
         if self.feature_type == "pebbles":
             self.num_pebbles = random.randint(2, 6)
             base_offsets = [(-6, -2), (-3, 0), (0, -4), (4, 1), (2, 5), (-1, 3), (5, -1)]
@@ -52,148 +61,160 @@ class TerrainFeature:
                     }
                 )
 
+    def is_on_screen(self, camera: CameraIso) -> bool:
+        # Tree foliage rises above the footprint; the margin covers it at any zoom
+        margin = int(40 * camera.zoom)
+        return camera.get_screen_rect(self.rect).inflate(margin * 2, margin * 2).colliderect(camera.screen_rect)
+
     def draw(self, *, surface: pg.Surface, camera: CameraIso) -> None:
-        screen_pos = camera.world_to_iso(self.position, camera.zoom)
-        zoom = camera.zoom
-        if self.feature_type == "tree":
-            trunk_width = int(8 * zoom)
-            trunk_height = int(20 * zoom)
-            trunk_rect = pg.Rect(screen_pos[0] - trunk_width // 2, screen_pos[1], trunk_width, trunk_height)
-            pg.draw.rect(surface, (139, 69, 19), trunk_rect)
-            foliage_radius = int(25 * zoom)
-            pg.draw.circle(
-                surface,
-                (0, 128, 0),
-                (int(screen_pos[0]), int(screen_pos[1] - 10 * zoom)),
-                foliage_radius,
-            )
-            pg.draw.circle(
-                surface,
-                (34, 139, 34),
-                (int(screen_pos[0] - 10 * zoom), int(screen_pos[1] - 5 * zoom)),
-                int(15 * zoom),
-            )
-            pg.draw.circle(
-                surface,
-                (34, 139, 34),
-                (int(screen_pos[0] + 10 * zoom), int(screen_pos[1] - 5 * zoom)),
-                int(15 * zoom),
-            )
-        elif self.feature_type == "boulder":
-            boulder_radius = int(25 * zoom)
-            pg.draw.ellipse(
-                surface,
-                (105, 105, 105),
-                (
-                    screen_pos[0] - boulder_radius,
-                    screen_pos[1] - boulder_radius // 2,
-                    boulder_radius * 2,
-                    boulder_radius,
-                ),
-            )
-            pg.draw.ellipse(
-                surface,
-                (70, 70, 70),
-                (
-                    screen_pos[0] - boulder_radius // 2,
-                    screen_pos[1] - boulder_radius // 2,
-                    boulder_radius,
-                    boulder_radius // 2,
-                ),
-            )
-        elif self.feature_type == "rock":
-            rock_width = int(15 * zoom)
-            rock_height = int(10 * zoom)
+        self._draw_feature(
+            surface=surface, screen_pos=camera.world_to_iso(self.position, camera.zoom), zoom=camera.zoom
+        )
+
+    def _draw_tree(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        trunk_width = int(8 * zoom)
+        trunk_height = int(20 * zoom)
+        trunk_rect = pg.Rect(screen_pos[0] - trunk_width // 2, screen_pos[1], trunk_width, trunk_height)
+        pg.draw.rect(surface, (139, 69, 19), trunk_rect)
+        foliage_radius = int(25 * zoom)
+        pg.draw.circle(
+            surface,
+            (0, 128, 0),
+            (int(screen_pos[0]), int(screen_pos[1] - 10 * zoom)),
+            foliage_radius,
+        )
+        pg.draw.circle(
+            surface,
+            (34, 139, 34),
+            (int(screen_pos[0] - 10 * zoom), int(screen_pos[1] - 5 * zoom)),
+            int(15 * zoom),
+        )
+        pg.draw.circle(
+            surface,
+            (34, 139, 34),
+            (int(screen_pos[0] + 10 * zoom), int(screen_pos[1] - 5 * zoom)),
+            int(15 * zoom),
+        )
+
+    def _draw_boulder(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        boulder_radius = int(25 * zoom)
+        pg.draw.ellipse(
+            surface,
+            (105, 105, 105),
+            (
+                screen_pos[0] - boulder_radius,
+                screen_pos[1] - boulder_radius // 2,
+                boulder_radius * 2,
+                boulder_radius,
+            ),
+        )
+        pg.draw.ellipse(
+            surface,
+            (70, 70, 70),
+            (
+                screen_pos[0] - boulder_radius // 2,
+                screen_pos[1] - boulder_radius // 2,
+                boulder_radius,
+                boulder_radius // 2,
+            ),
+        )
+
+    def _draw_rock(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        rock_width = int(15 * zoom)
+        rock_height = int(10 * zoom)
+        pg.draw.ellipse(
+            surface,
+            (128, 128, 128),
+            (
+                screen_pos[0] - rock_width // 2,
+                screen_pos[1] - rock_height // 2,
+                rock_width,
+                rock_height,
+            ),
+        )
+        pg.draw.ellipse(
+            surface,
+            (90, 90, 90),
+            (
+                screen_pos[0] - rock_width // 4,
+                screen_pos[1] - rock_height // 4,
+                rock_width // 2,
+                rock_height // 2,
+            ),
+        )
+
+    def _draw_bush(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        bush_radius = int(18 * zoom)
+        pg.draw.circle(surface, (0, 100, 0), (int(screen_pos[0]), int(screen_pos[1])), bush_radius)
+        pg.draw.circle(
+            surface,
+            (34, 139, 34),
+            (int(screen_pos[0] - 8 * zoom), int(screen_pos[1] - 5 * zoom)),
+            int(12 * zoom),
+        )
+        pg.draw.circle(
+            surface,
+            (0, 120, 0),
+            (int(screen_pos[0] + 6 * zoom), int(screen_pos[1] + 3 * zoom)),
+            int(10 * zoom),
+        )
+        pg.draw.line(
+            surface,
+            (139, 69, 19),
+            screen_pos,
+            (screen_pos[0], screen_pos[1] + 5 * zoom),
+            int(2 * zoom),
+        )
+
+    def _draw_twigs(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        twig_length = int(12 * zoom)
+        twig_width = int(2 * zoom)
+        pg.draw.line(
+            surface,
+            (101, 67, 33),
+            screen_pos,
+            (screen_pos[0] + twig_length, screen_pos[1]),
+            twig_width,
+        )
+        pg.draw.line(
+            surface,
+            (101, 67, 33),
+            (screen_pos[0] + twig_length // 2, screen_pos[1]),
+            (screen_pos[0] + twig_length // 2 - 5 * zoom, screen_pos[1] - 8 * zoom),
+            twig_width,
+        )
+        pg.draw.line(
+            surface,
+            (101, 67, 33),
+            (screen_pos[0] + twig_length // 2, screen_pos[1]),
+            (screen_pos[0] + twig_length // 2 + 6 * zoom, screen_pos[1] + 4 * zoom),
+            twig_width,
+        )
+        pg.draw.circle(
+            surface,
+            (0, 100, 0),
+            (int(screen_pos[0] + 3 * zoom), int(screen_pos[1] - 2 * zoom)),
+            int(3 * zoom),
+        )
+
+    def _draw_pebbles(self, *, surface: pg.Surface, screen_pos: Point, zoom: float) -> None:
+        for pebble in self.pebbles:
+            px = screen_pos[0] + pebble["dx"] * zoom
+            py = screen_pos[1] + pebble["dy"] * zoom
+            pebble_width = int(pebble["width"] * zoom)
+            pebble_height = int(pebble["height"] * zoom)
             pg.draw.ellipse(
                 surface,
-                (128, 128, 128),
-                (
-                    screen_pos[0] - rock_width // 2,
-                    screen_pos[1] - rock_height // 2,
-                    rock_width,
-                    rock_height,
-                ),
+                pebble["outer"],
+                (px - pebble_width // 2, py - pebble_height // 2, pebble_width, pebble_height),
             )
+            inner_width = pebble_width // 2
+            inner_height = pebble_height // 2
             pg.draw.ellipse(
                 surface,
-                (90, 90, 90),
-                (
-                    screen_pos[0] - rock_width // 4,
-                    screen_pos[1] - rock_height // 4,
-                    rock_width // 2,
-                    rock_height // 2,
-                ),
-            )
-        elif self.feature_type == "bush":
-            bush_radius = int(18 * zoom)
-            pg.draw.circle(surface, (0, 100, 0), (int(screen_pos[0]), int(screen_pos[1])), bush_radius)
-            pg.draw.circle(
-                surface,
-                (34, 139, 34),
-                (int(screen_pos[0] - 8 * zoom), int(screen_pos[1] - 5 * zoom)),
-                int(12 * zoom),
-            )
-            pg.draw.circle(
-                surface,
-                (0, 120, 0),
-                (int(screen_pos[0] + 6 * zoom), int(screen_pos[1] + 3 * zoom)),
-                int(10 * zoom),
-            )
-            pg.draw.line(
-                surface,
-                (139, 69, 19),
-                screen_pos,
-                (screen_pos[0], screen_pos[1] + 5 * zoom),
-                int(2 * zoom),
-            )
-        elif self.feature_type == "twigs":
-            twig_length = int(12 * zoom)
-            twig_width = int(2 * zoom)
-            pg.draw.line(
-                surface,
-                (101, 67, 33),
-                screen_pos,
-                (screen_pos[0] + twig_length, screen_pos[1]),
-                twig_width,
+                pebble["inner"],
+                (px - inner_width // 2, py - inner_height // 2, inner_width, inner_height),
             )
-            pg.draw.line(
-                surface,
-                (101, 67, 33),
-                (screen_pos[0] + twig_length // 2, screen_pos[1]),
-                (screen_pos[0] + twig_length // 2 - 5 * zoom, screen_pos[1] - 8 * zoom),
-                twig_width,
-            )
-            pg.draw.line(
-                surface,
-                (101, 67, 33),
-                (screen_pos[0] + twig_length // 2, screen_pos[1]),
-                (screen_pos[0] + twig_length // 2 + 6 * zoom, screen_pos[1] + 4 * zoom),
-                twig_width,
-            )
-            pg.draw.circle(
-                surface,
-                (0, 100, 0),
-                (int(screen_pos[0] + 3 * zoom), int(screen_pos[1] - 2 * zoom)),
-                int(3 * zoom),
-            )
-        elif self.feature_type == "pebbles":
-            for pebble in self.pebbles:
-                px = screen_pos[0] + pebble["dx"] * zoom
-                py = screen_pos[1] + pebble["dy"] * zoom
-                pebble_width = int(pebble["width"] * zoom)
-                pebble_height = int(pebble["height"] * zoom)
-                pg.draw.ellipse(
-                    surface,
-                    pebble["outer"],
-                    (px - pebble_width // 2, py - pebble_height // 2, pebble_width, pebble_height),
-                )
-                inner_width = pebble_width // 2
-                inner_height = pebble_height // 2
-                pg.draw.ellipse(
-                    surface,
-                    pebble["inner"],
-                    (px - inner_width // 2, py - inner_height // 2, inner_width, inner_height),
-                )
 
 
 def generate_terrain_features(*, map_name: str, map_width: int, map_height: int) -> list[TerrainFeature]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Self
 
 from modules.data_2d import UNIT_CLASSES
@@ -9,14 +10,19 @@ from modules.data_2d import UNIT_CLASSES
 from .unit_stats_generic import _UnitStatsGeneric
 
 
+@cache
 def get_unit_cost(unit_cls_str: str) -> int:
     """Returns the cost of a unit before it is instantiated, e.g pre-purchase."""
     unit_stats = UnitStats2d.from_data(unit_cls_str)
     return unit_stats.cost
 
 
+@cache
 def get_unit_size(unit_cls_str: str) -> tuple[int, int]:
-    """Returns the size of a unit before it is instantiated, e.g pre-purchase."""
+    """Returns the size of a unit before it is instantiated, e.g pre-purchase.
+
+    Cached, as placement validation calls this for every candidate position.
+    """
     unit_stats = UnitStats2d.from_data(unit_cls_str)
     return unit_stats.size
 
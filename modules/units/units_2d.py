@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import math
 import random
+from collections import defaultdict, deque
 from typing import TYPE_CHECKING, Any, override
 
 import pygame as pg
 from pygame.math import Vector2
 
-from modules.draw_2d import BUILDING_DRAW_RECIPES, COMPLEX_DRAW_RECIPES, SIMPLE_DRAW_RECIPES
+from modules.draw_2d import (
+    BUILDING_DRAW_RECIPES,
+    COMPLEX_DRAW_RECIPES,
+    SIMPLE_DRAW_RECIPES,
+    get_part_degrees,
+    get_rotated_part,
+)
 from modules.game_object import GameObject2d
 from modules.geometry import closest_point_on_rect
 from modules.particle import Particle, create_explosion_2d
@@ -25,6 +32,10 @@ if TYPE_CHECKING:
     from modules.camera.camera_2d import Camera2d
     from modules.unit_stats.unit_stats_generic import WeaponStats
 
+_COS_BY_DEGREE = tuple(math.cos(math.radians(deg)) for deg in range(360))
+_SIN_BY_DEGREE = tuple(math.sin(math.radians(deg)) for deg in range(360))
+"""Lookup tables for unit headings, used for lead prediction when shooting."""
+
 
 class Unit2d(GameObject2d):
     """Subclass for mobile/producing entities (units and buildings).
@@ -54,11 +65,19 @@ class Unit2d(GameObject2d):
         self.cost = self._stats.cost
         self.attack_range = self._stats.attack_range
         self.sight_range = self._stats.sight_range
+        self.attack_range_sq = self.attack_range**2
+        self.sight_range_sq = self.sight_range**2
         self.speed = self._stats.speed
         self.producible_items = self._stats.producible
         self.weapons = self._stats.weapons
         self.income = self._stats.income
         self.income_interval = self._stats.income_interval
+        # Drawing only reads these (via `rotate_rad`), so one Vector2 each serves every frame:
+        self.turret_offset = Vector2(self._stats.turret_offset)
+        self.barrel_offset = Vector2(self._stats.barrel_offset)
+        # Vehicles keep their last rotated parts and offsets, with the (zoom, body_angle, turret_angle) they're for
+        self.drawn_parts: tuple[Any, ...] = ()
+        self.drawn_parts_key: tuple[float, float, float] | None = None
 
         if self.is_resource:
             self.collection_timer = 0
@@ -68,7 +87,7 @@ class Unit2d(GameObject2d):
 
         if self.is_producer:
             self.rally_point = Vector2(position[0] + 80, position[1])
-            self.production_queue = []
+            self.production_queue: deque[dict[str, Any]] = deque()
             self.production_timer: int | None = None
             self.gate_open = False
             self.gate_timer = 0
@@ -84,7 +103,7 @@ class Unit2d(GameObject2d):
         """Sets up image or complex draw method based on type."""
         unit_type_str = self.__class__.__name__
         if unit_type_str in SIMPLE_DRAW_RECIPES:
-            self.image = SIMPLE_DRAW_RECIPES[unit_type_str](self.size, team_to_color[self.team])
+            self.image = SIMPLE_DRAW_RECIPES[unit_type_str](self.size, self.team)
 
         if not self.image:  # TODO: type guard - not sure why needed
             raise TypeError("Unit has no `image`")
@@ -101,8 +120,10 @@ class Unit2d(GameObject2d):
             self.image = BUILDING_DRAW_RECIPES[unit_type_str](self.size, self.team)
 
         else:
-            # Fallback
-            self.image.fill(team_to_color[self.team])
+            # Fallback; the placeholder image is shared, so the unit gets its own to fill
+            image = pg.Surface(self.image.get_size())
+            image.fill(team_to_color[self.team])
+            self.image = image
 
         if not self.image:  # TODO: type guard
             raise TypeError("Unit has no `image`")
@@ -143,14 +164,6 @@ class Unit2d(GameObject2d):
     def is_resource(self) -> bool:
         return self.income is not None
 
-    @property
-    def turret_offset(self) -> Vector2:
-        return Vector2(self._stats.turret_offset)
-
-    @property
-    def barrel_offset(self) -> Vector2:
-        return Vector2(self._stats.barrel_offset)
-
     @override
     def update(
         self,
@@ -172,29 +185,26 @@ class Unit2d(GameObject2d):
 
         # Clear invalid attack target
         if self.attack_target and (
-            self.attack_target.health <= 0 or self.distance_to(self.attack_target.position) > self.sight_range
+            self.attack_target.health <= 0
+            or self.distance_squared_to(self.attack_target.position) > self.sight_range_sq
         ):
             if self.move_target == self.attack_target.position:
                 self.move_target = None
 
             self.attack_target = None
 
-        if not self.is_building and self.attack_target and self.attack_target.health > 0:
-            if self.attack_target.is_building:
-                # pyrefly: ignore [bad-argument-type]
-                closest = closest_point_on_rect(rect=self.attack_target.rect, pos=self.position)
-                dir_to_closest = Vector2(closest) - self.position
-                dist = dir_to_closest.length()
-            else:
-                dist = self.distance_to(self.attack_target.position)
+        # A dead target was cleared above, so any target left is alive
+        if not self.is_building and self.attack_target:
+            # One displacement vector gives both the distance and the direction to the target
             if self.attack_target.is_building:
                 # pyrefly: ignore [bad-argument-type]
                 closest_enemy = closest_point_on_rect(rect=self.attack_target.rect, pos=self.position)
-                dir_to_enemy = Vector2(closest_enemy) - self.position
+                dir_to_enemy = closest_enemy - self.position
             else:
-                dir_to_enemy = Vector2(self.attack_target.position) - self.position
-            if dir_to_enemy.length() > 0:
-                dir_to_enemy = dir_to_enemy.normalize()
+                dir_to_enemy = self.attack_target.position - self.position
+            dist = dir_to_enemy.length()
+            if dist > 0:
+                dir_to_enemy /= dist
             self.turret_angle = math.atan2(dir_to_enemy.y, dir_to_enemy.x)
             if dist <= self.attack_range:
                 # Stop moving and fight
@@ -209,12 +219,7 @@ class Unit2d(GameObject2d):
 
             # Chase the target
             elif self.attack_target.is_building:
-                chase_pos = self.get_chase_position_for_building(self.attack_target)
-                if chase_pos is not None:
-                    self.move_target = chase_pos
-
-                else:
-                    self.move_target = None
+                self.move_target = self.get_chase_position_for_building(self.attack_target)
 
             else:
                 self.move_target = self.attack_target.position
@@ -224,12 +229,12 @@ class Unit2d(GameObject2d):
 
         # Movement
         if self.move_target:
-            dir_to_target = Vector2(self.move_target) - self.position
-            dist_to_move = dir_to_target.length()
+            step = self.move_target - self.position
+            dist_to_move = step.length()
             if dist_to_move > 5:
-                move_dir = dir_to_target.normalize()
-                self.position += move_dir * self.speed
-                self.body_angle = math.atan2(move_dir.y, move_dir.x)
+                step *= self.speed / dist_to_move
+                self.position += step
+                self.body_angle = math.atan2(step.y, step.x)
             else:
                 self.move_target = None
 
@@ -298,7 +303,7 @@ class Unit2d(GameObject2d):
             # pyrefly: ignore [unsupported-operation]
             self.production_timer -= 1
             if self.production_timer <= 0:
-                item = self.production_queue.pop(0)
+                item = self.production_queue.popleft()
                 unit_type = item["unit_type"]
                 repeat = item.get("repeat", False)
 
@@ -338,35 +343,35 @@ class Unit2d(GameObject2d):
         if self.health <= 0:
             return
 
-        screen_pos = camera.world_to_screen(self.position)
-        if self.is_air:
-            screen_pos = (screen_pos[0], screen_pos[1] - self.fly_height * camera.zoom)
-
-        zoom = camera.zoom
         if not isinstance(self.rect, pg.Rect):
             raise TypeError("Unit has unexpected `rect` type")
 
         screen_rect = camera.get_screen_rect(self.rect)
-        if not screen_rect.colliderect((0, 0, camera.width, camera.height)):
+        if not screen_rect.colliderect(camera.screen_rect):
             return
 
+        zoom = camera.zoom
+        screen_pos = camera.world_to_screen(self.position)
+        if self.is_air:
+            screen_pos = (screen_pos[0], screen_pos[1] - self.fly_height * zoom)
+
         # pyrefly: ignore [missing-attribute]
         scaled_size = (int(self.image.get_width() * zoom), int(self.image.get_height() * zoom))
         if scaled_size[0] > 0 and scaled_size[1] > 0:
-            # pyrefly: ignore [bad-argument-type]
-            scaled_image = pg.transform.smoothscale(self.image, scaled_size)
             if hasattr(self, "needs_rotation") and self.needs_rotation:
-                rotated_image = pg.transform.rotate(scaled_image, -math.degrees(self.body_angle))
+                # The image is shared per team, so its scaled rotations are cached
+                rotated_image = get_rotated_part(self.image, scaled_size, get_part_degrees(self.body_angle))
                 rot_rect = rotated_image.get_rect(center=screen_pos)
                 surface.blit(rotated_image, rot_rect.topleft)
             else:
+                # Building images are shared per team too, so the scaled copy is cached rather than made each frame
+                scaled_image = get_rotated_part(self.image, scaled_size, 0)
                 offset_x = scaled_size[0] / 2
                 offset_y = scaled_size[1] / 2
                 blit_pos = (screen_pos[0] - offset_x, screen_pos[1] - offset_y)
                 surface.blit(scaled_image, blit_pos)
         if self.selected:
             if self.is_building:
-                screen_rect = camera.get_screen_rect(self.rect)
                 pg.draw.rect(surface, (255, 255, 0), screen_rect, int(3 * zoom))
             else:
                 radius = max(self.rect.width, self.rect.height) / 2 * zoom + 3
@@ -418,22 +423,27 @@ class Unit2d(GameObject2d):
         :param camera: Camera2d for positioning.
         :param mouse_pos: Mouse position for hover detection.
         """
+        bar = self.get_health_bar_blit_if_needed(camera=camera, mouse_pos=mouse_pos)
+        if bar is not None:
+            surface.blit(*bar)
+
+    def get_health_bar_blit_if_needed(
+        self, *, camera: Camera2d, mouse_pos: Point | None = None
+    ) -> tuple[pg.Surface, Point] | None:
+        """Returns the health bar image and its screen position if under attack, hovered, or building with damage.
+
+        :param camera: Camera2d for positioning.
+        :param mouse_pos: Mouse position for hover detection.
+        :return: (image, position) pair for `Surface.blit`/`Surface.fblits`, or None if no bar is needed.
+        """
         if not isinstance(self.rect, pg.Rect):
             raise TypeError("self.rect` is unexpected non-`Rect` type")
 
         if not self._needs_healthbar(camera=camera, mouse_pos=mouse_pos):
-            return
+            return None
 
         screen_pos = camera.world_to_screen(self.position)
-        health_ratio = self.health / self.max_health
-        color = (0, 255, 0) if health_ratio > 0.5 else (255, 0, 0)
-        bar_width = 25
-        bar_height = 4
-        bar_x = screen_pos[0] - bar_width / 2
-        bar_y = screen_pos[1] - (self.rect.height / 2 * camera.zoom) - bar_height - 2
-        pg.draw.rect(surface, (0, 0, 0), (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-        pg.draw.rect(surface, color, (bar_x, bar_y, bar_width * health_ratio, bar_height))
-        pg.draw.rect(surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
+        return self.get_health_bar_blit(center_x=screen_pos[0], top=screen_pos[1] - self.rect.height / 2 * camera.zoom)
 
     def _needs_healthbar(self, *, camera: Camera2d, mouse_pos: Point | None = None) -> bool:
         if not isinstance(self.rect, pg.Rect):
@@ -466,29 +476,29 @@ class Unit2d(GameObject2d):
         if self.last_shot_time > 0:
             return
 
+        # Range is checked on squared distances; a square root is only taken for lead time and the aim direction
         if target.is_building:
             # pyrefly: ignore [bad-argument-type]
             closest = closest_point_on_rect(rect=target.rect, pos=self.position)
-            dist = Vector2(closest).distance_to(self.position)
+            dist_sq = self.distance_squared_to(closest)
             aim_pos = closest
         else:
-            dist = self.distance_to(target.position)
-            time_to_target = dist / self.current_weapon.projectile_speed
-            target_vel = Vector2(
-                target.speed * math.cos(getattr(target, "body_angle", 0)) if hasattr(target, "speed") else 0,
-                target.speed * math.sin(getattr(target, "body_angle", 0)) if hasattr(target, "speed") else 0,
-            )
+            dist_sq = self.distance_squared_to(target.position)
+            time_to_target = math.sqrt(dist_sq) / self.current_weapon.projectile_speed
+            heading = round(math.degrees(target.body_angle)) % 360
+            target_vel = Vector2(_COS_BY_DEGREE[heading], _SIN_BY_DEGREE[heading]) * target.speed
             predicted_pos = target.position + target_vel * time_to_target
             aim_pos = predicted_pos
 
-        if dist > self.attack_range:
+        if dist_sq > self.attack_range_sq:
             return
 
-        vec = aim_pos - self.position
-        if vec.length() == 0:
+        direction = aim_pos - self.position
+        aim_dist = direction.length()
+        if aim_dist == 0:
             return
 
-        direction = vec.normalize()
+        direction /= aim_dist
         proj = Projectile2d(position=self.position, direction=direction, team=self.team, weapon=self.current_weapon)
         projectiles.add(proj)
         self.last_shot_time = self.current_weapon.cooldown
@@ -549,9 +559,14 @@ class Headquarters(Unit2d):
         self.power_output = 100
         self.power_usage = 50
         self.has_enough_power = True
-        self.production_queue: list[dict[str, Any]] = []
+        self.production_queue: deque[dict[str, Any]] = deque()
         self.rally_point = Vector2(position[0] + (100 if team == Team.GREEN else position[0] - 100), position[1])
         self.radius = 50
+        self.buildings: Group[Unit2d] = pg.sprite.Group(self)
+        """Live buildings belonging to this team, including the HQ itself."""
+        self.buildings_by_type: defaultdict[type[Unit2d], Group[Unit2d]] = defaultdict(pg.sprite.Group)
+        """Live buildings belonging to this team, grouped by class. Killed buildings leave their group automatically."""
+        self.buildings_by_type[type(self)].add(self)
         self.game_stats = {
             "units_created": 0,
             "units_lost": 0,
@@ -578,9 +593,18 @@ class Headquarters(Unit2d):
                 building.parent_hq = self
 
             all_buildings.add(building)
+            self.add_building(building)
             self.game_stats["buildings_constructed"] += 1
             self.credits -= building.cost
 
+    def add_building(self, building: Unit2d) -> None:
+        """Registers a newly placed building with this HQ's building groups.
+
+        :param building: The new building.
+        """
+        self.buildings.add(building)
+        self.buildings_by_type[type(building)].add(building)
+
 
 class Barracks(Unit2d):
     """Barracks building: produces infantry units."""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 import random
+from collections import deque
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, override
 
 import pygame as pg
@@ -11,6 +13,7 @@ from pygame.math import Vector2
 
 from modules.data_iso import TILE_SIZE
 from modules.game_object import GameObjectIso
+from modules.game_object.game_object_generic import HEALTH_BAR_WIDTH
 from modules.geometry import closest_point_on_rect
 from modules.particle import Particle, create_explosion_iso
 from modules.pathfinding_iso import astar
@@ -28,6 +31,14 @@ if TYPE_CHECKING:
     from modules.unit_stats.unit_stats_generic import WeaponStats
 
 
+@lru_cache(maxsize=1024)
+def _create_selection_ring(radius: int, width: int, rgba: tuple[int, int, int, int]) -> pg.Surface:
+    # The pulse repeats, so each of its alphas is drawn once and shared; must not be modified by callers
+    image = pg.Surface((radius * 2, radius * 2), pg.SRCALPHA)
+    pg.draw.circle(image, rgba, (radius, radius), radius, width)
+    return image
+
+
 class UnitIso(GameObjectIso):
     def __init__(self, *, position: Point, team: Team, hq: Headquarters | None = None) -> None:
         super().__init__(position=position, team=team)
@@ -47,6 +58,10 @@ class UnitIso(GameObjectIso):
         self.cost = self._stats.cost
         self.attack_range = self._stats.attack_range
         self.sight_range = self._stats.sight_range
+        self.attack_range_sq = self.attack_range**2
+        self.sight_range_sq = self.sight_range**2
+        # A target is only dropped once it is a margin beyond sight range
+        self.target_drop_range_sq = (self.sight_range + 50) ** 2
         self.speed = self._stats.speed
         self.producible_items = self._stats.producible
         self.weapons = self._stats.weapons
@@ -59,6 +74,8 @@ class UnitIso(GameObjectIso):
         self.path = []
         self.path_index = 0
         self.path_recompute_cooldown = 0
+        # The move target `path` was computed for; the path ends at that tile's center, not at the target
+        self.path_goal: Point = self.position.xy
         self.target_body_angle = 0.0
         self.target_turret_angle = 0.0
 
@@ -70,7 +87,7 @@ class UnitIso(GameObjectIso):
 
         if self.is_producer:
             self.rally_point = Vector2(position[0] + 80, position[1])
-            self.production_queue = []
+            self.production_queue: deque[dict[str, Any]] = deque()
             self.production_timer: int | None = None
 
         self.rect = pg.Rect(self.position.x - self.size[0] / 2, self.position.y - self.size[1] / 2, *self.size)
@@ -124,6 +141,20 @@ class UnitIso(GameObjectIso):
             self, Tank | HeavyTank | TankDestroyer | MachineGunVehicle | RocketArtillery | AttackHelicopter
         )
 
+    def is_on_screen(self, camera: CameraIso) -> bool:
+        if not isinstance(self.rect, pg.Rect):
+            raise TypeError("self.rect` is unexpected non-`Rect` type")
+
+        # Rotated hulls, rifles and burn particles can stray past the footprint, so cull on double its size,
+        # padded by the health bar, which is drawn at a fixed screen size
+        screen_rect = camera.get_screen_rect(self.rect.inflate(self.rect.size))
+        screen_rect.inflate_ip(HEALTH_BAR_WIDTH * 2, HEALTH_BAR_WIDTH * 2)
+        top_z = (self.fly_height if self.is_air else 0) + self.height
+        rise = int(top_z * camera.zoom / 2)
+        screen_rect.y -= rise
+        screen_rect.height += rise
+        return screen_rect.colliderect(camera.screen_rect)
+
     def _draw_static(self, *, surface: pg.Surface, camera: CameraIso, mouse_pos: Point | None = None) -> None:
         if self.health <= 0:
             return
@@ -158,10 +189,10 @@ class UnitIso(GameObjectIso):
         pg.draw.polygon(surface, side_color, [p_bfr, p_bbr, p_tbr, p_tfr])
         pg.draw.polygon(surface, side_color, [p_bbr, p_bbl, p_tbl, p_tbr])
         pg.draw.polygon(surface, side_color, [p_bbl, p_bfl, p_tfl, p_tbl])
-        roof_color = pg.Color(128, 128, 128) if self.is_building else pg.Color(100, 100, 100)
+        roof_color = (128, 128, 128) if self.is_building else (100, 100, 100)
         roof_points = [p_tfl, p_tfr, p_tbr, p_tbl]
         pg.draw.polygon(surface, roof_color, roof_points)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         all_edges = [
             [p_bfl, p_bfr, p_bbr, p_bbl, p_bfl],
             [p_tfl, p_tfr, p_tbr, p_tbl, p_tfl],
@@ -197,8 +228,8 @@ class UnitIso(GameObjectIso):
         sin_a = math.sin(angle)
         side_color = tuple(max(0, c - 50) for c in _team_color)
         highlight_color = tuple(min(255, c + 30) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
-        shadow_color = pg.Color(50, 50, 50, 100)
+        outline_color = (0, 0, 0)
+        shadow_color = (50, 50, 50, 100)
         shadow_offset = (2 * zoom, 2 * zoom)
         base_screen = camera.world_to_iso(pos, zoom)
         shadow_r = int(4 * zoom)
@@ -469,8 +500,7 @@ class UnitIso(GameObjectIso):
             select_r = int(10 * zoom)
             pulse_alpha = int(128 + 127 * math.sin(pg.time.get_ticks() * 0.01))
             pulse_color = (255, 255, 0, pulse_alpha)
-            select_surf = pg.Surface((select_r * 2, select_r * 2), pg.SRCALPHA)
-            pg.draw.circle(select_surf, pulse_color, (select_r, select_r), select_r, int(3 * zoom))
+            select_surf = _create_selection_ring(select_r, int(3 * zoom), pulse_color)
             surface.blit(select_surf, (int(base_screen[0] - select_r), int(base_screen[1] - select_r)))
         self.draw_health_bar_if_needed(surface=surface, camera=camera, mouse_pos=mouse_pos)
         for particle in self.plasma_burn_particles:
@@ -488,8 +518,8 @@ class UnitIso(GameObjectIso):
         pos = self.position
         base_z = self.fly_height if self.is_air else 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        roof_color = pg.Color(100, 100, 100)
-        outline_color = pg.Color(0, 0, 0)
+        roof_color = (100, 100, 100)
+        outline_color = (0, 0, 0)
         p_bottom = []
         self._draw_rotated_box(
             surface=surface,
@@ -595,7 +625,7 @@ class UnitIso(GameObjectIso):
         team_color: pg.Color | tuple[int, ...],
         side_color: tuple[int, ...],
         roof_color: pg.Color | tuple[int, ...],
-        outline_color: pg.Color,
+        outline_color: pg.Color | tuple[int, ...],
         zoom: float,
         is_turret: bool = False,
         # pyrefly: ignore [implicit-any-type-argument]
@@ -676,15 +706,7 @@ class UnitIso(GameObjectIso):
             return
 
         screen_pos = camera.world_to_iso(self.position, camera.zoom)
-        health_ratio = self.health / self.max_health
-        color = (0, 255, 0) if health_ratio > 0.5 else (255, 0, 0)
-        bar_width = 25
-        bar_height = 4
-        bar_x = screen_pos[0] - bar_width / 2
-        bar_y = screen_pos[1] - (self.rect.height / 2 * camera.zoom) - bar_height - 2
-        pg.draw.rect(surface, (0, 0, 0), (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-        pg.draw.rect(surface, color, (bar_x, bar_y, bar_width * health_ratio, bar_height))
-        pg.draw.rect(surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
+        self.blit_health_bar(surface, center_x=screen_pos[0], top=screen_pos[1] - self.rect.height / 2 * camera.zoom)
 
     def _needs_healthbar(self, *, camera: CameraIso, mouse_pos: Point | None = None) -> bool:
         if not isinstance(self.rect, pg.Rect):
@@ -725,11 +747,10 @@ class UnitIso(GameObjectIso):
             self.last_shot_time -= 1
 
         if self.attack_target and (
-            self.attack_target.health <= 0 or self.distance_to(self.attack_target.position) > self.sight_range + 50
+            self.attack_target.health <= 0
+            or self.distance_squared_to(self.attack_target.position) > self.target_drop_range_sq
         ):
             self.attack_target = None
-            if self.move_target == getattr(self.attack_target, "position", None):
-                self.move_target = None
 
         if not self.is_building:
             if self.move_target:
@@ -744,10 +765,7 @@ class UnitIso(GameObjectIso):
                     self.path_recompute_cooldown <= 0
                     or not self.path
                     or self.path_index >= len(self.path)
-                    or (
-                        Vector2(self.move_target) - Vector2(self.path[-1] if self.path else self.position)
-                    ).length_squared()
-                    > 2500
+                    or (self.path_goal[0] - mt_x) ** 2 + (self.path_goal[1] - mt_y) ** 2 > 2500
                 ):
                     blocked = set()
                     num_tiles_x = self.map_width // TILE_SIZE
@@ -777,6 +795,7 @@ class UnitIso(GameObjectIso):
                         map_height=self.map_height,
                     )
                     self.path_index = 0
+                    self.path_goal = self.move_target
                     self.path_recompute_cooldown = 12 + random.randint(0, 8)
 
                 self.path_recompute_cooldown -= 1
@@ -786,9 +805,9 @@ class UnitIso(GameObjectIso):
                     dist_to_wp = dir_to_wp.length()
                     waypoint_threshold = 10.0
                     if dist_to_wp > waypoint_threshold:
-                        move_dir = dir_to_wp.normalize()
-                        self.position += move_dir * self.speed
-                        self.target_body_angle = math.atan2(move_dir.y, move_dir.x)
+                        dir_to_wp *= self.speed / dist_to_wp
+                        self.position += dir_to_wp
+                        self.target_body_angle = math.atan2(dir_to_wp.y, dir_to_wp.x)
                     else:
                         self.path_index += 1
                         if self.path_index >= len(self.path):
@@ -799,24 +818,19 @@ class UnitIso(GameObjectIso):
                     self.path = []
                     self.move_target = None
 
-            if self.attack_target and self.attack_target.health > 0:
-                if self.attack_target.is_building:
-                    # pyrefly: ignore [bad-argument-type]
-                    closest = closest_point_on_rect(rect=self.attack_target.rect, pos=self.position)
-                    dir_to_closest = Vector2(closest) - self.position
-                    dist = dir_to_closest.length()
-                else:
-                    dist = self.distance_to(self.attack_target.position)
-
+            # A dead target was cleared above, so any target left is alive
+            if self.attack_target:
+                # One displacement vector gives both the distance and the direction to the target
                 if self.attack_target.is_building:
                     # pyrefly: ignore [bad-argument-type]
                     closest_enemy = closest_point_on_rect(rect=self.attack_target.rect, pos=self.position)
-                    dir_to_enemy = Vector2(closest_enemy) - self.position
+                    dir_to_enemy = closest_enemy - self.position
                 else:
-                    dir_to_enemy = Vector2(self.attack_target.position) - self.position
+                    dir_to_enemy = self.attack_target.position - self.position
 
-                if dir_to_enemy.length() > 0:
-                    dir_to_enemy = dir_to_enemy.normalize()
+                dist = dir_to_enemy.length()
+                if dist > 0:
+                    dir_to_enemy /= dist
 
                 self.target_turret_angle = math.atan2(dir_to_enemy.y, dir_to_enemy.x)
                 if not self.attack_target.is_building and random.random() < 0.1:
@@ -824,16 +838,9 @@ class UnitIso(GameObjectIso):
 
                 if dist > self.attack_range:
                     if self.attack_target.is_building:
-                        chase_pos = self.get_chase_position_for_building(self.attack_target)
-                        if chase_pos is not None:
-                            self.move_target = chase_pos
-                            self.path = []
-                        else:
-                            self.move_target = None
-                            self.path = []
+                        self.move_target = self.get_chase_position_for_building(self.attack_target)
                     else:
                         self.move_target = self.attack_target.position
-                        self.path = []
 
         if not self.attack_target:
             self.target_turret_angle = self.body_angle
@@ -861,19 +868,24 @@ class UnitIso(GameObjectIso):
         if not isinstance(self.rect, pg.Rect):
             raise TypeError("Unit has unexpected `rect` type")
 
-        angle_diff = (self.target_body_angle - self.body_angle + math.pi) % (2 * math.pi) - math.pi
-        rot_step = min(self.hull_rotation_speed, abs(angle_diff))
-        if angle_diff > 0:
-            self.body_angle += rot_step
-        elif angle_diff < 0:
-            self.body_angle -= rot_step
-
-        angle_diff = (self.target_turret_angle - self.turret_angle + math.pi) % (2 * math.pi) - math.pi
-        rot_step = min(self.turret_rotation_speed, abs(angle_diff))
-        if angle_diff > 0:
-            self.turret_angle += rot_step
-        elif angle_diff < 0:
-            self.turret_angle -= rot_step
+        # Within a step of its target an angle snaps to it, so resting units skip the wrap-around math entirely
+        if self.body_angle != self.target_body_angle:
+            angle_diff = (self.target_body_angle - self.body_angle + math.pi) % (2 * math.pi) - math.pi
+            if abs(angle_diff) <= self.hull_rotation_speed:
+                self.body_angle = self.target_body_angle
+            elif angle_diff > 0:
+                self.body_angle += self.hull_rotation_speed
+            else:
+                self.body_angle -= self.hull_rotation_speed
+
+        if self.turret_angle != self.target_turret_angle:
+            angle_diff = (self.target_turret_angle - self.turret_angle + math.pi) % (2 * math.pi) - math.pi
+            if abs(angle_diff) <= self.turret_rotation_speed:
+                self.turret_angle = self.target_turret_angle
+            elif angle_diff > 0:
+                self.turret_angle += self.turret_rotation_speed
+            else:
+                self.turret_angle -= self.turret_rotation_speed
 
         if not isinstance(self.rect, pg.Rect):
             raise TypeError("Unit has unexpected `rect` type")
@@ -884,13 +896,13 @@ class UnitIso(GameObjectIso):
             if self.attack_target.is_building:
                 # pyrefly: ignore [bad-argument-type]
                 closest = closest_point_on_rect(rect=self.attack_target.rect, pos=self.position)
-                dist = Vector2(closest).distance_to(self.position)
+                dist_sq = self.position.distance_squared_to(closest)
                 aim_target = self.attack_target
             else:
-                dist = self.distance_to(self.attack_target.position)
+                dist_sq = self.distance_squared_to(self.attack_target.position)
                 aim_target = self.attack_target
 
-            if dist <= self.attack_range:
+            if dist_sq <= self.attack_range_sq:
                 self.shoot(target=aim_target, projectiles=projectiles, particles=particles)
 
     def get_chase_position_for_building(self, target_building: UnitIso) -> Vector2 | None:
@@ -910,7 +922,7 @@ class UnitIso(GameObjectIso):
         target_pos += perp_dir * spread_dist
         # pyrefly: ignore [bad-argument-type]
         new_closest = closest_point_on_rect(rect=target_building.rect, pos=target_pos)
-        new_dist = Vector2(new_closest).distance_to(target_pos)
+        new_dist = target_pos.distance_to(new_closest)
         if new_dist > self.attack_range:
             overage = new_dist - self.attack_range
             adjust_dir = (Vector2(new_closest) - target_pos).normalize()
@@ -929,7 +941,7 @@ class UnitIso(GameObjectIso):
                 # pyrefly: ignore [unsupported-operation]
                 self.production_timer -= 1
                 if self.production_timer <= 0:
-                    item = self.production_queue.pop(0)
+                    item = self.production_queue.popleft()
                     unit_type = item["unit_type"]
                     repeat = item.get("repeat", False)
 
@@ -971,7 +983,7 @@ class UnitIso(GameObjectIso):
         if target.is_building:
             # pyrefly: ignore [bad-argument-type]
             closest = closest_point_on_rect(rect=target.rect, pos=self.position)
-            dist = Vector2(closest).distance_to(self.position)
+            dist = self.position.distance_to(closest)
             aim_pos = closest
         else:
             dist = self.distance_to(target.position)
@@ -1054,7 +1066,7 @@ class Headquarters(UnitIso):
         self.power_output = 100
         self.power_usage = 50
         self.has_enough_power = True
-        self.production_queue: list[dict[str, Any]] = []
+        self.production_queue: deque[dict[str, Any]] = deque()
         self.production_timer = None
         # pyrefly: ignore [implicit-any-attribute]
         self.pending_building = None
@@ -1105,7 +1117,7 @@ class PowerPlant(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1135,10 +1147,10 @@ class PowerPlant(UnitIso):
             stack_top = (stack_x, stack_y, stack_base[2] + h * 0.6)
             p_stack_base = camera.world_to_iso_3d(*stack_base, zoom)
             p_stack_top = camera.world_to_iso_3d(*stack_top, zoom)
-            pg.draw.line(surface, pg.Color(80, 80, 80), p_stack_base, p_stack_top, int(4 * zoom))
+            pg.draw.line(surface, (80, 80, 80), p_stack_base, p_stack_top, int(4 * zoom))
             pg.draw.circle(
                 surface,
-                pg.Color(60, 60, 60),
+                (60, 60, 60),
                 (int(p_stack_top[0]), int(p_stack_top[1])),
                 int(3 * zoom),
             )
@@ -1154,9 +1166,9 @@ class PowerPlant(UnitIso):
             h=tower_h,
             angle=self.body_angle,
             base_z=tower_base_z,
-            team_color=pg.Color(150, 150, 150),
+            team_color=(150, 150, 150),
             side_color=side_color,
-            roof_color=pg.Color(150, 150, 150),
+            roof_color=(150, 150, 150),
             outline_color=outline_color,
             zoom=zoom,
             is_turret=False,
@@ -1186,7 +1198,7 @@ class Refinery(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1217,8 +1229,8 @@ class Refinery(UnitIso):
             p_tank_base = camera.world_to_iso_3d(*tank_base, zoom)
             p_tank_top = camera.world_to_iso_3d(*tank_top, zoom)
             radius = int(w * 0.12 * zoom)
-            pg.draw.circle(surface, pg.Color(100, 100, 100), (int(p_tank_base[0]), int(p_tank_base[1])), radius)
-            pg.draw.circle(surface, pg.Color(80, 80, 80), (int(p_tank_top[0]), int(p_tank_top[1])), radius)
+            pg.draw.circle(surface, (100, 100, 100), (int(p_tank_base[0]), int(p_tank_base[1])), radius)
+            pg.draw.circle(surface, (80, 80, 80), (int(p_tank_top[0]), int(p_tank_top[1])), radius)
             pg.draw.line(surface, outline_color, p_tank_base, p_tank_top, int(2 * zoom))
 
         tower_x = pos.x
@@ -1227,7 +1239,7 @@ class Refinery(UnitIso):
         tower_top = (tower_x, tower_y, base_z + h * 0.8)
         p_tower_base = camera.world_to_iso_3d(*tower_base, zoom)
         p_tower_top = camera.world_to_iso_3d(*tower_top, zoom)
-        pg.draw.line(surface, pg.Color(120, 120, 120), p_tower_base, p_tower_top, int(5 * zoom))
+        pg.draw.line(surface, (120, 120, 120), p_tower_base, p_tower_top, int(5 * zoom))
         pipe_z = base_z + h * 0.3
         for i in range(3):
             start_x = pos.x - w * 0.4 * cos + i * w * 0.4 * cos
@@ -1236,20 +1248,20 @@ class Refinery(UnitIso):
             end_y = tower_y
             p_start = camera.world_to_iso_3d(start_x, start_y, pipe_z, zoom)
             p_end = camera.world_to_iso_3d(end_x, end_y, pipe_z, zoom)
-            pg.draw.line(surface, pg.Color(150, 150, 150), p_start, p_end, int(2 * zoom))
+            pg.draw.line(surface, (150, 150, 150), p_start, p_end, int(2 * zoom))
         flare_x = pos.x + w * 0.6 * cos
         flare_y = pos.y + w * 0.6 * sin
         flare_base = (flare_x, flare_y, base_z)
         flare_top = (flare_x, flare_y, base_z + h * 1.0)
         p_flare_base = camera.world_to_iso_3d(*flare_base, zoom)
         p_flare_top = camera.world_to_iso_3d(*flare_top, zoom)
-        pg.draw.line(surface, pg.Color(100, 100, 100), p_flare_base, p_flare_top, int(3 * zoom))
+        pg.draw.line(surface, (100, 100, 100), p_flare_base, p_flare_top, int(3 * zoom))
         flame_points = [
             p_flare_top,
             (p_flare_top[0] - 5 * zoom, p_flare_top[1] - 3 * zoom),
             (p_flare_top[0] + 5 * zoom, p_flare_top[1] - 3 * zoom),
         ]
-        pg.draw.polygon(surface, pg.Color(255, 100, 0), flame_points)
+        pg.draw.polygon(surface, (255, 100, 0), flame_points)
         if self.selected:
             pg.draw.polygon(surface, (255, 255, 0), p_bottom, int(2 * zoom))
 
@@ -1274,7 +1286,7 @@ class Turret(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1311,7 +1323,7 @@ class Turret(UnitIso):
             base_z=mount_base_z,
             team_color=_team_color,
             side_color=side_color,
-            roof_color=pg.Color(120, 120, 120),
+            roof_color=(120, 120, 120),
             outline_color=outline_color,
             zoom=zoom,
             is_turret=True,
@@ -1330,7 +1342,7 @@ class Turret(UnitIso):
         pg.draw.line(surface, barrel_color, p_barrel_start, p_barrel_end, int(4 * zoom))
         pg.draw.circle(
             surface,
-            pg.Color(100, 100, 100),
+            (100, 100, 100),
             (int(p_barrel_end[0]), int(p_barrel_end[1])),
             int(2 * zoom),
         )
@@ -1340,7 +1352,7 @@ class Turret(UnitIso):
             p_port = camera.world_to_iso_3d(port_x, port_y, base_z + base_h * 0.5, zoom)
             pg.draw.rect(
                 surface,
-                pg.Color(100, 150, 200),
+                (100, 150, 200),
                 (
                     int(p_port[0] - 2 * zoom),
                     int(p_port[1] - 1 * zoom),
@@ -1374,7 +1386,7 @@ class Barracks(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1408,7 +1420,7 @@ class Barracks(UnitIso):
         p_left_base = camera.world_to_iso_3d(left_base_x, left_base_y, roof_base_z, zoom)
         pg.draw.polygon(
             surface,
-            pg.Color(100, 100, 100),
+            (100, 100, 100),
             [
                 p_left_base,
                 p_ridge,
@@ -1420,7 +1432,7 @@ class Barracks(UnitIso):
         p_right_base = camera.world_to_iso_3d(right_base_x, right_base_y, roof_base_z, zoom)
         pg.draw.polygon(
             surface,
-            pg.Color(100, 100, 100),
+            (100, 100, 100),
             [
                 p_right_base,
                 p_ridge,
@@ -1439,7 +1451,7 @@ class Barracks(UnitIso):
         p_door_br = camera.world_to_iso_3d(*door_br, zoom)
         p_door_tl = camera.world_to_iso_3d(*door_tl, zoom)
         p_door_tr = camera.world_to_iso_3d(*door_tr, zoom)
-        pg.draw.polygon(surface, pg.Color(50, 50, 50), [p_door_bl, p_door_br, p_door_tr, p_door_tl])
+        pg.draw.polygon(surface, (50, 50, 50), [p_door_bl, p_door_br, p_door_tr, p_door_tl])
         for level in [base_z + h * 0.3, base_z + h * 0.6]:
             for off in [-w * 0.3, w * 0.3]:
                 win_x = pos.x + off * cos
@@ -1447,7 +1459,7 @@ class Barracks(UnitIso):
                 p_win = camera.world_to_iso_3d(win_x, win_y, level, zoom)
                 pg.draw.rect(
                     surface,
-                    pg.Color(150, 200, 255),
+                    (150, 200, 255),
                     (
                         int(p_win[0] - 3 * zoom),
                         int(p_win[1] - 2 * zoom),
@@ -1461,7 +1473,7 @@ class Barracks(UnitIso):
         flag_top_z = flag_base_z + h * 0.3
         p_flag_base = camera.world_to_iso_3d(flag_x, flag_y, flag_base_z, zoom)
         p_flag_top = camera.world_to_iso_3d(flag_x, flag_y, flag_top_z, zoom)
-        pg.draw.line(surface, pg.Color(100, 100, 100), p_flag_base, p_flag_top, int(2 * zoom))
+        pg.draw.line(surface, (100, 100, 100), p_flag_base, p_flag_top, int(2 * zoom))
         flag_end_x = flag_x + w * 0.2 * cos
         flag_end_y = flag_y + w * 0.2 * sin
         p_flag_end = camera.world_to_iso_3d(flag_end_x, flag_end_y, flag_top_z, zoom)
@@ -1492,7 +1504,7 @@ class WarFactory(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1527,9 +1539,9 @@ class WarFactory(UnitIso):
                 h=h * 0.3,
                 angle=self.body_angle,
                 base_z=attach_base[2],
-                team_color=pg.Color(90, 90, 90),
+                team_color=(90, 90, 90),
                 side_color=side_color,
-                roof_color=pg.Color(90, 90, 90),
+                roof_color=(90, 90, 90),
                 outline_color=outline_color,
                 zoom=zoom,
                 is_turret=False,
@@ -1542,8 +1554,8 @@ class WarFactory(UnitIso):
             p_stack_base = camera.world_to_iso_3d(*stack_base, zoom)
             p_stack_top = camera.world_to_iso_3d(*stack_top, zoom)
             radius = int(3 * zoom)
-            pg.draw.circle(surface, pg.Color(70, 70, 70), (int(p_stack_base[0]), int(p_stack_base[1])), radius)
-            pg.draw.circle(surface, pg.Color(60, 60, 60), (int(p_stack_top[0]), int(p_stack_top[1])), radius)
+            pg.draw.circle(surface, (70, 70, 70), (int(p_stack_base[0]), int(p_stack_base[1])), radius)
+            pg.draw.circle(surface, (60, 60, 60), (int(p_stack_top[0]), int(p_stack_top[1])), radius)
             pg.draw.line(surface, outline_color, p_stack_base, p_stack_top, int(2 * zoom))
         crane_z = base_z + main_h + h * 0.1
         crane_start_x = pos.x - main_w * 0.5 * cos
@@ -1552,7 +1564,7 @@ class WarFactory(UnitIso):
         crane_end_y = pos.y + main_w * 0.5 * sin
         p_crane_start = camera.world_to_iso_3d(crane_start_x, crane_start_y, crane_z, zoom)
         p_crane_end = camera.world_to_iso_3d(crane_end_x, crane_end_y, crane_z, zoom)
-        pg.draw.line(surface, pg.Color(100, 100, 100), p_crane_start, p_crane_end, int(5 * zoom))
+        pg.draw.line(surface, (100, 100, 100), p_crane_start, p_crane_end, int(5 * zoom))
         door_w = w * 0.6
         door_h = h * 0.4
         door_center_x = pos.x - d * 0.6 * cos
@@ -1565,7 +1577,7 @@ class WarFactory(UnitIso):
         p_door_br = camera.world_to_iso_3d(*door_br, zoom)
         p_door_tl = camera.world_to_iso_3d(*door_tl, zoom)
         p_door_tr = camera.world_to_iso_3d(*door_tr, zoom)
-        pg.draw.polygon(surface, pg.Color(40, 40, 40), [p_door_bl, p_door_br, p_door_tr, p_door_tl])
+        pg.draw.polygon(surface, (40, 40, 40), [p_door_bl, p_door_br, p_door_tr, p_door_tl])
         for level in [base_z + h * 0.2, base_z + h * 0.4]:
             for off in [-w * 0.4, 0, w * 0.4]:
                 win_x = pos.x + off * cos
@@ -1573,7 +1585,7 @@ class WarFactory(UnitIso):
                 p_win = camera.world_to_iso_3d(win_x, win_y, level, zoom)
                 pg.draw.rect(
                     surface,
-                    pg.Color(150, 200, 255),
+                    (150, 200, 255),
                     (
                         int(p_win[0] - 4 * zoom),
                         int(p_win[1] - 2 * zoom),
@@ -1607,7 +1619,7 @@ class Hangar(UnitIso):
         pos = self.position
         base_z = 0
         side_color = tuple(max(0, c - 50) for c in _team_color)
-        outline_color = pg.Color(0, 0, 0)
+        outline_color = (0, 0, 0)
         p_bottom = []
         cos = math.cos(self.body_angle)
         sin = math.sin(self.body_angle)
@@ -1637,7 +1649,7 @@ class Hangar(UnitIso):
             roof_side_y = pos.y + side * (hangar_w * 0.5) * sin
             p_roof_side = camera.world_to_iso_3d(roof_side_x, roof_side_y, roof_base_z + roof_h, zoom)
             p_base_side = camera.world_to_iso_3d(roof_side_x, roof_side_y, roof_base_z, zoom)
-            pg.draw.line(surface, pg.Color(120, 120, 120), p_base_side, p_roof_side, int(4 * zoom))
+            pg.draw.line(surface, (120, 120, 120), p_base_side, p_roof_side, int(4 * zoom))
         p_ridge_left = camera.world_to_iso_3d(
             pos.x - hangar_d * 0.2 * sin,
             pos.y + hangar_d * 0.2 * cos,
@@ -1650,7 +1662,7 @@ class Hangar(UnitIso):
             roof_base_z + roof_h * 1.2,
             zoom,
         )
-        pg.draw.line(surface, pg.Color(100, 100, 100), p_ridge_left, p_ridge_right, int(5 * zoom))
+        pg.draw.line(surface, (100, 100, 100), p_ridge_left, p_ridge_right, int(5 * zoom))
         door_w = hangar_w * 0.4
         door_h = h * 0.5
         door_center_x = pos.x - hangar_d * 0.5 * cos
@@ -1665,7 +1677,7 @@ class Hangar(UnitIso):
             p_d_br = camera.world_to_iso_3d(*d_br, zoom)
             p_d_tl = camera.world_to_iso_3d(*d_tl, zoom)
             p_d_tr = camera.world_to_iso_3d(*d_tr, zoom)
-            pg.draw.polygon(surface, pg.Color(60, 60, 60), [p_d_bl, p_d_br, p_d_tr, p_d_tl])
+            pg.draw.polygon(surface, (60, 60, 60), [p_d_bl, p_d_br, p_d_tr, p_d_tl])
         pillar_offsets = [
             (-w * 0.3, -d * 0.3),
             (w * 0.3, -d * 0.3),
@@ -1677,7 +1689,7 @@ class Hangar(UnitIso):
             pillar_y = pos.y + off_x * sin + off_y * cos
             p_pillar_base = camera.world_to_iso_3d(pillar_x, pillar_y, base_z, zoom)
             p_pillar_top = camera.world_to_iso_3d(pillar_x, pillar_y, base_z + hangar_h, zoom)
-            pg.draw.line(surface, pg.Color(80, 80, 80), p_pillar_base, p_pillar_top, int(3 * zoom))
+            pg.draw.line(surface, (80, 80, 80), p_pillar_base, p_pillar_top, int(3 * zoom))
         tower_x = pos.x + w * 0.7 * cos
         tower_y = pos.y + w * 0.7 * sin
         tower_base = (tower_x, tower_y, base_z)
@@ -1689,9 +1701,9 @@ class Hangar(UnitIso):
             h=h * 0.6,
             angle=self.body_angle,
             base_z=tower_base[2],
-            team_color=pg.Color(100, 80, 60),
+            team_color=(100, 80, 60),
             side_color=side_color,
-            roof_color=pg.Color(100, 80, 60),
+            roof_color=(100, 80, 60),
             outline_color=outline_color,
             zoom=zoom,
             is_turret=False,
@@ -1699,7 +1711,7 @@ class Hangar(UnitIso):
         apron_center = camera.world_to_iso_3d(pos.x, pos.y, base_z + hangar_h * 0.5, zoom)
         pg.draw.circle(
             surface,
-            pg.Color(255, 255, 255, 80),
+            (255, 255, 255, 80),
             (int(apron_center[0]), int(apron_center[1])),
             int(w * 0.8 * zoom),
             3,
@@ -2,49 +2,57 @@
 
 from __future__ import annotations
 
-import math
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from pygame.typing import IntPoint
+
     from modules.spatial_hash import SpatialHash2d, SpatialHashIso
     from modules.units import Unit2d, UnitIso
 
+_COLLISION_CELL_SIZE = 96
+"""Grid cell size for unit collisions; roughly twice the largest unit footprint."""
+
 
 # pyrefly: ignore [implicit-any-type-argument]
-def handle_unit_collisions(*, all_units: list, unit_hash: SpatialHash2d | SpatialHashIso) -> None:
+def handle_unit_collisions(*, all_units: list) -> None:
     """Resolves overlaps between ground units using simple repulsion.
 
+    Units are bucketed into a uniform grid so each unit is only tested against the units in its own and the eight
+    neighbouring cells.
+
     :param all_units: List of all units.
-    :param unit_hash: SpatialHash for nearby queries.
     """
-    for unit in all_units:
-        if unit.health <= 0 or unit.is_air:
-            continue
+    # Collision radius and rect are looked up once per unit per frame, not once per candidate pair.
+    # pyrefly: ignore [implicit-any-type-argument]
+    cells: defaultdict[IntPoint, list[tuple]] = defaultdict(list)
+    # Each pair is visited once, from the unit with the lower index.
+    ground_units = [u for u in all_units if u.health > 0 and not u.is_air]
+    entries = [(i, u, u.rect, max(u.rect.width, u.rect.height) / 2) for i, u in enumerate(ground_units)]
+    for entry in entries:
+        rect = entry[2]
+        cells[rect.x // _COLLISION_CELL_SIZE, rect.y // _COLLISION_CELL_SIZE].append(entry)
 
-        nearby = unit_hash.query(unit.position, max(unit.rect.width, unit.rect.height))
-        for other in nearby:
-            if other is unit or other.health <= 0 or other.is_air or id(other) <= id(unit):
-                continue
+    for i, unit, rect, r1 in entries:
+        cx = rect.x // _COLLISION_CELL_SIZE
+        cy = rect.y // _COLLISION_CELL_SIZE
+        for nx in (cx - 1, cx, cx + 1):
+            for ny in (cy - 1, cy, cy + 1):
+                for j, other, other_rect, r2 in cells.get((nx, ny), ()):
+                    if j <= i or not rect.colliderect(other_rect):
+                        continue
 
-            if unit.rect.colliderect(other.rect):
-                dx = other.position.x - unit.position.x
-                dy = other.position.y - unit.position.y
-                dist = math.hypot(dx, dy)
-                if dist > 0:
-                    r1 = max(unit.rect.width, unit.rect.height) / 2
-                    # pyrefly: ignore [missing-attribute]
-                    r2 = max(other.rect.width, other.rect.height) / 2
-                    overlap = max(0, r1 + r2 - dist)
-                    if overlap > 0:
-                        push = overlap * 0.5
-                        direction_x = dx / dist
-                        direction_y = dy / dist
-                        unit.position.x -= direction_x * push
-                        unit.position.y -= direction_y * push
-                        other.position.x += direction_x * push
-                        other.position.y += direction_y * push
+                    displacement = other.position - unit.position
+                    dist = displacement.length()
+                    if dist > 0:
+                        overlap = r1 + r2 - dist
+                        if overlap > 0:
+                            displacement.scale_to_length(overlap * 0.5)
+                            unit.position -= displacement
+                            other.position += displacement
 
 
 def handle_unit_building_collisions(
@@ -61,17 +69,14 @@ def handle_unit_building_collisions(
         for building in [b for b in nearby_builds if b.health > 0]:
             # pyrefly: ignore [missing-attribute]
             if unit.rect.colliderect(building.rect):
-                dx = building.position.x - unit.position.x
-                dy = building.position.y - unit.position.y
-                dist = math.hypot(dx, dy)
+                displacement = building.position - unit.position
+                dist = displacement.length()
                 if dist > 0:
                     # pyrefly: ignore [missing-attribute]
                     r1 = max(unit.rect.width, unit.rect.height) / 2
                     # pyrefly: ignore [missing-attribute]
                     r2 = max(building.rect.width, building.rect.height) / 2
-                    overlap = max(0, r1 + r2 - dist)
+                    overlap = r1 + r2 - dist
                     if overlap > 0:
-                        direction_x = dx / dist
-                        direction_y = dy / dist
-                        unit.position.x -= direction_x * overlap
-                        unit.position.y -= direction_y * overlap
+                        displacement.scale_to_length(overlap)
+                        unit.position -= displacement
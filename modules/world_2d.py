@@ -19,6 +19,24 @@ if TYPE_CHECKING:
     from modules.team import Team
     from modules.units import Unit2d
 
+BUILDING_RANGE = 200
+"""Max distance from a new building to the nearest friendly building."""
+BUILDING_MARGIN = 60
+"""Min gap kept between friendly buildings, as a passage for units."""
+
+
+def get_building_search_radius(*, new_building_cls: type, buildings: Iterable[Unit2d]) -> float:
+    """Radius around a proposed position beyond which no existing building affects `is_valid_building_position`.
+
+    :param new_building_cls: The class of the building to place.
+    :param buildings: Existing buildings.
+    :return: Search radius, for prefiltering buildings with default range and margin.
+    """
+    largest = max((max(building.size) for building in buildings), default=0)
+    reach = (max(get_unit_size(new_building_cls.__name__)) + largest) / 2
+    # Spacing and overlap checks only reach as far as the diagonal of the combined half sizes (plus margin)
+    return max(BUILDING_RANGE, reach * math.sqrt(2) + BUILDING_MARGIN)
+
 
 def is_valid_building_position(
     *,
@@ -28,8 +46,8 @@ def is_valid_building_position(
     buildings: Iterable[Unit2d],
     map_width: int = MAP_WIDTH_2D,
     map_height: int = MAP_HEIGHT_2D,
-    building_range: int = 200,
-    margin: int = 60,  # Passage margin for units
+    building_range: int = BUILDING_RANGE,
+    margin: int = BUILDING_MARGIN,
 ) -> bool:
     """Validates if a building can be placed at position: checks bounds, overlaps, proximity to friendly buildings.
 
@@ -50,22 +68,27 @@ def is_valid_building_position(
     ):
         return False
 
-    proposed_center = position
+    px, py = position
+    building_range_sq = building_range * building_range
     has_nearby_friendly = False
     for building in buildings:
-        if building.team == team and building.health > 0:
-            # Dynamic min_dist based on sizes + margin
+        if building.health <= 0:
+            continue
+
+        if building.team == team:
+            # Dynamic min_dist based on sizes + margin; compared squared to avoid a square root per building
             half_w_e, half_h_e = building.size[0] / 2, building.size[1] / 2
             min_dist = max(width / 2 + half_w_e, height / 2 + half_h_e) + margin
-            dist = math.hypot(proposed_center[0] - building.position.x, proposed_center[1] - building.position.y)
-            if dist < min_dist:
+            bx, by = building.position
+            dist_sq = (px - bx) ** 2 + (py - by) ** 2
+            if dist_sq < min_dist * min_dist:
                 return False
 
-            if dist <= building_range:
+            if dist_sq <= building_range_sq:
                 has_nearby_friendly = True
 
         # pyrefly: ignore [missing-attribute]
-        if building.health > 0 and building.rect.colliderect(temp_rect):
+        if building.rect.colliderect(temp_rect):
             return False
 
     return has_nearby_friendly or new_building_cls.__name__ == "Headquarters"
@@ -19,6 +19,18 @@ if TYPE_CHECKING:
     from modules.team import Team
     from modules.units import UnitIso
 
+BUILDING_RANGE = 200
+"""Max distance from a new building to the nearest friendly building."""
+BUILDING_MARGIN = 60
+"""Min gap kept between friendly buildings, as a passage for units."""
+
+
+def get_building_search_radius(*, new_building_cls: type, buildings: Iterable[UnitIso]) -> float:
+    largest = max((max(building.size) for building in buildings), default=0)
+    reach = (max(get_unit_size(new_building_cls.__name__)) + largest) / 2
+    # Spacing and overlap checks only reach as far as the diagonal of the combined half sizes (plus margin)
+    return max(BUILDING_RANGE, reach * math.sqrt(2) + BUILDING_MARGIN)
+
 
 def is_valid_building_position(
     *,
@@ -28,8 +40,8 @@ def is_valid_building_position(
     buildings: Iterable[UnitIso],
     map_width: int = MAP_WIDTH,
     map_height: int = MAP_HEIGHT,
-    building_range: int = 200,
-    margin: int = 60,
+    building_range: int = BUILDING_RANGE,
+    margin: int = BUILDING_MARGIN,
 ) -> bool:
     width, height = get_unit_size(new_building_cls.__name__)
     half_w_n, half_h_n = width / 2, height / 2
@@ -39,17 +51,19 @@ def is_valid_building_position(
     ):
         return False
 
-    proposed_center = position
+    px, py = position
+    building_range_sq = building_range * building_range
     has_nearby_friendly = False
     for building in buildings:
         if building.team == team and building.health > 0:
             half_w_e, half_h_e = building.size[0] / 2, building.size[1] / 2
             min_dist = max(half_w_n + half_w_e, half_h_n + half_h_e) + margin
-            dist = math.hypot(proposed_center[0] - building.position.x, proposed_center[1] - building.position.y)
-            if dist < min_dist:
+            dx, dy = px - building.position.x, py - building.position.y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < min_dist * min_dist:
                 return False
 
-            if dist <= building_range:
+            if dist_sq <= building_range_sq:
                 has_nearby_friendly = True
 
         # pyrefly: ignore [missing-attribute]
@@ -68,17 +82,17 @@ def find_free_spawn_position(
     map_width: int = MAP_WIDTH,
     map_height: int = MAP_HEIGHT,
 ) -> Point:
+    # Gathered once, so each attempt is a single C-level `collidelist` call
+    blocking_rects = [b.rect for b in global_buildings if b.health > 0]
+    blocking_rects += [u.rect for u in global_units if u.health > 0 and not u.is_air]
     for _ in range(20):
         offset_x = random.uniform(-60, 60)
         offset_y = random.uniform(-60, 60)
         pos_x = max(0, min(target_pos[0] + offset_x, map_width))
         pos_y = max(0, min(target_pos[1] + offset_y, map_height))
         unit_rect = pg.Rect(pos_x - unit_size[0] / 2, pos_y - unit_size[1] / 2, unit_size[0], unit_size[1])
-        # pyrefly: ignore [missing-attribute]
-        overlaps_building = any(b.rect.colliderect(unit_rect) for b in global_buildings if b.health > 0)
-        # pyrefly: ignore [missing-attribute]
-        overlaps_unit = any(u.rect.colliderect(unit_rect) for u in global_units if u.health > 0 and not u.is_air)
-        if not overlaps_building and not overlaps_unit:
+        # pyrefly: ignore [bad-specialization]
+        if unit_rect.collidelist(blocking_rects) == -1:
             return pos_x, pos_y
 
     return max(0, min(target_pos[0], map_width)), max(0, min(target_pos[1], map_height))